@@ -4,6 +4,7 @@
 """
 
 import sys
+import multiprocessing
 from pathlib import Path
 
 # 현재 디렉토리를 Python 경로에 추가
@@ -64,6 +65,8 @@ try:
         sys.exit(app.exec())
 
     if __name__ == "__main__":
+        # PyInstaller 실행 파일에서 바코드 병렬 생성용 작업 프로세스 지원
+        multiprocessing.freeze_support()
         main()
 
 except ImportError as e:
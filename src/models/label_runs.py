@@ -0,0 +1,96 @@
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# (상품명, 가격, 분류, 바코드) 라벨 항목 - None은 빈 칸
+LabelItem = Optional[Tuple[str, str, str, str]]
+
+
+class LabelRuns:
+    """같은 라벨이 연속되는 구간을 (라벨 항목, 개수)로 보관하는 라벨 목록
+
+    출력 개수만큼 항목을 펼치지 않으므로 메모리와 전처리 비용이 라벨 수가 아니라
+    구간(상품) 수에 비례한다. len()과 순회는 펼친 목록과 같게 동작하고, 순회는
+    필요할 때 항목을 하나씩 만들어 낸다.
+    """
+
+    def __init__(self, runs: Iterable[Tuple[LabelItem, int]] = ()):
+        self._runs: List[Tuple[LabelItem, int]] = []
+        # 각 구간의 시작 위치 (구간 단위 잘라내기용)
+        self._starts: List[int] = []
+        self._total = 0
+        for item, count in runs:
+            self.append(item, count)
+
+    def append(self, item: LabelItem, count: int = 1):
+        """라벨 count개 추가 (직전 구간과 같은 항목이면 구간을 늘림)"""
+        if count <= 0:
+            return
+        if self._runs and self._runs[-1][0] == item:
+            self._runs[-1] = (item, self._runs[-1][1] + count)
+        else:
+            self._runs.append((item, count))
+            self._starts.append(self._total)
+        self._total += count
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __iter__(self) -> Iterator[LabelItem]:
+        for item, count in self._runs:
+            for _ in range(count):
+                yield item
+
+    def runs(self) -> List[Tuple[LabelItem, int]]:
+        """(라벨 항목, 개수) 구간 목록"""
+        return list(self._runs)
+
+    def key(self) -> tuple:
+        """페이지 비교용 키 (구간 목록이 같으면 펼친 라벨도 같음)"""
+        return tuple(self._runs)
+
+    def distinct(self) -> List[LabelItem]:
+        """중복 없는 라벨 항목 목록 (처음 나온 순서, 빈 칸 제외)"""
+        seen = set()
+        items = []
+        for item, _ in self._runs:
+            if item is not None and item not in seen:
+                seen.add(item)
+                items.append(item)
+        return items
+
+    @property
+    def label_count(self) -> int:
+        """빈 칸을 뺀 실제 라벨 수"""
+        return sum(count for item, count in self._runs if item is not None)
+
+    def slice(self, start: int, stop: int) -> "LabelRuns":
+        """[start, stop) 범위를 구간 단위로 잘라 새 LabelRuns로 반환 (항목을 펼치지 않음)"""
+        start = max(0, start)
+        stop = min(self._total, stop)
+        result = LabelRuns()
+        if start >= stop:
+            return result
+        index = bisect_right(self._starts, start) - 1
+        position = start
+        while position < stop:
+            item, count = self._runs[index]
+            run_end = self._starts[index] + count
+            result.append(item, min(run_end, stop) - position)
+            position = run_end
+            index += 1
+        return result
+
+
+def as_label_runs(items) -> LabelRuns:
+    """라벨 목록(펼친 리스트 또는 LabelRuns)을 LabelRuns로 변환"""
+    if isinstance(items, LabelRuns):
+        return items
+    runs = LabelRuns()
+    for item in items:
+        runs.append(item)
+    return runs
+
+
+def distinct_labels(items) -> List[LabelItem]:
+    """라벨 목록의 중복 없는 항목 (LabelRuns면 구간 수만큼만 확인)"""
+    return as_label_runs(items).distinct()
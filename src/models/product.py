@@ -2,6 +2,11 @@ from dataclasses import dataclass
 
 from typing import Optional
 
+def barcode_number(type_id: int, product_id: int) -> str:
+    """TYPE_ID와 PRODUCT_ID로 바코드 번호 생성 (TYPE_ID + 6자리 PRODUCT_ID)"""
+    return f"{type_id}{str(product_id).zfill(6)}"
+
+
 @dataclass
 class Product:
     """상품 정보를 담는 데이터 클래스"""
@@ -0,0 +1,108 @@
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from src.services.log_service import logger
+
+
+class BarcodeImageCache:
+    """프로세스 전역 바코드 이미지 LRU 캐시 (총 바이트 크기 기준 제거)"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+        # 통계 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(
+        code: str,
+        writer_options: Dict,
+        renderer: str = "imagewriter",
+        target_size_mm: Optional[Tuple[float, float]] = None,
+    ) -> Tuple:
+        """캐시 키 생성: (코드, 렌더러, 그 렌더러가 실제 적용하는 옵션(DPI 포함), 목표 크기 mm)"""
+        options_key = tuple(sorted((k, repr(v)) for k, v in writer_options.items()))
+        size_key = None
+        if target_size_mm:
+            size_key = (round(target_size_mm[0], 2), round(target_size_mm[1], 2))
+        return (code, renderer, options_key, size_key)
+
+    def get(self, key: Hashable) -> Optional[BytesIO]:
+        """캐시에서 이미지 조회 (호출마다 새 BytesIO 반환)"""
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return BytesIO(data)
+
+    def get_first(self, keys: List[Hashable]) -> Optional[BytesIO]:
+        """여러 후보 키 중 처음 있는 항목 반환 (적중/미스는 한 번만 집계)"""
+        with self._lock:
+            for key in keys:
+                data = self._entries.get(key)
+                if data is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return BytesIO(data)
+            self.misses += 1
+        return None
+
+    def put(self, key: Hashable, data: bytes):
+        """이미지 바이트 저장 (최대 크기 초과 시 오래된 항목부터 제거)"""
+        size = len(data)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= len(old)
+
+            self._entries[key] = data
+            self._total_bytes += size
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        """캐시 비우기 (통계는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def log_stats(self, module: str = "BarcodeCache"):
+        """캐시 통계를 로그 서비스에 기록"""
+        stats = self.get_stats()
+        logger.info(
+            module,
+            f"바코드 캐시 - 적중: {stats['hits']}, 미스: {stats['misses']}, "
+            f"제거: {stats['evictions']}, 항목: {stats['entries']}개 "
+            f"({stats['bytes'] / 1024:.1f} KB / {self.max_bytes / 1024 / 1024:.0f} MB)",
+        )
+
+
+# 전역 바코드 이미지 캐시 인스턴스 (세션 내 모든 작업이 공유)
+barcode_cache = BarcodeImageCache()
@@ -1,24 +1,237 @@
 import os
+import shutil
 import sys
+import threading
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from barcode import Code128
 from barcode.writer import ImageWriter
 from typing import List, Tuple, Optional, Dict
 from io import BytesIO
 from PIL import Image
 from src.services.log_service import logger
+from src.services.barcode_cache import barcode_cache
+from src.services.barcode_store import BarcodeStore
+from src.services.glyph_atlas import glyph_atlas_cache
+from src.models.label_runs import distinct_labels
 from PIL import ImageDraw, ImageFont
 
+# 바코드 PNG 출력 형식 기본값
+# - image_mode: "1" (1비트 흑백), "P" (2색 팔레트, 1비트), "L" (회색조), "RGB"
+# - compress_level: zlib 압축 레벨 (0-9), optimize 패스는 사용하지 않음
+DEFAULT_OUTPUT_FORMAT = {
+    "image_mode": "1",
+    "compress_level": 6,
+}
+
+
+def get_output_format(options: Optional[Dict] = None) -> Dict:
+    """옵션에서 PNG 출력 형식 값만 추출 (없으면 기본값)"""
+    options = options or {}
+    output_format = dict(DEFAULT_OUTPUT_FORMAT)
+    if options.get("image_mode") in ("1", "P", "L", "RGB"):
+        output_format["image_mode"] = options["image_mode"]
+    if options.get("compress_level") is not None:
+        output_format["compress_level"] = max(0, min(9, int(options["compress_level"])))
+    return output_format
+
+
+def encode_barcode_png(img: Image.Image, output_format: Optional[Dict] = None) -> BytesIO:
+    """바코드 이미지를 PNG로 인코딩 (흑백 임계값 변환, 디더링 없음)"""
+    output_format = output_format or DEFAULT_OUTPUT_FORMAT
+    image_mode = output_format.get("image_mode", "1")
+    save_options = {
+        "format": "PNG",
+        "compress_level": output_format.get("compress_level", 6),
+        "optimize": False,
+    }
+
+    if image_mode in ("1", "P"):
+        # 안티앨리어싱된 텍스트 가장자리는 디더링 대신 임계값으로 흑/백 결정
+        gray = img.convert("L")
+        if image_mode == "1":
+            img = gray.point(lambda v: 255 if v >= 128 else 0, mode="1")
+        else:
+            indices = (np.asarray(gray) < 128).astype(np.uint8)
+            img = Image.frombytes("P", gray.size, indices.tobytes())
+            img.putpalette([255, 255, 255, 0, 0, 0])
+            save_options["bits"] = 1
+    elif img.mode != image_mode:
+        img = img.convert(image_mode)
+
+    img_buffer = BytesIO()
+    img.save(img_buffer, **save_options)
+    img_buffer.seek(0)
+    return img_buffer
+
+
+class RenderStrategyStats:
+    """바코드 렌더링 전략별 성공률/소요 시간 기록 및 실행 순서 결정 (프로세스 전역)"""
+
+    # 연속 실패가 이 횟수에 도달하고 성공 이력이 없으면 해당 전략을 생략
+    MAX_FAILURES_WITHOUT_SUCCESS = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self.last_success: Optional[str] = None
+        self._unavailable: Optional[Dict[str, str]] = None
+        # 실행 환경 식별 (플랫폼, PyInstaller 여부)
+        self.environment = f"{sys.platform}{'-frozen' if getattr(sys, 'frozen', False) else ''}"
+
+    def _probe_environment(self) -> Dict[str, str]:
+        """환경 점검: 필요한 폰트가 없어 반드시 실패할 전략 목록 {전략: 사유}"""
+        unavailable = {}
+        if not glyph_atlas_cache.has_truetype([ImageWriter().font_path]):
+            unavailable["default"] = "python-barcode 내장 TrueType 폰트 로드 불가"
+        if not glyph_atlas_cache.has_truetype():
+            unavailable["text_composite"] = "시스템 TrueType 폰트 없음"
+        for name, reason in unavailable.items():
+            logger.info(
+                "RenderStrategy", f"[{self.environment}] 전략 '{name}' 생략: {reason}"
+            )
+        return unavailable
+
+    def plan(self, order: List[str]) -> List[str]:
+        """실행할 전략 순서 반환 (최근 성공 전략 우선, 사용 불가/반복 실패 전략 제외)"""
+        with self._lock:
+            if self._unavailable is None:
+                self._unavailable = self._probe_environment()
+
+            planned = []
+            for name in order:
+                if name in self._unavailable:
+                    continue
+                stats = self._stats.get(name)
+                if (
+                    stats
+                    and stats["successes"] == 0
+                    and stats["attempts"] >= self.MAX_FAILURES_WITHOUT_SUCCESS
+                ):
+                    continue
+                planned.append(name)
+
+            if self.last_success in planned:
+                planned.remove(self.last_success)
+                planned.insert(0, self.last_success)
+
+            # 모든 전략이 제외된 경우 마지막 대체 전략은 항상 시도
+            return planned or order[-1:]
+
+    def record(self, name: str, success: bool, elapsed: float):
+        """전략 실행 결과 기록"""
+        with self._lock:
+            stats = self._stats.setdefault(
+                name, {"attempts": 0, "successes": 0, "total_ms": 0.0}
+            )
+            stats["attempts"] += 1
+            stats["total_ms"] += elapsed * 1000.0
+            if success:
+                stats["successes"] += 1
+                self.last_success = name
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """전략별 통계 반환 (성공률, 평균 소요 시간 포함)"""
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                attempts = stats["attempts"]
+                result[name] = {
+                    "attempts": attempts,
+                    "successes": stats["successes"],
+                    "success_rate": stats["successes"] / attempts if attempts else 0.0,
+                    "avg_ms": stats["total_ms"] / attempts if attempts else 0.0,
+                }
+            return result
+
+    def log_stats(self, module: str = "RenderStrategy"):
+        """전략별 통계를 로그 서비스에 기록"""
+        stats = self.get_stats()
+        if not stats:
+            return
+        summary = ", ".join(
+            f"{name} {s['successes']}/{s['attempts']} ({s['success_rate']:.0%}, {s['avg_ms']:.1f}ms)"
+            for name, s in stats.items()
+        )
+        logger.info(
+            module,
+            f"렌더링 전략 통계 [{self.environment}] 최근 성공: {self.last_success} - {summary}",
+        )
+
+
+# 전역 렌더링 전략 통계 인스턴스
+render_strategy_stats = RenderStrategyStats()
+
 
 class BarcodeGenerator:
     """GS1-128 바코드 생성 클래스 (메모리 기반) - MM 단위 통일"""
 
+    # 렌더링 전략 기본 순서 (render_strategy_stats가 환경에 맞게 재정렬)
+    _STRATEGY_ORDER = ["default", "text_composite", "no_text", "minimal", "text_image"]
+
+    # 전략별 ImageWriter 옵션 (writer_options와 무관한 고정값 - 캐시 키도 이 값 기준)
+    _STRATEGY_OPTIONS = {
+        "default": {
+            "dpi": 300,
+            "module_width": 0.35,
+            "module_height": 15.0,
+            "quiet_zone": 6.5,
+            "text_distance": 5.0,
+            "font_size": 10,
+            "write_text": True,
+        },
+        "text_composite": {
+            "dpi": 300,
+            "module_width": 0.35,
+            "module_height": 15.0,
+            "quiet_zone": 6.5,
+            "write_text": False,  # 텍스트는 PIL로 따로 합성
+        },
+        "no_text": {
+            "dpi": 200,
+            "module_width": 0.3,
+            "module_height": 12.0,
+            "quiet_zone": 5.0,
+            "write_text": False,
+        },
+        "minimal": {
+            "dpi": 150,
+            "write_text": False,
+        },
+    }
+
+    # 실제 바코드가 아닌 대체 이미지 전략 (일시적 실패가 세션 내내 남지 않도록 캐시하지 않음)
+    _UNCACHED_STRATEGIES = ("text_image",)
+
     def __init__(self, options: Optional[Dict] = None):
         if options is None:
             options = {}
 
+        # 원본 옵션 보관 (병렬 렌더링 시 작업 프로세스에 그대로 전달)
+        self.options = dict(options)
+
         # MM 단위로 입력받은 값들을 바코드 라이브러리에 맞게 변환
         self.writer_options = self._convert_mm_to_barcode_units(options)
 
+        # PNG 출력 형식 (기본: 1비트 흑백)
+        self.output_format = get_output_format(options)
+
+        # 프로세스 풀 병렬 렌더링 사용 여부 (기본 비활성, 작업자 수 미지정 시 CPU 코어 수)
+        self.parallel = bool(options.get("parallel", False))
+        self.parallel_workers = options.get("parallel_workers") or os.cpu_count() or 1
+
+        # NumPy 일괄 래스터라이저 사용 여부 (대량 일련번호 출력용, 기본 비활성)
+        self.batch_rasterize = bool(options.get("batch_rasterize", False))
+
+        # Word 셀에 배치될 목표 크기 (MM, 캐시 키에 포함)
+        self.target_size_mm = None
+        if options.get("target_width") and options.get("target_height"):
+            self.target_size_mm = (
+                float(options["target_width"]),
+                float(options["target_height"]),
+            )
+
     def _convert_mm_to_barcode_units(self, options: Dict) -> Dict:
         """MM 단위 입력값을 바코드 라이브러리 단위로 변환 (안전한 범위 내에서 적용)"""
         # 사용자 설정값 (MM 단위)
@@ -45,7 +258,11 @@ class BarcodeGenerator:
         }
 
     def generate_barcode_in_memory(self, code: str, category: str) -> BytesIO:
-        """바코드 이미지를 메모리에 생성 (파일 기반으로 변경)"""
+        """바코드 이미지를 메모리에 생성 (임시 파일 없이 PIL 이미지 → PNG 버퍼)"""
+        return self._render_png(code, category)[0]
+
+    def _render_png(self, code: str, category: str) -> Tuple[Optional[BytesIO], Optional[str]]:
+        """바코드 PNG 버퍼와 성공한 렌더링 전략 이름 반환 (실패 시 (None, None))"""
         try:
             # 바코드 데이터가 ASCII 문자만 포함하는지 확인
             try:
@@ -61,199 +278,98 @@ class BarcodeGenerator:
 
             if not code:
                 logger.error("BarcodeGenerator", "유효한 바코드 데이터가 없음")
-                return None
-
-            # 임시 파일 경로 생성
-            import tempfile
-
-            temp_dir = tempfile.gettempdir()
-            temp_filename = os.path.join(temp_dir, f"barcode_{code}_{os.getpid()}.png")
-
-            logger.debug("BarcodeGenerator", f"임시 바코드 파일 생성: {temp_filename}")
-
-            # 파일로 바코드 생성
-            success = self._generate_barcode_file(code, temp_filename)
-
-            if success and os.path.exists(temp_filename):
-                # 파일을 읽어서 메모리로 로드
-                try:
-                    with open(temp_filename, "rb") as f:
-                        img_data = f.read()
-
-                    # 임시 파일 삭제
-                    try:
-                        os.remove(temp_filename)
-                    except:
-                        pass  # 삭제 실패해도 무시
-
-                    # BytesIO로 변환
-                    img_buffer = BytesIO(img_data)
-                    img_buffer.seek(0)
-
-                    logger.debug(
-                        "BarcodeGenerator", f"바코드 생성 완료: {code} ({category})"
-                    )
-                    return img_buffer
-
-                except Exception as e:
-                    logger.error(
-                        "BarcodeGenerator", f"바코드 파일 읽기 실패: {code} - {e}"
-                    )
-                    # 임시 파일 정리
-                    try:
-                        os.remove(temp_filename)
-                    except:
-                        pass
-                    return None
-            else:
-                logger.error("BarcodeGenerator", f"바코드 파일 생성 실패: {code}")
-                return None
-
-        except Exception as e:
-            logger.error("BarcodeGenerator", f"바코드 생성 실패: {code} - {e}")
-            return None
-
-    def _generate_barcode_file(self, code: str, filename: str) -> bool:
-        """바코드를 파일로 생성 (여러 방법 시도)"""
+                return None, None
 
-        # 방법 2: 기본 옵션으로 시도 (폰트 문제 무시)
-        try:
-            logger.debug("BarcodeGenerator", f"기본 옵션으로 바코드 생성 시도: {code}")
-            writer = ImageWriter(format="PNG")
-            barcode = Code128(code, writer=writer)
-
-            basic_options = {
-                "dpi": 300,
-                "module_width": 0.35,
-                "module_height": 15.0,
-                "quiet_zone": 6.5,
-                "text_distance": 5.0,
-                "font_size": 10,
-                "write_text": True,
-            }
-
-            barcode.write(filename, basic_options)
-
-            if os.path.exists(filename) and os.path.getsize(filename) > 0:
-                logger.info(
-                    "BarcodeGenerator", f"기본 옵션으로 바코드 생성 성공: {code}"
-                )
-                return True
+            # 메모리에서 바코드 이미지 렌더링 (파일 I/O 없음)
+            barcode_img, strategy = self._render_barcode_image(code)
+            if barcode_img is None:
+                logger.error("BarcodeGenerator", f"바코드 이미지 생성 실패: {code}")
+                return None, None
 
-        except Exception as e:
-            logger.warning("BarcodeGenerator", f"기본 옵션 실패: {e}")
+            # PNG로 인코딩하여 BytesIO로 변환
+            img_buffer = encode_barcode_png(barcode_img, self.output_format)
 
-        # 방법 1: 바코드만 생성 후 PIL로 텍스트 추가 (가장 안정적)
-        try:
             logger.debug(
-                "BarcodeGenerator", f"바코드+텍스트 조합으로 생성 시도: {code}"
+                "BarcodeGenerator",
+                f"바코드 생성 완료: {code} ({category}) ({img_buffer.getbuffer().nbytes} bytes)",
             )
+            return img_buffer, strategy
 
-            # 먼저 텍스트 없는 바코드 생성
-            temp_barcode_file = filename.replace(".png", "_temp.png")
-            writer = ImageWriter(format="PNG")
-            barcode = Code128(code, writer=writer)
-
-            no_text_options = {
-                "dpi": 300,
-                "module_width": 0.35,
-                "module_height": 15.0,
-                "quiet_zone": 6.5,
-                "write_text": False,  # 텍스트 없이
-            }
-
-            barcode.write(temp_barcode_file, no_text_options)
-
-            if (
-                os.path.exists(temp_barcode_file)
-                and os.path.getsize(temp_barcode_file) > 0
-            ):
-                # PIL로 텍스트 추가 (바코드 길이에 맞춰 폰트 크기 조정)
-                success = self._add_text_to_barcode(temp_barcode_file, filename, code)
+        except Exception as e:
+            logger.error("BarcodeGenerator", f"바코드 생성 실패: {code} - {e}")
+            return None, None
 
-                # 임시 파일 삭제
-                try:
-                    os.remove(temp_barcode_file)
-                except:
-                    pass
+    def _render_code128(self, code: str, options: Dict) -> Optional[Image.Image]:
+        """Code128 바코드를 PIL 이미지로 렌더링 (파일 저장 없이)"""
+        writer = ImageWriter(format="PNG", mode="L")
+        barcode = Code128(code, writer=writer)
+        barcode_img = barcode.render(options)
 
-                if success:
-                    logger.info(
-                        "BarcodeGenerator", f"바코드+텍스트 조합으로 생성 성공: {code}"
-                    )
-                    return True
+        if barcode_img is None or barcode_img.size[0] <= 0 or barcode_img.size[1] <= 0:
+            return None
+        return barcode_img
 
-        except Exception as e:
-            logger.warning("BarcodeGenerator", f"바코드+텍스트 조합 실패: {e}")
+    def _render_barcode_image(self, code: str) -> Tuple[Optional[Image.Image], Optional[str]]:
+        """바코드를 메모리 이미지로 생성 (전략 파이프라인: 성공 이력 우선, 사용 불가 전략 생략)
 
-        # 방법 2: 텍스트 없이 시도
-        try:
-            logger.debug(
-                "BarcodeGenerator", f"텍스트 없는 옵션으로 바코드 생성 시도: {code}"
+        (이미지, 성공한 전략 이름)을 반환하고, 모두 실패하면 (None, None).
+        """
+        for name in render_strategy_stats.plan(self._STRATEGY_ORDER):
+            strategy = getattr(self, f"_strategy_{name}")
+            started = time.perf_counter()
+            try:
+                barcode_img = strategy(code)
+            except Exception as e:
+                logger.warning("BarcodeGenerator", f"렌더링 전략 '{name}' 실패: {e}")
+                barcode_img = None
+            render_strategy_stats.record(
+                name, barcode_img is not None, time.perf_counter() - started
             )
-            writer = ImageWriter(format="PNG")
-            barcode = Code128(code, writer=writer)
+            if barcode_img is not None:
+                return barcode_img, name
 
-            no_text_options = {
-                "dpi": 200,
-                "module_width": 0.3,
-                "module_height": 12.0,
-                "quiet_zone": 5.0,
-                "write_text": False,  # 텍스트 없이
-            }
+        return None, None
 
-            barcode.write(filename, no_text_options)
+    def _strategy_default(self, code: str) -> Optional[Image.Image]:
+        """전략: 기본 옵션 (python-barcode 내장 폰트로 텍스트 포함)"""
+        logger.debug("BarcodeGenerator", f"기본 옵션으로 바코드 생성 시도: {code}")
 
-            if os.path.exists(filename) and os.path.getsize(filename) > 0:
-                logger.info(
-                    "BarcodeGenerator", f"텍스트 없는 옵션으로 바코드 생성 성공: {code}"
-                )
-                return True
+        return self._render_code128(code, dict(self._STRATEGY_OPTIONS["default"]))
 
-        except Exception as e:
-            logger.warning("BarcodeGenerator", f"텍스트 없는 옵션 실패: {e}")
+    def _strategy_text_composite(self, code: str) -> Optional[Image.Image]:
+        """전략: 바코드만 생성 후 PIL로 텍스트 추가 (시스템 TrueType 폰트 사용)"""
+        logger.debug("BarcodeGenerator", f"바코드+텍스트 조합으로 생성 시도: {code}")
 
-        # 방법 3: 최소 옵션으로 시도
-        try:
-            logger.debug("BarcodeGenerator", f"최소 옵션으로 바코드 생성 시도: {code}")
-            writer = ImageWriter(format="PNG")
-            barcode = Code128(code, writer=writer)
+        # 먼저 텍스트 없는 바코드 생성
+        bars_img = self._render_code128(code, dict(self._STRATEGY_OPTIONS["text_composite"]))
+        if bars_img is None:
+            return None
 
-            minimal_options = {
-                "dpi": 150,
-                "write_text": False,
-            }
+        # PIL로 텍스트 추가 (바코드 길이에 맞춰 폰트 크기 조정)
+        return self._add_text_to_barcode(bars_img, code)
 
-            barcode.write(filename, minimal_options)
+    def _strategy_no_text(self, code: str) -> Optional[Image.Image]:
+        """전략: 텍스트 없이 생성"""
+        logger.debug("BarcodeGenerator", f"텍스트 없는 옵션으로 바코드 생성 시도: {code}")
 
-            if os.path.exists(filename) and os.path.getsize(filename) > 0:
-                logger.info(
-                    "BarcodeGenerator", f"최소 옵션으로 바코드 생성 성공: {code}"
-                )
-                return True
+        return self._render_code128(code, dict(self._STRATEGY_OPTIONS["no_text"]))
 
-        except Exception as e:
-            logger.warning("BarcodeGenerator", f"최소 옵션 실패: {e}")
+    def _strategy_minimal(self, code: str) -> Optional[Image.Image]:
+        """전략: 최소 옵션으로 생성"""
+        logger.debug("BarcodeGenerator", f"최소 옵션으로 바코드 생성 시도: {code}")
 
-        # 방법 4: PIL로 텍스트 이미지 생성
-        try:
-            logger.debug("BarcodeGenerator", f"텍스트 이미지로 대체 생성: {code}")
-            return self._create_text_image_file(code, filename)
+        return self._render_code128(code, dict(self._STRATEGY_OPTIONS["minimal"]))
 
-        except Exception as e:
-            logger.error("BarcodeGenerator", f"텍스트 이미지 생성 실패: {e}")
-
-        return False
+    def _strategy_text_image(self, code: str) -> Optional[Image.Image]:
+        """전략: 바코드 생성이 모두 실패한 경우 텍스트 이미지로 대체"""
+        logger.debug("BarcodeGenerator", f"텍스트 이미지로 대체 생성: {code}")
+        return self._draw_text_image(code)
 
     def _add_text_to_barcode(
-        self, barcode_file: str, output_file: str, code: str
-    ) -> bool:
+        self, barcode_img: Image.Image, code: str
+    ) -> Optional[Image.Image]:
         """바코드 이미지에 텍스트 추가 (동적 폰트 크기 조정)"""
         try:
-            from PIL import Image, ImageDraw, ImageFont
-
-            # 바코드 이미지 로드
-            barcode_img = Image.open(barcode_file)
             barcode_width, barcode_height = barcode_img.size
 
             logger.debug(
@@ -302,92 +418,33 @@ class BarcodeGenerator:
             total_height = barcode_height + text_height + margin
 
             # 새 이미지 생성 (바코드 + 텍스트 공간)
-            new_img = Image.new("RGB", (barcode_width, total_height), color="white")
+            new_img = Image.new("L", (barcode_width, total_height), color="white")
 
             # 바코드 이미지 붙여넣기
             new_img.paste(barcode_img, (0, 0))
 
-            # 텍스트 그리기
-            draw = ImageDraw.Draw(new_img)
+            # 폰트/크기별로 한 번만 만든 글리프 아틀라스 사용 (코드마다 폰트를 다시 열지 않음)
+            atlas = glyph_atlas_cache.get(font_size)
+            text_width, text_actual_height = atlas.measure(code)
 
-            # 폰트 로드 시도 (동적 크기 적용)
-            font = None
-            font_paths = [
-                "C:/Windows/Fonts/arial.ttf",
-                "C:/Windows/Fonts/calibri.ttf",
-                "arial.ttf",
-                "calibri.ttf",
-            ]
-
-            # 시스템 폰트로 시도
-            for font_path in font_paths:
-                try:
-                    font = ImageFont.truetype(font_path, font_size)
-                    logger.debug(
-                        "BarcodeGenerator",
-                        f"폰트 로드 성공: {font_path}, 크기: {font_size}",
-                    )
-                    break
-                except Exception as e:
-                    logger.debug(
-                        "BarcodeGenerator", f"폰트 로드 실패: {font_path} - {e}"
-                    )
-                    continue
+            logger.debug(
+                "BarcodeGenerator",
+                f"텍스트 크기 측정: {text_width}x{text_actual_height} ({atlas.font_name})",
+            )
 
-            # 시스템 폰트 실패 시 기본 폰트 사용
-            if font is None:
-                try:
-                    font = ImageFont.load_default()
-                    logger.debug("BarcodeGenerator", "기본 폰트 사용")
-                except:
-                    logger.warning("BarcodeGenerator", "모든 폰트 로드 실패")
-
-            # 텍스트 크기 측정 및 위치 계산
-            if font:
-                # 정확한 텍스트 크기 측정
-                bbox = draw.textbbox((0, 0), code, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_actual_height = bbox[3] - bbox[1]
+            # 텍스트가 바코드보다 넓은 경우 폰트 크기 조정
+            if text_width > barcode_width * 0.9:  # 바코드 너비의 90% 이내로 제한
+                scale_down = (barcode_width * 0.9) / text_width
+                new_font_size = max(8, int(font_size * scale_down))
 
                 logger.debug(
                     "BarcodeGenerator",
-                    f"텍스트 크기 측정: {text_width}x{text_actual_height}",
+                    f"폰트 크기 재조정: {font_size} → {new_font_size}",
                 )
 
-                # 텍스트가 바코드보다 넓은 경우 폰트 크기 조정
-                if text_width > barcode_width * 0.9:  # 바코드 너비의 90% 이내로 제한
-                    scale_down = (barcode_width * 0.9) / text_width
-                    new_font_size = max(8, int(font_size * scale_down))
-
-                    logger.debug(
-                        "BarcodeGenerator",
-                        f"폰트 크기 재조정: {font_size} → {new_font_size}",
-                    )
-
-                    # 폰트 다시 로드
-                    for font_path in font_paths:
-                        try:
-                            font = ImageFont.truetype(font_path, new_font_size)
-                            break
-                        except:
-                            continue
-
-                    if font is None:
-                        font = ImageFont.load_default()
-
-                    # 텍스트 크기 재측정
-                    bbox = draw.textbbox((0, 0), code, font=font)
-                    text_width = bbox[2] - bbox[0]
-                    text_actual_height = bbox[3] - bbox[1]
-
-            else:
-                # 폰트가 없는 경우 대략적인 계산
-                text_width = len(code) * (font_size * 0.6)
-                text_actual_height = font_size
-                logger.debug(
-                    "BarcodeGenerator",
-                    f"폰트 없음 - 추정 텍스트 크기: {text_width}x{text_actual_height}",
-                )
+                font_size = new_font_size
+                atlas = glyph_atlas_cache.get(font_size)
+                text_width, text_actual_height = atlas.measure(code)
 
             # 텍스트 위치 계산 (중앙 정렬)
             text_x = max(0, (barcode_width - text_width) // 2)
@@ -395,153 +452,417 @@ class BarcodeGenerator:
 
             logger.debug("BarcodeGenerator", f"텍스트 위치: ({text_x}, {text_y})")
 
-            # 텍스트 그리기
-            draw.text((text_x, text_y), code, fill="black", font=font)
+            # 캐시된 글리프 비트맵을 붙여 넣어 텍스트 합성
+            atlas.draw(new_img, (text_x, text_y), code, fill=0)
 
-            # 파일 저장
-            new_img.save(output_file, format="PNG")
-
-            if os.path.exists(output_file) and os.path.getsize(output_file) > 0:
-                logger.info(
-                    "BarcodeGenerator",
-                    f"바코드에 텍스트 추가 완료: {code} (폰트크기: {font_size if 'new_font_size' not in locals() else new_font_size})",
-                )
-                return True
-            else:
-                logger.error(
-                    "BarcodeGenerator", f"바코드+텍스트 파일 저장 실패: {output_file}"
-                )
-                return False
+            logger.info(
+                "BarcodeGenerator",
+                f"바코드에 텍스트 추가 완료: {code} (폰트크기: {font_size})",
+            )
+            return new_img
 
         except Exception as e:
             logger.error("BarcodeGenerator", f"바코드에 텍스트 추가 실패: {code} - {e}")
             import traceback
 
             logger.error("BarcodeGenerator", f"상세 오류: {traceback.format_exc()}")
-            return False
+            return None
+
+    def _draw_text_image(self, code: str) -> Image.Image:
+        """바코드 생성 실패 시 대체용 텍스트 이미지 그리기"""
+        # 이미지 크기 계산
+        width = max(200, len(code) * 12)
+        height = 60
 
-    def _create_text_image_file(self, code: str, filename: str) -> bool:
-        """바코드 생성 실패 시 텍스트 이미지 파일로 대체"""
+        # 이미지 생성
+        img = Image.new("L", (width, height), color="white")
+        draw = ImageDraw.Draw(img)
+
+        # 기본 폰트 사용 (시스템 폰트 문제 회피)
         try:
-            from PIL import Image, ImageDraw, ImageFont
+            font = ImageFont.load_default()
+        except:
+            font = None
+
+        # 텍스트 그리기
+        text_x = 10
+        text_y = 20
+        draw.text((text_x, text_y), code, fill="black", font=font)
+
+        # 간단한 바코드 모양 선 그리기
+        bar_y = 5
+        bar_height = 15
+        bar_x = 10
+
+        for i, char in enumerate(code):
+            if i % 2 == 0:  # 짝수 위치에 선 그리기
+                draw.rectangle(
+                    [bar_x + i * 8, bar_y, bar_x + i * 8 + 2, bar_y + bar_height],
+                    fill="black",
+                )
 
-            # 이미지 크기 계산
-            width = max(200, len(code) * 12)
-            height = 60
+        logger.info("BarcodeGenerator", f"텍스트 이미지 생성 완료: {code}")
+        return img
 
-            # 이미지 생성
-            img = Image.new("RGB", (width, height), color="white")
-            draw = ImageDraw.Draw(img)
+    def _strategy_cache_key(self, code: str, strategy: str) -> Tuple:
+        """ImageWriter 전략 결과의 캐시 키 (그 전략이 실제로 쓰는 옵션 기준)"""
+        return barcode_cache.make_key(
+            code,
+            dict(self._STRATEGY_OPTIONS[strategy], **self.output_format),
+            f"imagewriter:{strategy}",
+        )
 
-            # 기본 폰트 사용 (시스템 폰트 문제 회피)
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = None
-
-            # 텍스트 그리기
-            text_x = 10
-            text_y = 20
-            draw.text((text_x, text_y), code, fill="black", font=font)
-
-            # 간단한 바코드 모양 선 그리기
-            bar_y = 5
-            bar_height = 15
-            bar_x = 10
-
-            for i, char in enumerate(code):
-                if i % 2 == 0:  # 짝수 위치에 선 그리기
-                    draw.rectangle(
-                        [bar_x + i * 8, bar_y, bar_x + i * 8 + 2, bar_y + bar_height],
-                        fill="black",
-                    )
-
-            # 파일로 저장
-            img.save(filename, format="PNG")
-
-            if os.path.exists(filename) and os.path.getsize(filename) > 0:
-                logger.info("BarcodeGenerator", f"텍스트 이미지 파일 생성 완료: {code}")
-                return True
-            else:
-                logger.error(
-                    "BarcodeGenerator", f"텍스트 이미지 파일 생성 실패: {filename}"
+    def generate_barcodes_for_products(
+        self, products: List[Tuple[str, str, str, str]]
+    ) -> dict:
+        """상품 목록에 대한 바코드 생성 (메모리에 저장, 전역 캐시 우선 사용)"""
+        # 같은 라벨 반복은 한 번만 확인 (LabelRuns면 펼치지 않음)
+        products = distinct_labels(products)
+        barcode_images = {}
+        use_rasterizer = self.batch_rasterize or self.target_size_mm is not None
+        # 목표 크기가 있으면 래스터라이저로 셀 크기에 정확히 맞춰 렌더링
+        renderer = "numpy-fit" if self.target_size_mm is not None else "numpy"
+
+        # 래스터라이저는 설정한 모듈 너비를 상한으로 사용 (ImageWriter 경로는 0.35mm 고정)
+        rasterizer_options = dict(self.writer_options)
+        if self.target_size_mm is not None:
+            rasterizer_options["module_width"] = float(self.options.get("module_width", 0.35))
+            rasterizer_options["target_width"] = self.target_size_mm[0]
+            rasterizer_options["target_height"] = self.target_size_mm[1]
+        rasterizer_key_options = dict(rasterizer_options, **self.output_format)
+
+        # 캐시 조회: 래스터라이저 대상 코드는 래스터라이저 결과만, 나머지는 실행 순서대로
+        # 각 ImageWriter 전략 결과 (캐시 상태에 따라 렌더러가 바뀌지 않도록)
+        strategies = [
+            name
+            for name in render_strategy_stats.plan(self._STRATEGY_ORDER)
+            if name not in self._UNCACHED_STRATEGIES
+        ]
+        raster_keys = {}
+        for _, _, _, code in products:
+            if code in barcode_images or code in raster_keys:
+                continue
+            if use_rasterizer and code and code.isascii():
+                raster_keys[code] = barcode_cache.make_key(
+                    code, rasterizer_key_options, renderer, self.target_size_mm
                 )
-                return False
+                keys = [raster_keys[code]]
+            else:
+                keys = [self._strategy_cache_key(code, name) for name in strategies]
+            cached = barcode_cache.get_first(keys)
+            if cached is not None:
+                barcode_images[code] = cached
+
+        rendered = {}
+        if use_rasterizer:
+            # ASCII 코드는 NumPy 래스터라이저로 한 번에 생성 (목표 크기 지정 시 해당 크기로)
+            unique_codes = [code for code in raster_keys if code not in barcode_images]
+            if unique_codes:
+                rasterizer = BarcodeRasterizer(rasterizer_options, self.output_format)
+                for code, img_buffer in rasterizer.rasterize(unique_codes).items():
+                    barcode_cache.put(raster_keys[code], img_buffer.getvalue())
+                    rendered[code] = img_buffer
+
+        # 래스터라이저를 쓰지 않았거나 실패한 코드는 개별 생성 경로 사용
+        pending = []
+        pending_codes = set()
+        for name, price, category, code in products:
+            if (
+                code not in barcode_images
+                and code not in rendered
+                and code not in pending_codes
+            ):
+                pending.append((code, category))
+                pending_codes.add(code)
+
+        results = None
+        if self.parallel and len(pending) > 1:
+            results = self._render_codes_parallel(pending)
+        if results is None:
+            results = []
+            for code, category in pending:
+                img_buffer, strategy = self._render_png(code, category)
+                results.append((img_buffer.getvalue() if img_buffer else None, strategy))
+            if pending:
+                render_strategy_stats.log_stats("BarcodeGenerator")
+
+        for (code, _), (data, strategy) in zip(pending, results):
+            if not data:
+                continue
+            # 대체 이미지(text_image)는 이번 작업에만 사용
+            if strategy in self._STRATEGY_OPTIONS:
+                barcode_cache.put(self._strategy_cache_key(code, strategy), data)
+            rendered[code] = BytesIO(data)
+
+        barcode_images.update(rendered)
+        barcode_cache.log_stats("BarcodeGenerator")
+        return barcode_images
 
+    def _render_codes_parallel(
+        self, tasks: List[Tuple[str, str]]
+    ) -> Optional[List[Tuple[Optional[bytes], Optional[str]]]]:
+        """프로세스 풀로 바코드 렌더링 (입력 순서대로 (PNG 바이트, 전략) 반환, 실패 시 None)"""
+        workers = max(1, min(int(self.parallel_workers), len(tasks)))
+        child_options = dict(self.options, parallel=False)
+        jobs = [(child_options, code, category) for code, category in tasks]
+        # 작업 묶음 크기: 프로세스 간 전송 횟수를 줄이되 부하가 고르게 분산되도록
+        chunksize = max(1, len(jobs) // (workers * 4))
+
+        try:
+            logger.info(
+                "BarcodeGenerator",
+                f"병렬 바코드 생성 시작: {len(jobs)}개, 작업 프로세스 {workers}개",
+            )
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(_render_barcode_worker, jobs, chunksize=chunksize)
+                )
+            logger.info("BarcodeGenerator", f"병렬 바코드 생성 완료: {len(results)}개")
+            return results
         except Exception as e:
-            logger.error(
-                "BarcodeGenerator", f"텍스트 이미지 파일 생성 실패: {code} - {e}"
+            # pickle 실패, 프로세스 생성 실패(PyInstaller 환경 등) → 직렬 처리로 전환
+            logger.warning(
+                "BarcodeGenerator", f"병렬 바코드 생성 실패, 직렬 모드로 전환: {e}"
             )
-            return False
+            return None
+
+
+def _render_barcode_worker(job: Tuple[Dict, str, str]) -> Tuple[Optional[bytes], Optional[str]]:
+    """프로세스 풀 작업 함수 (pickle 가능하도록 모듈 최상위에 정의)"""
+    options, code, category = job
+    img_buffer, strategy = BarcodeGenerator(options)._render_png(code, category)
+    return (img_buffer.getvalue() if img_buffer else None), strategy
 
-    def _create_text_image(self, code: str) -> BytesIO:
-        """바코드 생성 실패 시 텍스트 이미지로 대체"""
-        try:
-            # 간단한 텍스트 이미지 생성
-            from PIL import Image, ImageDraw, ImageFont
 
-            # 이미지 크기 계산
-            width = max(200, len(code) * 12)
-            height = 60
+class BarcodeRasterizer:
+    """NumPy 배열 연산 기반 Code128 일괄 래스터라이저 (막대별 그리기 호출 없음)"""
 
-            # 이미지 생성
-            img = Image.new("RGB", (width, height), color="white")
-            draw = ImageDraw.Draw(img)
+    # Code128 규격 최소 좌우 여백 (모듈 수)
+    MIN_QUIET_MODULES = 10
+    # 일반 레이저/감열 프린터와 스캐너로 읽을 수 있는 최소 모듈 너비 (5mil)
+    MIN_X_DIMENSION_MM = 0.127
+    # 정수 픽셀로 맞추면서 모듈 너비가 이 비율 이상 줄어들면 경고
+    MAX_MODULE_LOSS = 0.1
+
+    def __init__(
+        self, options: Optional[Dict] = None, output_format: Optional[Dict] = None
+    ):
+        if options is None:
+            options = {}
+
+        self.output_format = output_format or get_output_format(options)
+
+        # 모든 크기 값은 MM 단위 (BarcodeGenerator.writer_options와 동일한 키)
+        self.dpi = int(options.get("dpi", 300))
+        self.module_width = float(options.get("module_width", 0.35))
+        self.module_height = float(options.get("module_height", 15.0))
+        self.quiet_zone = float(options.get("quiet_zone", 6.5))
+        self.text_distance = float(options.get("text_distance", 5.0))
+        self.font_size = int(options.get("font_size", 10))
+        self.write_text = bool(options.get("write_text", True))
+
+        # 목표 출력 크기 (MM) - 지정 시 이미지 크기를 DPI 기준 정확한 픽셀 수로 맞춤
+        self.target_size_mm = None
+        if options.get("target_width") and options.get("target_height"):
+            self.target_size_mm = (
+                float(options["target_width"]),
+                float(options["target_height"]),
+            )
 
-            # 기본 폰트 사용 (시스템 폰트 문제 회피)
+    def _mm_to_px(self, mm: float) -> int:
+        """MM를 장치 픽셀 수로 변환 (최소 1픽셀)"""
+        return max(1, int(round(mm * self.dpi / 25.4)))
+
+    def _fit_module(self, module_count: int) -> Tuple[float, int]:
+        """목표 너비에 맞는 (원하는 모듈 너비 MM, 모듈 픽셀 수) - 프린터 DPI 기준 정수 픽셀
+
+        좌우 최소 여백(10모듈)을 포함한 전체 모듈 수로 목표 픽셀 너비를 나눈 몫을
+        모듈 픽셀 수로 쓰되 설정한 module_width보다 넓게 하지는 않는다. 이미지는
+        셀 크기 그대로 배치되므로 장치 픽셀과 1:1로 맞아 재샘플링되지 않는다.
+        """
+        target_px = self._mm_to_px(self.target_size_mm[0])
+        fit_px = target_px // (module_count + self.MIN_QUIET_MODULES * 2)
+        module_px = max(1, min(fit_px, self._mm_to_px(self.module_width)))
+        module_mm = min(
+            self.module_width,
+            self.target_size_mm[0] / (module_count + self.MIN_QUIET_MODULES * 2),
+        )
+        return module_mm, module_px
+
+    def _get_atlas(self, font_px: int):
+        """텍스트용 글리프 아틀라스 (python-barcode ImageWriter와 같은 내장 폰트)"""
+        return glyph_atlas_cache.get(font_px, [ImageWriter().font_path])
+
+    def encode_modules(self, codes: List[str]) -> Dict[str, str]:
+        """코드별 Code128 모듈 비트 패턴('1'=막대, '0'=공백) 생성"""
+        patterns = {}
+        for code in codes:
             try:
-                font = ImageFont.load_default()
-            except:
-                font = None
-
-            # 텍스트 그리기
-            text_x = 10
-            text_y = 20
-            draw.text((text_x, text_y), code, fill="black", font=font)
-
-            # 간단한 바코드 모양 선 그리기
-            bar_y = 5
-            bar_height = 15
-            bar_x = 10
-
-            for i, char in enumerate(code):
-                if i % 2 == 0:  # 짝수 위치에 선 그리기
-                    draw.rectangle(
-                        [bar_x + i * 8, bar_y, bar_x + i * 8 + 2, bar_y + bar_height],
-                        fill="black",
-                    )
-
-            # BytesIO로 변환
-            img_buffer = BytesIO()
-            img.save(img_buffer, format="PNG")
-            img_buffer.seek(0)
-
-            logger.info("BarcodeGenerator", f"텍스트 이미지 생성 완료: {code}")
-            return img_buffer
+                patterns[code] = Code128(code).build()[0]
+            except Exception as e:
+                logger.warning("BarcodeRasterizer", f"모듈 인코딩 실패: {code} - {e}")
+        return patterns
+
+    def _layout(self, module_count: int) -> Dict[str, int]:
+        """모듈 수에 따른 픽셀 배치 계산 (모듈 너비는 항상 정수 픽셀)"""
+        pt_font_px = max(8, int(round(self.font_size * self.dpi / 72.0)))
+
+        if self.target_size_mm is None:
+            # 옵션의 MM 값을 그대로 픽셀로 변환 (이미지 크기는 내용에 따라 결정)
+            quiet_px = self._mm_to_px(self.quiet_zone)
+            layout = {
+                "module_px": self._mm_to_px(self.module_width),
+                "left_px": quiet_px,
+                "right_px": quiet_px,
+                "margin_px": self._mm_to_px(1.0),  # ImageWriter 기본 상하 여백 1mm
+                "bar_height_px": self._mm_to_px(self.module_height),
+                "text_gap_px": 0,
+                "text_height_px": 0,
+                "font_px": pt_font_px,
+            }
+            if self.write_text:
+                layout["text_gap_px"] = self._mm_to_px(self.text_distance) // 2
+                layout["text_height_px"] = self._mm_to_px(
+                    self.text_distance
+                ) + self._mm_to_px(self.font_size * 25.4 / 72.0)
+            return layout
+
+        # 목표 크기 모드: 프린터 DPI 기준 픽셀 크기와 정확히 일치하도록 배치 (DPI를 올리지 않음)
+        module_mm, module_px = self._fit_module(module_count)
+        x_dimension_mm = module_px * 25.4 / self.dpi
+        if module_mm < self.module_width:
+            logger.warning(
+                "BarcodeRasterizer",
+                f"셀 너비에 맞추기 위해 모듈 너비 축소: {self.module_width:.3f}mm → "
+                f"{x_dimension_mm:.3f}mm ({module_count}모듈, {module_px}px)",
+            )
+        if x_dimension_mm < module_mm * (1 - self.MAX_MODULE_LOSS):
+            logger.warning(
+                "BarcodeRasterizer",
+                f"{self.dpi}DPI 정수 픽셀로 맞추면서 모듈 너비가 {module_mm:.3f}mm → "
+                f"{x_dimension_mm:.3f}mm로 {self.MAX_MODULE_LOSS:.0%} 넘게 줄었습니다",
+            )
+        if x_dimension_mm < self.MIN_X_DIMENSION_MM:
+            logger.warning(
+                "BarcodeRasterizer",
+                f"모듈 너비 {x_dimension_mm:.3f}mm가 최소값 {self.MIN_X_DIMENSION_MM}mm보다 작아 "
+                f"스캔되지 않을 수 있습니다 (더 넓은 라벨 템플릿 사용 권장)",
+            )
 
-        except Exception as e:
-            logger.error("BarcodeGenerator", f"텍스트 이미지 생성 실패: {code} - {e}")
-            return None
+        width_px = self._mm_to_px(self.target_size_mm[0])
+        height_px = self._mm_to_px(self.target_size_mm[1])
+        bars_px = module_px * module_count
+        if bars_px + module_px * self.MIN_QUIET_MODULES * 2 > width_px:
+            logger.warning(
+                "BarcodeRasterizer",
+                f"목표 너비 {width_px}px가 바코드({module_count}모듈)보다 작아 확장됨",
+            )
+            width_px = bars_px + module_px * self.MIN_QUIET_MODULES * 2
+        # 남는 픽셀은 좌우 여백으로 분배 (막대는 절대 늘리거나 줄이지 않음)
+        left_px = (width_px - bars_px) // 2
+
+        margin_px = max(1, height_px // 40)
+        text_height_px = 0
+        text_gap_px = 0
+        font_px = pt_font_px
+        if self.write_text:
+            text_height_px = int(height_px * 0.28)
+            text_gap_px = max(1, text_height_px // 8)
+            font_px = max(6, min(pt_font_px, text_height_px - text_gap_px))
+
+        return {
+            "module_px": module_px,
+            "left_px": left_px,
+            "right_px": width_px - bars_px - left_px,
+            "margin_px": margin_px,
+            "bar_height_px": max(1, height_px - margin_px * 2 - text_height_px),
+            "text_gap_px": text_gap_px,
+            "text_height_px": text_height_px,
+            "font_px": font_px,
+        }
+
+    def rasterize(self, codes: List[str]) -> Dict[str, BytesIO]:
+        """코드 목록을 한 번에 래스터화하여 {코드: PNG BytesIO} 반환"""
+        patterns = self.encode_modules(codes)
+
+        # 모듈 수가 같은 코드끼리 묶어 2차원 배열로 한 번에 처리
+        groups: Dict[int, List[str]] = {}
+        for code, pattern in patterns.items():
+            groups.setdefault(len(pattern), []).append(code)
 
-    def generate_barcodes_for_products(
-        self, products: List[Tuple[str, str, str, str]]
-    ) -> dict:
-        """상품 목록에 대한 바코드 생성 (메모리에 저장)"""
         barcode_images = {}
+        total_bytes = 0
+        module_sizes = set()
+        for module_count, group_codes in groups.items():
+            layout = self._layout(module_count)
+            module_sizes.add(layout["module_px"])
+
+            bits = np.frombuffer(
+                "".join(patterns[c] for c in group_codes).encode("ascii"),
+                dtype=np.uint8,
+            ).reshape(len(group_codes), module_count)
+
+            # 막대=0(검정), 공백=255(흰색) → 모듈 너비만큼 반복 → 좌우 여백 추가
+            rows = np.where(bits == ord("1"), 0, 255).astype(np.uint8)
+            rows = np.repeat(rows, layout["module_px"], axis=1)
+            rows = np.pad(
+                rows,
+                ((0, 0), (layout["left_px"], layout["right_px"])),
+                constant_values=255,
+            )
 
-        for name, price, category, code in products:
-            if code not in barcode_images:
-                img_buffer = self.generate_barcode_in_memory(code, category)
-                if img_buffer:
+            for code, row in zip(group_codes, rows):
+                try:
+                    barcode_img = self._compose(code, row, layout)
+                    img_buffer = encode_barcode_png(barcode_img, self.output_format)
+                    total_bytes += img_buffer.getbuffer().nbytes
                     barcode_images[code] = img_buffer
-
+                except Exception as e:
+                    logger.warning("BarcodeRasterizer", f"래스터화 실패: {code} - {e}")
+
+        logger.info(
+            "BarcodeRasterizer",
+            f"일괄 래스터화 완료: {len(barcode_images)}/{len(codes)}개 "
+            f"({', '.join(str(m) for m in sorted(module_sizes))}px/모듈, "
+            f"이미지당 평균 {total_bytes // max(1, len(barcode_images))} bytes)",
+        )
         return barcode_images
 
+    def _compose(self, code: str, row: np.ndarray, layout: Dict[str, int]) -> Image.Image:
+        """한 줄 막대 패턴을 막대 높이로 브로드캐스트하고 필요 시 텍스트 추가"""
+        width = row.shape[0]
+        margin_px = layout["margin_px"]
+        bar_height_px = layout["bar_height_px"]
+
+        canvas = np.full(
+            (margin_px * 2 + bar_height_px + layout["text_height_px"], width),
+            255,
+            dtype=np.uint8,
+        )
+        canvas[margin_px : margin_px + bar_height_px] = np.broadcast_to(
+            row, (bar_height_px, width)
+        )
+        barcode_img = Image.fromarray(canvas)
+
+        if self.write_text:
+            atlas = self._get_atlas(layout["font_px"])
+            # 텍스트가 이미지 너비를 넘으면 폰트를 줄임
+            text_width, _ = atlas.measure(code)
+            if text_width > width * 0.95 and layout["font_px"] > 6:
+                atlas = self._get_atlas(
+                    max(6, int(layout["font_px"] * width * 0.95 / text_width))
+                )
+                text_width, _ = atlas.measure(code)
+            text_y = margin_px + bar_height_px + layout["text_gap_px"]
+            atlas.draw(barcode_img, ((width - text_width) / 2, text_y), code, fill=0)
+
+        return barcode_img
+
 
 class BarcodeFileGenerator:
     """바코드 이미지 파일 생성 클래스"""
 
-    def __init__(self, output_dir: str = "barcodes"):
+    def __init__(self, output_dir: str = "barcodes", output_format: Optional[Dict] = None):
         self.output_dir = self._get_output_path(output_dir)
         self._ensure_output_dir()
 
@@ -555,6 +876,12 @@ class BarcodeFileGenerator:
             "font_size": 10,
         }
 
+        # PNG 출력 형식 (기본: 1비트 흑백)
+        self.output_format = output_format or get_output_format()
+
+        # 코드+옵션 해시 기반 영구 저장소 (개별 PNG 파일 대신 단일 blob 파일)
+        self.store = BarcodeStore(self.output_dir)
+
     def _get_output_path(self, path: str) -> str:
         """실행 파일(exe) 또는 스크립트 위치에 따른 경로 반환"""
         if getattr(sys, "frozen", False):
@@ -575,19 +902,9 @@ class BarcodeFileGenerator:
         if not os.path.exists(self.output_dir):
             os.makedirs(self.output_dir)
 
-    def generate_barcode(self, code: str, category: str) -> Optional[str]:
-        """바코드 이미지 파일 생성"""
-        filename = os.path.join(self.output_dir, f"{code}.png")
-        logger.debug("BarcodeFileGenerator", f"바코드 파일 생성 시도: {filename}")
-
-        if os.path.exists(filename):
-            logger.debug(
-                "BarcodeFileGenerator", f"바코드 파일이 이미 존재함: {filename}"
-            )
-            return filename
-
+    def generate_barcode_data(self, code: str, category: str) -> Optional[bytes]:
+        """바코드 PNG 바이트 생성 (저장소에 있으면 렌더링 생략)"""
         try:
-            logger.debug("BarcodeFileGenerator", "바코드 라이브러리 임포트 확인...")
             # 바코드 데이터 검증
             if not code or not isinstance(code, str):
                 logger.error("BarcodeFileGenerator", f"잘못된 바코드 데이터: {code}")
@@ -607,30 +924,34 @@ class BarcodeFileGenerator:
                 logger.error("BarcodeFileGenerator", "유효한 바코드 데이터가 없음")
                 return None
 
+            # 코드와 현재 writer 옵션 전체로 키 생성 (옵션 변경 시 재생성)
+            key = BarcodeStore.make_key(
+                code, dict(self.writer_options, **self.output_format)
+            )
+            data = self.store.get(key)
+            if data is not None:
+                logger.debug("BarcodeFileGenerator", f"저장소에서 바코드 사용: {code}")
+                return data
+
             logger.debug("BarcodeFileGenerator", f"Code128 바코드 생성 중: {code}")
             # GS1-128 바코드 생성
-            writer = ImageWriter(format="PNG")
+            writer = ImageWriter(format="PNG", mode="L")
             barcode = Code128(code, writer=writer)
 
-            logger.debug("BarcodeFileGenerator", f"바코드 파일 저장 중: {filename}")
-            # 파일로 저장
-            barcode.write(filename, self.writer_options)
+            barcode_img = barcode.render(self.writer_options)
+            data = encode_barcode_png(barcode_img, self.output_format).getvalue()
 
-            # 파일 생성 확인
-            if os.path.exists(filename):
-                file_size = os.path.getsize(filename)
-                logger.info(
-                    "BarcodeFileGenerator",
-                    f"바코드 생성 완료: {code} ({category}) -> {filename} ({file_size} bytes)",
-                )
-                return filename
-            else:
-                logger.error(
-                    "BarcodeFileGenerator",
-                    "바코드 파일 생성 실패: 파일이 생성되지 않음",
-                )
+            if not data:
+                logger.error("BarcodeFileGenerator", f"바코드 생성 실패: 빈 이미지 - {code}")
                 return None
 
+            self.store.put(key, data)
+            logger.info(
+                "BarcodeFileGenerator",
+                f"바코드 생성 완료: {code} ({category}) ({len(data)} bytes)",
+            )
+            return data
+
         except ImportError as e:
             logger.error("BarcodeFileGenerator", f"바코드 라이브러리 임포트 실패: {e}")
             return None
@@ -641,30 +962,43 @@ class BarcodeFileGenerator:
             traceback.print_exc()
             return None
 
+    def generate_barcode(self, code: str, category: str) -> Optional[BytesIO]:
+        """바코드 이미지 생성 (저장소에서 읽거나 렌더링 후 저장, 개별 PNG 파일은 만들지 않음)"""
+        data = self.generate_barcode_data(code, category)
+        if data is None:
+            return None
+        return BytesIO(data)
+
     def generate_barcodes_for_products(
         self, products: List[Tuple[str, str, str, str]]
-    ) -> Dict[str, str]:
-        """상품 목록에 대한 바코드 파일 생성"""
-        generated_files = {}
-        unique_codes = set()
+    ) -> Dict[str, BytesIO]:
+        """상품 목록에 대한 바코드 생성 (저장소 기반, 메모리 버퍼로 반환)"""
+        barcode_images = {}
 
-        for _, _, category, code in products:
-            if code not in unique_codes:
-                unique_codes.add(code)
-                filepath = self.generate_barcode(code, category)
-                if filepath:
-                    generated_files[code] = filepath
+        for _, _, category, code in distinct_labels(products):
+            if code not in barcode_images:
+                img_buffer = self.generate_barcode(code, category)
+                if img_buffer is not None:
+                    barcode_images[code] = img_buffer
 
-        return generated_files
+        return barcode_images
 
     def cleanup(self):
-        """바코드 파일 및 디렉토리 정리"""
-        if os.path.exists(self.output_dir):
-            import shutil
-
-            shutil.rmtree(self.output_dir)
-            print(f"바코드 디렉토리 정리 완료: {self.output_dir}")
-
-    def get_barcode_path(self, code: str) -> str:
-        """바코드 파일 경로 반환"""
-        return os.path.join(self.output_dir, f"{code}.png")
+        """출력 디렉토리의 임시 파일 정리 (영구 저장소 blob/인덱스 파일은 유지)"""
+        self.store.close()
+        if not os.path.exists(self.output_dir):
+            return
+        keep = {BarcodeStore.BLOB_NAME, BarcodeStore.INDEX_NAME}
+        removed = 0
+        for entry in os.scandir(self.output_dir):
+            if entry.name in keep:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.remove(entry.path)
+                removed += 1
+            except OSError as e:
+                logger.warning("BarcodeFileGenerator", f"파일 정리 실패: {entry.path} - {e}")
+        print(f"바코드 디렉토리 정리 완료: {self.output_dir} ({removed}개 항목 삭제, 저장소 유지)")
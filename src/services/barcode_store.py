@@ -0,0 +1,261 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import zlib
+from typing import Dict, Optional, Tuple
+
+from src.services.log_service import logger
+
+
+class BarcodeStore:
+    """단일 파일 바코드 저장소 (추가 전용 blob 파일 + 메모리 매핑 인덱스)
+
+    - blob 파일: 헤더 뒤에 PNG 바이트를 순서대로 이어 붙여 저장
+    - 인덱스 파일: 헤더 뒤에 고정 길이 레코드 (키 해시 16바이트, 오프셋, 길이, CRC32)
+    - 두 파일 헤더에 같은 세대 번호를 기록하고 압축할 때마다 올림 → 교체 도중 종료되어
+      세대가 다르면 두 파일을 짝으로 믿지 않고 저장소를 비움
+    - 레코드마다 키+이미지 CRC32를 저장하고 조회 시 확인 (다른 코드의 이미지 반환 방지)
+    - 시작 시 인덱스를 mmap으로 읽어 {키: (오프셋, 길이, CRC32)} 맵 구성 → O(1) 조회
+    - blob 파일은 메모리 매핑을 열어 두고 조회 시 잘라서 반환 (조회마다 파일을 열지 않음,
+      추가된 항목이 매핑 밖에 있을 때만 다시 매핑)
+    """
+
+    BLOB_NAME = "barcode_store.blob"
+    INDEX_NAME = "barcode_store.idx"
+    MAGIC = b"BCS2"
+    HEADER = struct.Struct("<4sQ")  # 형식 식별자, 세대 번호 (blob/인덱스 공통)
+    RECORD = struct.Struct("<16sQII")  # 키 해시, blob 오프셋, 길이, CRC32
+
+    def __init__(self, store_dir: str, max_bytes: int = 32 * 1024 * 1024):
+        self.store_dir = store_dir
+        self.max_bytes = max_bytes
+        self.blob_path = os.path.join(store_dir, self.BLOB_NAME)
+        self.index_path = os.path.join(store_dir, self.INDEX_NAME)
+        self._index: Dict[bytes, Tuple[int, int, int]] = {}
+        self._blob_size = 0
+        self._generation = 0
+        self._blob_file = None
+        self._blob_map: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._lock = threading.Lock()
+
+        os.makedirs(store_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(code: str, options: Dict) -> bytes:
+        """코드와 모든 렌더링 옵션으로 16바이트 키 해시 생성"""
+        options_repr = repr(sorted((k, repr(v)) for k, v in options.items()))
+        return hashlib.blake2b(
+            f"{code}\x00{options_repr}".encode("utf-8"), digest_size=16
+        ).digest()
+
+    @staticmethod
+    def _checksum(key: bytes, data) -> int:
+        return zlib.crc32(data, zlib.crc32(key))
+
+    def _read_header(self, path: str) -> Optional[int]:
+        """파일 헤더의 세대 번호 (파일이 없거나 형식이 다르면 None)"""
+        try:
+            with open(path, "rb") as f:
+                header = f.read(self.HEADER.size)
+        except OSError:
+            return None
+        if len(header) < self.HEADER.size:
+            return None
+        magic, generation = self.HEADER.unpack(header)
+        return generation if magic == self.MAGIC else None
+
+    def _reset(self, generation: int):
+        """빈 blob/인덱스 파일을 새 세대 헤더로 다시 만듦"""
+        header = self.HEADER.pack(self.MAGIC, generation)
+        self._index = {}
+        self._blob_size = self.HEADER.size
+        self._generation = generation
+        try:
+            for path in (self.blob_path, self.index_path):
+                with open(path, "wb") as f:
+                    f.write(header)
+        except OSError as e:
+            logger.warning("BarcodeStore", f"바코드 저장소 초기화 실패: {e}")
+
+    def _load_index(self):
+        """두 파일의 세대를 확인한 뒤 인덱스 파일을 메모리 매핑하여 키 맵 구성"""
+        self._index = {}
+        blob_generation = self._read_header(self.blob_path)
+        index_generation = self._read_header(self.index_path)
+        if blob_generation is None or blob_generation != index_generation:
+            if blob_generation is not None or index_generation is not None:
+                logger.warning(
+                    "BarcodeStore",
+                    f"바코드 저장소 세대 불일치 (blob {blob_generation}, 인덱스 {index_generation}), 초기화",
+                )
+            self._reset(max(blob_generation or 0, index_generation or 0) + 1)
+            return
+
+        self._generation = blob_generation
+        self._blob_size = os.path.getsize(self.blob_path)
+        index_size = os.path.getsize(self.index_path)
+        record_count = (index_size - self.HEADER.size) // self.RECORD.size
+        if record_count <= 0:
+            return
+
+        try:
+            with open(self.index_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # 매핑에서 레코드를 바로 해석 (인덱스 전체를 bytes로 복사하지 않음)
+                    unpack_from = self.RECORD.unpack_from
+                    start = self.HEADER.size
+                    for position in range(start, start + record_count * self.RECORD.size, self.RECORD.size):
+                        key, offset, length, crc = unpack_from(mm, position)
+                        # 쓰기 도중 종료되어 blob에 없는 레코드는 무시
+                        if self.HEADER.size <= offset and offset + length <= self._blob_size:
+                            self._index[key] = (offset, length, crc)
+            logger.debug(
+                "BarcodeStore",
+                f"바코드 저장소 로드: {len(self._index)}개 ({self._blob_size} bytes)",
+            )
+        except Exception as e:
+            logger.warning("BarcodeStore", f"바코드 저장소 인덱스 로드 실패, 초기화: {e}")
+            self._unmap()
+            self._reset(self._generation + 1)
+
+    def __contains__(self, key: bytes) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _remap(self):
+        """blob 파일을 현재 크기로 다시 매핑 (잠금 보유 상태)"""
+        self._unmap()
+        if not os.path.exists(self.blob_path):
+            return
+        self._blob_file = open(self.blob_path, "rb")
+        size = os.fstat(self._blob_file.fileno()).st_size
+        if size > 0:
+            self._blob_map = mmap.mmap(self._blob_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = size
+
+    def _unmap(self):
+        """blob 매핑과 파일 핸들 닫기 (잠금 보유 상태)"""
+        if self._blob_map is not None:
+            self._blob_map.close()
+            self._blob_map = None
+        if self._blob_file is not None:
+            self._blob_file.close()
+            self._blob_file = None
+        self._mapped_size = 0
+
+    def close(self):
+        """열어 둔 blob 매핑 해제 (저장소 폴더를 지우기 전 호출)"""
+        with self._lock:
+            self._unmap()
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """키에 해당하는 이미지 바이트 반환 (없으면 None)"""
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            offset, length, crc = entry
+            end = offset + length
+            if end > self._mapped_size:
+                # 매핑 이후 추가된 항목 → 한 번만 다시 매핑
+                try:
+                    self._remap()
+                except (OSError, ValueError) as e:
+                    logger.warning("BarcodeStore", f"바코드 저장소 읽기 실패: {e}")
+                    return None
+                if end > self._mapped_size:
+                    return None
+            data = self._blob_map[offset:end]
+            if self._checksum(key, data) != crc:
+                # 손상되었거나 다른 항목을 가리키는 레코드 → 버리고 다시 렌더링하게 함
+                logger.warning("BarcodeStore", "바코드 저장소 항목 체크섬 불일치, 무시")
+                del self._index[key]
+                return None
+            return data
+
+    def put(self, key: bytes, data: bytes):
+        """이미지 바이트를 blob 끝에 추가하고 인덱스 레코드 기록"""
+        with self._lock:
+            offset = self._blob_size
+            crc = self._checksum(key, data)
+            with open(self.blob_path, "ab") as f:
+                f.write(data)
+            with open(self.index_path, "ab") as f:
+                f.write(self.RECORD.pack(key, offset, len(data), crc))
+            self._index[key] = (offset, len(data), crc)
+            self._blob_size = offset + len(data)
+
+            if self._blob_size > self.max_bytes:
+                self._compact()
+
+    def compact(self):
+        """사용하지 않는 blob 영역을 제거하여 저장소 재작성"""
+        with self._lock:
+            self._compact()
+
+    def _compact(self):
+        """최근 항목부터 최대 크기의 75%까지 유지하며 저장소 재작성 (잠금 보유 상태)
+
+        새 파일은 세대 번호를 하나 올려 쓴다. blob과 인덱스 교체 사이에 종료되면
+        두 파일의 세대가 달라 다음 로드 때 저장소가 비워진다.
+        """
+        budget = int(self.max_bytes * 0.75)
+        kept = []
+        kept_bytes = 0
+        # 오프셋이 클수록 최근에 추가된 항목
+        for key, (offset, length, crc) in sorted(
+            self._index.items(), key=lambda item: item[1][0], reverse=True
+        ):
+            if kept_bytes + length > budget:
+                break
+            kept.append((key, offset, length, crc))
+            kept_bytes += length
+        kept.reverse()
+
+        blob_tmp = self.blob_path + ".tmp"
+        index_tmp = self.index_path + ".tmp"
+        generation = self._generation + 1
+        header = self.HEADER.pack(self.MAGIC, generation)
+        new_index = {}
+        # 열린 매핑이 있으면 (Windows에서) 파일을 교체할 수 없으므로 먼저 해제
+        self._unmap()
+        try:
+            with open(self.blob_path, "rb") as src, open(blob_tmp, "wb") as blob_out, open(
+                index_tmp, "wb"
+            ) as index_out:
+                blob_out.write(header)
+                index_out.write(header)
+                new_offset = self.HEADER.size
+                for key, offset, length, crc in kept:
+                    src.seek(offset)
+                    blob_out.write(src.read(length))
+                    index_out.write(self.RECORD.pack(key, new_offset, length, crc))
+                    new_index[key] = (new_offset, length, crc)
+                    new_offset += length
+
+            os.replace(blob_tmp, self.blob_path)
+            os.replace(index_tmp, self.index_path)
+
+            removed = len(self._index) - len(new_index)
+            self._index = new_index
+            self._blob_size = self.HEADER.size + kept_bytes
+            self._generation = generation
+            logger.info(
+                "BarcodeStore",
+                f"바코드 저장소 압축 완료: {len(new_index)}개 유지, {removed}개 제거 ({kept_bytes} bytes)",
+            )
+        except Exception as e:
+            logger.error("BarcodeStore", f"바코드 저장소 압축 실패: {e}")
+            for tmp in (blob_tmp, index_tmp):
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            # blob만 교체되었을 수 있으므로 디스크 상태에서 다시 로드 (세대가 다르면 초기화)
+            self._load_index()
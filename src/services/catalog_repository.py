@@ -0,0 +1,329 @@
+import copy
+import threading
+from collections import Counter
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+from src.models.product import Product, barcode_number
+from src.services.log_service import logger
+
+
+class CatalogRepository:
+    """상품 카탈로그를 메모리에 보관하고 변경분을 모아서 저장하는 저장소
+
+    - 처음 사용할 때 한 번만 파일에서 읽고, 이후 조회/수정은 메모리 목록에서 처리
+    - 수정하면 dirty 상태가 되고, 마지막 수정 후 flush_delay초가 지나면 한 번에 저장
+    - flush()를 직접 호출하면 바로 저장 (프로그램 종료, 다른 이름으로 저장 전 등)
+    - (TYPE_ID, PRODUCT_ID), 바코드 번호, (상품명, TYPE 이름) 색인과 TYPE별 최대
+      PRODUCT_ID를 수정할 때마다 함께 갱신해 조회를 O(1)로 처리
+    - 저장소 안의 상품 객체는 밖으로 내보내지 않고 항상 사본을 반환 (색인을 거치지
+      않은 수정 방지), 들어오는 상품은 사본으로 보관하고 바코드 번호를 다시 계산
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], List[Product]],
+        writer: Callable[[List[Product]], bool],
+        flush_delay: float = 2.0,
+    ):
+        self._loader = loader
+        self._writer = writer
+        self.flush_delay = flush_delay
+        # 슬롯 번호 → 상품 (삽입 순서 = 파일 행 순서, 교체 시 같은 슬롯 유지)
+        self._slots: Optional[Dict[int, Product]] = None
+        self._slot_of: Dict[int, int] = {}  # id(상품) → 슬롯 번호
+        self._next_slot = 0
+        # 색인 (같은 키의 상품이 여러 개일 수 있으므로 파일 순서대로 목록 보관)
+        self._by_key: Dict[Tuple[int, int], List[Product]] = {}
+        self._by_barcode: Dict[str, List[Product]] = {}
+        self._by_name_type: Dict[Tuple[str, str], List[Product]] = {}
+        self._ids_by_type: Dict[int, Counter] = {}
+        self._max_by_type: Dict[int, int] = {}
+        self._dirty = False
+        self._timer: Optional[threading.Timer] = None
+        # 저장 타이머 스레드와 UI 스레드가 함께 접근하므로 재진입 가능한 잠금 사용
+        self.lock = threading.RLock()
+        # 파일 쓰기는 한 번에 하나씩 (쓰는 동안 메모리 목록 수정은 막지 않음)
+        self._write_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        if self._slots is None:
+            self._set_products(self._loader())
+
+    def _set_products(self, products: List[Product]):
+        self._slots = {}
+        self._slot_of = {}
+        self._next_slot = 0
+        for product in products:
+            self._slots[self._next_slot] = product
+            self._slot_of[id(product)] = self._next_slot
+            self._next_slot += 1
+        self.rebuild_indexes()
+
+    @staticmethod
+    def _own(product: Product) -> Product:
+        """보관용 사본 (TYPE_ID/PRODUCT_ID에서 바코드 번호를 다시 계산)"""
+        product = copy.copy(product)
+        CatalogRepository._refresh_barcode(product)
+        return product
+
+    @staticmethod
+    def _refresh_barcode(product: Product):
+        """파일에서 읽을 때와 같은 규칙으로 바코드 번호 계산 (TYPE 미지정 상품은 그대로)"""
+        if isinstance(product.type_id, int) and product.type_id >= 0:
+            try:
+                product.barcode_num = barcode_number(product.type_id, int(product.product_id))
+            except (TypeError, ValueError):
+                pass
+
+    @staticmethod
+    def _copy(product: Optional[Product]) -> Optional[Product]:
+        return copy.copy(product) if product is not None else None
+
+    @property
+    def products(self) -> List[Product]:
+        """메모리 상품 목록 사본 (처음 접근 시 파일에서 로드, 상품 객체도 사본)"""
+        with self.lock:
+            self._ensure_loaded()
+            return [copy.copy(p) for p in self._slots.values()]
+
+    def __len__(self) -> int:
+        with self.lock:
+            self._ensure_loaded()
+            return len(self._slots)
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    # ---- 색인 ----
+
+    @staticmethod
+    def _index_keys(product: Product):
+        return (
+            (product.type_id, product.product_id),
+            product.barcode_num,
+            (product.name, product.type_name),
+        )
+
+    def _index_add(self, product: Product):
+        key, barcode, name_type = self._index_keys(product)
+        self._by_key.setdefault(key, []).append(product)
+        self._by_barcode.setdefault(barcode, []).append(product)
+        self._by_name_type.setdefault(name_type, []).append(product)
+
+        type_id, product_id = key
+        self._ids_by_type.setdefault(type_id, Counter())[product_id] += 1
+        if type_id in self._max_by_type:
+            self._max_by_type[type_id] = max(self._max_by_type[type_id], product_id)
+
+    @staticmethod
+    def _discard(index: Dict[Hashable, List[Product]], key: Hashable, product: Product):
+        bucket = index.get(key)
+        if not bucket:
+            return
+        for i, p in enumerate(bucket):
+            if p is product:
+                del bucket[i]
+                break
+        if not bucket:
+            del index[key]
+
+    def _index_remove(self, product: Product):
+        key, barcode, name_type = self._index_keys(product)
+        self._discard(self._by_key, key, product)
+        self._discard(self._by_barcode, barcode, product)
+        self._discard(self._by_name_type, name_type, product)
+
+        type_id, product_id = key
+        ids = self._ids_by_type.get(type_id)
+        if ids is not None:
+            ids[product_id] -= 1
+            if ids[product_id] <= 0:
+                del ids[product_id]
+            if not ids:
+                del self._ids_by_type[type_id]
+        # 최대값이 빠졌으면 다음 조회 때 다시 계산
+        if self._max_by_type.get(type_id) == product_id:
+            del self._max_by_type[type_id]
+
+    def rebuild_indexes(self):
+        """모든 색인 다시 구성 (상품 속성을 직접 바꾼 뒤 호출)"""
+        with self.lock:
+            self._by_key = {}
+            self._by_barcode = {}
+            self._by_name_type = {}
+            self._ids_by_type = {}
+            self._max_by_type = {}
+            for product in (self._slots or {}).values():
+                self._index_add(product)
+
+    def get(self, type_id: int, product_id: int) -> Optional[Product]:
+        """(TYPE_ID, PRODUCT_ID)로 상품 조회"""
+        with self.lock:
+            self._ensure_loaded()
+            bucket = self._by_key.get((type_id, product_id))
+            return self._copy(bucket[0]) if bucket else None
+
+    def find_by_barcode(self, barcode_num: str) -> Optional[Product]:
+        """바코드 번호로 상품 조회"""
+        with self.lock:
+            self._ensure_loaded()
+            bucket = self._by_barcode.get(barcode_num)
+            return self._copy(bucket[0]) if bucket else None
+
+    def find_by_name_type(self, name: str, type_name: str) -> Optional[Product]:
+        """상품명과 TYPE 이름으로 상품 조회 (파일 순서상 첫 상품)"""
+        with self.lock:
+            self._ensure_loaded()
+            bucket = self._by_name_type.get((name, type_name))
+            return self._copy(bucket[0]) if bucket else None
+
+    def has_type(self, type_id: int) -> bool:
+        """해당 TYPE_ID를 쓰는 상품이 있는지 확인"""
+        with self.lock:
+            self._ensure_loaded()
+            return type_id in self._ids_by_type
+
+    def _stored_of_type(self, type_id: int) -> List[Product]:
+        return [
+            product
+            for product_id in self._ids_by_type.get(type_id, ())
+            for product in self._by_key[(type_id, product_id)]
+        ]
+
+    def products_of_type(self, type_id: int) -> List[Product]:
+        """해당 TYPE_ID의 상품 목록 사본 (TYPE 상품 수에 비례)"""
+        with self.lock:
+            self._ensure_loaded()
+            return [copy.copy(p) for p in self._stored_of_type(type_id)]
+
+    def max_product_id(self, type_id: int) -> int:
+        """TYPE별 최대 PRODUCT_ID (상품이 없으면 0)"""
+        with self.lock:
+            self._ensure_loaded()
+            if type_id not in self._max_by_type:
+                ids = self._ids_by_type.get(type_id)
+                self._max_by_type[type_id] = max(ids) if ids else 0
+            return self._max_by_type[type_id]
+
+    # ---- 수정 ----
+
+    def replace(self, products: List[Product]):
+        """상품 목록 전체 교체"""
+        with self.lock:
+            self._set_products([self._own(p) for p in products])
+            self.mark_dirty()
+
+    def add(self, product: Product):
+        """상품 추가"""
+        with self.lock:
+            self._ensure_loaded()
+            product = self._own(product)
+            self._slots[self._next_slot] = product
+            self._slot_of[id(product)] = self._next_slot
+            self._next_slot += 1
+            self._index_add(product)
+            self.mark_dirty()
+
+    def update(self, old_product: Product, new_product: Product) -> bool:
+        """상품 교체 (같은 위치 유지, 대상이 없으면 False)
+
+        (TYPE_ID, PRODUCT_ID)가 같은 상품 중 old_product와 내용이 같은 상품을 먼저 찾고,
+        없으면 그 키의 첫 상품을 교체한다.
+        """
+        with self.lock:
+            self._ensure_loaded()
+            bucket = self._by_key.get((old_product.type_id, old_product.product_id))
+            if not bucket:
+                return False
+            current = next((p for p in bucket if p == old_product), bucket[0])
+            slot = self._slot_of[id(current)]
+
+            new_product = self._own(new_product)
+            self._index_remove(current)
+            del self._slot_of[id(current)]
+            self._slots[slot] = new_product
+            self._slot_of[id(new_product)] = slot
+            self._index_add(new_product)
+            self.mark_dirty()
+            return True
+
+    def _modify(self, product: Product, **changes):
+        """보관 중인 상품의 속성 변경 (색인과 바코드 번호도 함께 갱신)"""
+        self._index_remove(product)
+        for name, value in changes.items():
+            setattr(product, name, value)
+        self._refresh_barcode(product)
+        self._index_add(product)
+
+    def modify_type(self, of_type_id: int, **changes) -> int:
+        """TYPE_ID가 of_type_id인 모든 상품의 속성 변경 후 변경 개수 반환
+
+        저장 예약은 호출한 쪽에서 mark_dirty()로 한 번만 한다.
+        """
+        with self.lock:
+            self._ensure_loaded()
+            products = self._stored_of_type(of_type_id)
+            for product in products:
+                self._modify(product, **changes)
+            return len(products)
+
+    def remove(self, product: Product) -> int:
+        """이름, TYPE_ID, PRODUCT_ID가 같은 상품 삭제 후 삭제 개수 반환"""
+        with self.lock:
+            self._ensure_loaded()
+            matches = [
+                p
+                for p in self._by_key.get((product.type_id, product.product_id), [])
+                if p.name == product.name
+            ]
+            for p in matches:
+                self._index_remove(p)
+                del self._slots[self._slot_of.pop(id(p))]
+            if matches:
+                self.mark_dirty()
+            return len(matches)
+
+    def mark_dirty(self):
+        """변경 표시 후 지연 저장 예약 (이미 예약되어 있으면 다시 미룸)"""
+        with self.lock:
+            self._dirty = True
+            if self._timer is not None:
+                self._timer.cancel()
+            if self.flush_delay is None:
+                return
+            self._timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error("CatalogRepository", f"카탈로그 지연 저장 실패: {e}")
+
+    def flush(self) -> bool:
+        """변경 사항이 있으면 바로 저장 (변경이 없으면 아무것도 하지 않고 True)
+
+        잠금 안에서 목록 사본만 만들고 파일 쓰기는 잠금 밖에서 하므로, 저장 중에도
+        수정할 수 있다. 저장 중 들어온 수정은 다시 dirty로 표시되어 다음에 저장된다.
+        """
+        with self._write_lock:
+            with self.lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return True
+                # TYPE 목록만 바뀐 경우에도 상품 시트를 함께 다시 쓰므로 목록을 먼저 로드
+                self._ensure_loaded()
+                snapshot = list(self._slots.values())
+                self._dirty = False
+
+            if not self._writer(snapshot):
+                with self.lock:
+                    self._dirty = True
+                logger.warning("CatalogRepository", "카탈로그 저장 실패 - 변경 사항 유지")
+                return False
+            logger.debug("CatalogRepository", f"카탈로그 저장: {len(snapshot)}개 상품")
+            return True
@@ -0,0 +1,86 @@
+import hashlib
+import marshal
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from src.services.log_service import logger
+
+# (상품명, 가격, TYPE_ID, PRODUCT_ID) - 파일에서 읽은 product 시트 행을 해석한 값
+ProductRow = Tuple[str, str, int, int]
+
+
+class CatalogSnapshot:
+    """xlsx 옆에 저장하는 파싱된 카탈로그 스냅샷 (TYPE 목록 + 상품 행)
+
+    - marshal 형식이라 읽기가 xlsx 파싱보다 훨씬 빠르고 코드를 실행하지 않음
+    - xlsx 크기와 수정 시각이 같으면 그대로 사용, 수정 시각만 바뀌었으면 내용 해시로 확인
+    - marshal 형식은 파이썬 버전마다 다를 수 있으므로 버전이 다르면 사용하지 않음
+    """
+
+    SUFFIX = ".snapshot"
+    VERSION = 1
+
+    def __init__(self, xlsx_path: str):
+        self.xlsx_path = xlsx_path
+        self.path = xlsx_path + self.SUFFIX
+
+    @staticmethod
+    def _file_hash(path: str) -> str:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+    def _header(self) -> Tuple:
+        return (self.VERSION, sys.version_info[:2])
+
+    def load(self) -> Optional[Tuple[Dict[str, int], List[ProductRow]]]:
+        """xlsx와 일치하는 스냅샷이면 (TYPE 이름 → ID, 상품 행 목록) 반환, 아니면 None"""
+        if not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                data = marshal.load(f)
+            if data.get("header") != self._header():
+                return None
+
+            stat = os.stat(self.xlsx_path)
+            if data["size"] != stat.st_size:
+                return None
+            if data["mtime_ns"] != stat.st_mtime_ns:
+                # 복사/동기화로 수정 시각만 바뀐 경우
+                if data["hash"] != self._file_hash(self.xlsx_path):
+                    return None
+                data["mtime_ns"] = stat.st_mtime_ns
+                self._write(data)
+
+            logger.debug(
+                "CatalogSnapshot",
+                f"카탈로그 스냅샷 사용: {len(data['products'])}개 상품",
+            )
+            return dict(data["categories"]), data["products"]
+        except Exception as e:
+            logger.warning("CatalogSnapshot", f"카탈로그 스냅샷 읽기 실패, Excel에서 로드: {e}")
+            return None
+
+    def save(self, categories: Dict[str, int], products: List[ProductRow]):
+        """현재 xlsx 상태로 스냅샷 저장 (실패해도 다음 시작 때 Excel을 읽을 뿐이므로 경고만 남김)"""
+        try:
+            stat = os.stat(self.xlsx_path)
+            self._write({
+                "header": self._header(),
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "hash": self._file_hash(self.xlsx_path),
+                "categories": list(categories.items()),
+                "products": [tuple(row) for row in products],
+            })
+            logger.debug("CatalogSnapshot", f"카탈로그 스냅샷 저장: {len(products)}개 상품")
+        except Exception as e:
+            logger.warning("CatalogSnapshot", f"카탈로그 스냅샷 저장 실패: {e}")
+
+    def _write(self, data: Dict):
+        """임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 깨진 스냅샷이 남지 않음)"""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump(data, f)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,123 @@
+import copy
+import os
+from typing import List
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
+
+from docx.opc.oxml import serialize_part_xml
+from docx.opc.packuri import PACKAGE_URI, CONTENT_TYPES_URI
+from docx.opc.pkgwriter import _ContentTypesItem
+from docx.oxml.ns import qn
+from lxml import etree
+
+from src.services.log_service import logger
+
+# python-docx add_page_break()와 같은 페이지 나누기 문단
+_PAGE_BREAK_XML = b'<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+_PAGES_MARKER = "PAGES"
+
+
+class StreamingDocxWriter:
+    """템플릿 패키지를 한 번 복사하고 word/document.xml을 페이지 단위로 zip에 바로 쓰는 DOCX 작성기
+
+    - 문서 본문 전체를 메모리에 쌓지 않으므로 페이지 수와 관계없이 메모리 사용량이 일정함
+    - PNG 등 이미지 파트는 더 압축되지 않으므로 ZIP_STORED로 저장
+    - 사용 순서: document에 이미지 등록 → open() → write_page() 반복 → close()
+    """
+
+    def __init__(self, template, output_path: str):
+        self.template = template
+        self.output_path = output_path
+        # 템플릿 패키지 복제본: 본문 외 파트/관계를 그대로 쓰고 이미지 등록에만 사용
+        self.document = template.new_document()
+        self.pages_written = 0
+        self._zip = None
+        self._stream = None
+        self._prefix, self._suffix = self._split_document_xml()
+
+    def _split_document_xml(self):
+        """본문 내용을 비운 document.xml을 sectPr 앞에서 앞/뒤 바이트로 분리"""
+        root = copy.deepcopy(self.document.element)
+        body = root.find(qn("w:body"))
+        sect_pr = None
+        for element in list(body):
+            if element.tag == qn("w:sectPr"):
+                sect_pr = element
+            else:
+                body.remove(element)
+
+        marker = etree.Comment(_PAGES_MARKER)
+        if sect_pr is not None:
+            sect_pr.addprevious(marker)
+        else:
+            body.append(marker)
+
+        prefix, suffix = serialize_part_xml(root).split(
+            f"<!--{_PAGES_MARKER}-->".encode("utf-8"), 1
+        )
+        return prefix, suffix
+
+    def open(self):
+        """본문을 제외한 모든 파트를 기록하고 document.xml 스트림 열기"""
+        package = self.document.part.package
+        document_part = self.document.part
+        parts = list(package.iter_parts())
+
+        self._zip = ZipFile(self.output_path, "w", compression=ZIP_DEFLATED, allowZip64=True)
+        self._zip.writestr(
+            CONTENT_TYPES_URI.membername, _ContentTypesItem.from_parts(parts).blob
+        )
+        self._zip.writestr(PACKAGE_URI.rels_uri.membername, package.rels.xml)
+
+        for part in parts:
+            if len(part.rels):
+                self._zip.writestr(part.partname.rels_uri.membername, part.rels.xml)
+            if part is document_part:
+                continue
+            compress_type = (
+                ZIP_STORED if part.content_type.startswith("image/") else ZIP_DEFLATED
+            )
+            self._zip.writestr(
+                part.partname.membername, part.blob, compress_type=compress_type
+            )
+
+        self._stream = self._zip.open(
+            document_part.partname.membername, "w", force_zip64=True
+        )
+        self._stream.write(self._prefix)
+
+    def write_page(self, elements: List):
+        """채운 페이지 본문 요소들을 직렬화해 기록 (두 번째 페이지부터 페이지 나누기 추가)"""
+        if self.pages_written:
+            self._stream.write(_PAGE_BREAK_XML)
+        for element in elements:
+            self._stream.write(etree.tostring(element, encoding="UTF-8", xml_declaration=False))
+        self.pages_written += 1
+
+    def close(self):
+        """document.xml 마무리 후 zip 파일 닫기"""
+        self._stream.write(self._suffix)
+        self._stream.close()
+        self._stream = None
+        self._zip.close()
+        self._zip = None
+        logger.info(
+            "DocxStreamWriter",
+            f"스트리밍 문서 저장 완료: {self.output_path} ({self.pages_written}페이지)",
+        )
+
+    def abort(self):
+        """오류 시 열린 스트림을 닫고 불완전한 파일 삭제"""
+        try:
+            if self._stream is not None:
+                self._stream.close()
+            if self._zip is not None:
+                self._zip.close()
+        except Exception:
+            pass
+        self._stream = None
+        self._zip = None
+        if os.path.exists(self.output_path):
+            try:
+                os.remove(self.output_path)
+            except OSError:
+                pass
@@ -1,17 +1,55 @@
 from openpyxl import load_workbook, Workbook
-from typing import List, Tuple, Optional, Dict
-from src.models.product import Product
+from typing import Iterator, List, Tuple, Optional, Dict
+from src.models.product import Product, barcode_number
+from src.models.label_runs import LabelRuns
+from src.services.catalog_repository import CatalogRepository
+from src.services.catalog_snapshot import CatalogSnapshot, ProductRow
+from src.services.xlsx_reader import iter_sheet_rows, sheet_names
+from src.services.xlsx_writer import write_xlsx
 import os
 
 class ExcelService:
-    """Excel 파일 읽기/쓰기 서비스 (CRUD 지원)"""
+    """Excel 파일 읽기/쓰기 서비스 (CRUD 지원)
+
+    상품/TYPE 수정은 메모리 카탈로그(CatalogRepository)에 먼저 반영되고, 파일에는
+    마지막 수정 후 flush_delay초 뒤 또는 commit() 호출 시 한 번에 저장된다.
+    """
+
+    _PRODUCT_HEADERS = ["PRODUCT", "PRICE", "TYPE_ID", "PRODUCT_ID"]
+    _TYPE_HEADERS = ["TYPE", "TYPE_ID"]
     
-    def __init__(self, file_path: str = "data/items.xlsx"):
+    def __init__(self, file_path: str = "data/items.xlsx", flush_delay: float = 2.0):
         self.file_path = file_path
         self.category_name_to_id: Dict[str, int] = {}
         self.category_id_to_name: Dict[int, str] = {}
         self._ensure_file_exists()
-        self._load_categories()  # 시작 시 TYPE 목록 로드
+        # xlsx와 일치하는 스냅샷이 있으면 Excel을 파싱하지 않고 사용
+        self._snapshot = CatalogSnapshot(file_path)
+        self._snapshot_rows: Optional[List[ProductRow]] = None
+        cached = self._snapshot.load()
+        if cached is not None:
+            categories, self._snapshot_rows = cached
+            self.category_name_to_id = dict(categories)
+            self.category_id_to_name = {tid: name for name, tid in categories.items()}
+        else:
+            self._load_categories()  # 시작 시 TYPE 목록 로드
+        self.repository = CatalogRepository(
+            self._load_products, self._flush_catalog, flush_delay
+        )
+    
+    def commit(self) -> bool:
+        """메모리 카탈로그의 변경 사항을 바로 파일에 저장"""
+        return self.repository.flush()
+    
+    def _flush_catalog(self, products: List[Product]) -> bool:
+        """저장소 쓰기 함수: 상품 목록 사본과 현재 TYPE 목록 사본으로 파일 저장"""
+        with self.repository.lock:
+            categories = dict(self.category_name_to_id)
+        return self._write_workbook(products, self.file_path, categories)
+    
+    @staticmethod
+    def _barcode_num(type_id: int, product_id: int) -> str:
+        return barcode_number(type_id, product_id)
     
     def _ensure_file_exists(self):
         """Excel 파일이 존재하지 않으면 기본 구조로 생성"""
@@ -49,23 +87,18 @@ class ExcelService:
         print(f"기본 Excel 파일 생성: {self.file_path}")
     
     def _load_categories(self):
-        """type 시트에서 TYPE 목록 로드"""
+        """type 시트에서 TYPE 목록 로드 (시트 XML을 행 단위로 스트리밍)"""
         try:
-            wb = load_workbook(self.file_path)
-            
-            if "type" not in wb.sheetnames:
+            if "type" not in sheet_names(self.file_path):
                 print("type 시트가 없습니다. 기본 TYPE를 사용합니다.")
                 default_categories = ["폰스트랩", "리본 키링", "미니 키링", "키링", "팔찌", "꽃갈피", "모양", "부착"]
                 self.category_name_to_id = {name: i for i, name in enumerate(default_categories)}
                 self.category_id_to_name = {i: name for i, name in enumerate(default_categories)}
-                wb.close()
                 return
             
-            type_ws = wb["type"]
-            
             self.category_name_to_id = {}
             self.category_id_to_name = {}
-            for row in type_ws.iter_rows(min_row=2, values_only=True):
+            for row in iter_sheet_rows(self.file_path, "type", min_row=2, width=2):
                 if row and row[0] is not None and row[1] is not None:
                     type_name = str(row[0]).strip()
                     try:
@@ -76,7 +109,6 @@ class ExcelService:
                     except (ValueError, TypeError):
                         continue
 
-            wb.close()
             print(f"TYPE 목록 로드됨: {list(self.category_name_to_id.keys())}")
             
         except Exception as e:
@@ -94,8 +126,11 @@ class ExcelService:
 
     def is_type_name_in_use(self, type_name: str) -> bool:
         """해당 TYPE가 상품에서 사용 중인지 확인"""
-        products = self.read_products()
-        return any(p.type_name == type_name for p in products)
+        type_id = self.category_name_to_id.get(type_name)
+        if type_id is not None:
+            return self.repository.has_type(type_id)
+        # TYPE 목록에 없는 이름 (예: '알 수 없음')은 상품 목록에서 직접 확인
+        return any(p.type_name == type_name for p in self.repository.products)
 
     def update_type_name(self, old_type_name: str, new_type_name: str) -> bool:
         """TYPE 수정 (연관된 모든 상품 정보 포함)"""
@@ -103,18 +138,17 @@ class ExcelService:
             return False
         
         try:
-            wb = load_workbook(self.file_path)
-            
-            type_ws = wb["type"]
-            for row in type_ws.iter_rows(min_row=2):
-                if row[0].value == old_type_name:
-                    row[0].value = new_type_name
-                    break
-            
-            wb.save(self.file_path)
-            wb.close()
+            with self.repository.lock:
+                type_id = self.category_name_to_id.pop(old_type_name, None)
+                if type_id is None:
+                    print(f"TYPE '{old_type_name}'을 찾을 수 없습니다.")
+                    return False
+                self.category_name_to_id[new_type_name] = type_id
+                self.category_id_to_name[type_id] = new_type_name
+                
+                self.repository.modify_type(type_id, type_name=new_type_name)
+                self.repository.mark_dirty()
             
-            self._load_categories() # Reload categories from file
             print(f"TYPE 수정 완료: '{old_type_name}' -> '{new_type_name}'")
             return True
             
@@ -129,22 +163,11 @@ class ExcelService:
             return False
         
         try:
-            wb = load_workbook(self.file_path)
-            type_ws = wb["type"]
-            
-            row_to_delete = None
-            for row_idx, row in enumerate(type_ws.iter_rows(min_row=2), start=2):
-                if row[0].value == type_name:
-                    row_to_delete = row_idx
-                    break
-            
-            if row_to_delete:
-                type_ws.delete_rows(row_to_delete)
-            
-            wb.save(self.file_path)
-            wb.close()
-            
-            self._load_categories() # Reload categories
+            with self.repository.lock:
+                type_id = self.category_name_to_id.pop(type_name, None)
+                if type_id is not None:
+                    self.category_id_to_name.pop(type_id, None)
+                self.repository.mark_dirty()
             
             print(f"TYPE 삭제 완료: '{type_name}'")
             return True
@@ -159,31 +182,13 @@ class ExcelService:
             if type_name in self.category_name_to_id:
                 return True
             
-            wb = load_workbook(self.file_path)
+            with self.repository.lock:
+                # 가장 큰 TYPE_ID + 1
+                new_id = max(self.category_id_to_name, default=-1) + 1
+                self.category_name_to_id[type_name] = new_id
+                self.category_id_to_name[new_id] = type_name
+                self.repository.mark_dirty()
             
-            if "type" not in wb.sheetnames:
-                type_ws = wb.create_sheet("type")
-                type_ws.append(["TYPE", "TYPE_ID"])
-            else:
-                type_ws = wb["type"]
-            
-            # Find max type_id and add 1
-            max_id = -1
-            for row in type_ws.iter_rows(min_row=2, values_only=True):
-                if row and row[1] is not None:
-                    try:
-                        max_id = max(max_id, int(row[1]))
-                    except (ValueError, TypeError):
-                        continue
-            new_id = max_id + 1
-            
-            type_ws.append([type_name, new_id])
-            
-            wb.save(self.file_path)
-            wb.close()
-            
-            self.category_name_to_id[type_name] = new_id
-            self.category_id_to_name[new_id] = type_name
             print(f"새 TYPE 추가됨: {type_name} (ID: {new_id})")
             return True
             
@@ -192,59 +197,217 @@ class ExcelService:
             return False
     
     def read_products(self) -> List[Product]:
-        """product 시트에서 상품 정보 읽기 (Read)"""
+        """상품 목록 반환 (Read) - 메모리 카탈로그 사본, 처음 한 번만 파일에서 읽음"""
+        return self.repository.products
+    
+    def _load_products(self) -> List[Product]:
+        """저장소 로드 함수: 시작 때 읽은 스냅샷이 있으면 사용하고, 없으면 Excel 파일에서 읽기"""
+        rows, self._snapshot_rows = self._snapshot_rows, None
+        if rows is None:
+            return self._read_products_from_file()
+        products = [self._make_product(*row) for row in rows]
+        print(f"총 {len(products)}개 상품 로드됨 (스냅샷)")
+        return products
+
+    def _read_products_from_file(self) -> List[Product]:
+        """product 시트에서 상품 정보 읽기 (성공하면 다음 시작을 위해 스냅샷 저장)"""
         try:
-            wb = load_workbook(self.file_path, data_only=True)
-            
-            if "product" in wb.sheetnames:
-                ws = wb["product"]
-            else:
-                ws = wb.active
-                print("product 시트가 없어서 첫 번째 시트를 사용합니다.")
-            
-            products = []
-            
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                if not row or row[0] is None:
-                    continue
-                
-                try:
-                    name = str(row[0]).strip()
-                    price = str(row[1]).strip() if row[1] is not None else "0"
-                    type_id = int(row[2]) if row[2] is not None else None
-                    product_id = int(row[3]) if len(row) > 3 and row[3] is not None else 0
-                    
-                    if name and type_id is not None:
-                        type_name = self.category_id_to_name.get(type_id, "알 수 없음")
-                        product = Product(
-                            name=name,
-                            price=price,
-                            type_name=type_name,
-                            type_id=type_id,
-                            product_id=product_id,
-                            barcode_num=f"{type_id}{str(product_id).zfill(6)}"
-                        )
-                        products.append(product)
-                except (ValueError, TypeError, IndexError) as e:
-                    print(f"상품 데이터 오류 (행 스킵): {row} - {e}")
-                    continue
-            
-            wb.close()
+            products = list(self._iter_products_from_file())
             print(f"총 {len(products)}개 상품 로드됨")
+            # 로드 전에 TYPE 목록이 바뀌었으면 파일과 맞지 않으므로 저장하지 않음
+            if not self.repository.dirty:
+                self._snapshot.save(
+                    self.category_name_to_id,
+                    [(p.name, p.price, p.type_id, p.product_id) for p in products],
+                )
             return products
             
         except Exception as e:
             print(f"Excel 파일 읽기 실패: {e}")
             return []
     
+    def _iter_products_from_file(self) -> Iterator[Product]:
+        """product 시트 행을 스트리밍으로 읽어 Product로 하나씩 반환"""
+        sheet_name = "product"
+        if sheet_name not in sheet_names(self.file_path):
+            sheet_name = None
+            print("product 시트가 없어서 첫 번째 시트를 사용합니다.")
+        
+        for row in iter_sheet_rows(self.file_path, sheet_name, min_row=2, width=4):
+            if row[0] is None:
+                continue
+            
+            try:
+                values = self._parse_product_row(row)
+                if values is None:
+                    continue
+                product = self._make_product(*values)
+            except (ValueError, TypeError, IndexError) as e:
+                print(f"상품 데이터 오류 (행 스킵): {row} - {e}")
+                continue
+            yield product
+
+    @staticmethod
+    def _parse_product_row(row) -> Optional[ProductRow]:
+        """product 시트 행 값을 (상품명, 가격, TYPE_ID, PRODUCT_ID)로 해석 (빈 행이면 None)"""
+        name = str(row[0]).strip()
+        price = str(row[1]).strip() if row[1] is not None else "0"
+        type_id = int(row[2]) if row[2] is not None else None
+        product_id = int(row[3]) if row[3] is not None else 0
+        
+        if name and type_id is not None:
+            return name, price, type_id, product_id
+        return None
+
+    def _make_product(self, name: str, price: str, type_id: int, product_id: int) -> Product:
+        return Product(
+            name=name,
+            price=price,
+            type_name=self.category_id_to_name.get(type_id, "알 수 없음"),
+            type_id=type_id,
+            product_id=product_id,
+            barcode_num=self._barcode_num(type_id, product_id)
+        )
+    
     def save_products(self, products: List[Product], file_path:str) -> bool:
-        """상품 목록을 product 시트에 저장 (Create/Update)"""
+        """상품 목록을 product 시트에 저장 (Create/Update)
+
+        현재 파일이면 메모리 카탈로그를 교체하고 바로 저장, 다른 경로면 그 파일로 내보낸다.
+        """
+        if os.path.abspath(file_path) == os.path.abspath(self.file_path):
+            self.repository.replace(products)
+            return self.repository.flush()
+        return self._write_workbook(products, file_path)
+    
+    def _write_workbook(self, products: List[Product], file_path: str,
+                        categories: Optional[Dict[str, int]] = None) -> bool:
+        """상품 목록과 TYPE 목록으로 product/type 시트 다시 쓰기
+
+        categories(TYPE 이름 → ID 사본)를 넘기면 그 목록을 쓰고 메모리 TYPE 목록은 그대로 둔다.
+        같은 폴더의 임시 파일에 다 쓴 뒤 원본과 교체하므로, 저장 중 종료되어도 기존 파일은 그대로 남는다.
+        """
+        tmp_path = file_path + ".tmp"
         try:
-            if os.path.exists(file_path):
-                wb = load_workbook(file_path)
+            types_map = self._build_types_map(products, categories)
+            type_rows = [[tname, tid] for tid, tname in sorted(types_map.items(), key=lambda x: x[0])]
+
+            if self._has_other_sheets(file_path):
+                # 사용자가 추가한 시트는 openpyxl로 통째로 읽어 서식까지 보존
+                self._write_workbook_full(products, type_rows, file_path, tmp_path)
             else:
-                wb = Workbook()
+                write_xlsx(tmp_path, [
+                    ("type", self._TYPE_HEADERS, type_rows),
+                    ("product", self._PRODUCT_HEADERS, (self._product_row(p) for p in products)),
+                ])
+            os.replace(tmp_path, file_path)
+
+            if os.path.abspath(file_path) == os.path.abspath(self.file_path):
+                self._save_snapshot(products, types_map)
+
+            # Update in-memory category maps to reflect saved TYPE sheet
+            if categories is None:
+                self.category_id_to_name = {int(k): v for k, v in types_map.items()}
+                self.category_name_to_id = {v: int(k) for k, v in types_map.items()}
+
+            print(f"Excel 파일 저장 완료: {file_path} ({len(products)}개 상품, {len(types_map)}개 TYPE)")
+            return True
             
+        except Exception as e:
+            print(f"Excel 파일 저장 실패: {e}")
+            return False
+        finally:
+            if os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _save_snapshot(self, products: List[Product], types_map: Dict[int, str]):
+        """방금 저장한 파일을 다시 읽었을 때와 같은 내용으로 스냅샷 저장"""
+        rows = []
+        for product in products:
+            try:
+                values = self._parse_product_row(self._product_row(product))
+            except (ValueError, TypeError):
+                continue
+            if values is not None:
+                rows.append(values)
+        self._snapshot.save({name: tid for tid, name in types_map.items()}, rows)
+
+    def _build_types_map(self, products: List[Product],
+                         categories: Optional[Dict[str, int]] = None) -> Dict[int, str]:
+        """상품과 TYPE 목록에서 저장할 TYPE_ID → TYPE 이름 맵 구성"""
+        # Build TYPE mapping from products while avoiding duplicates/conflicts
+        types_map: Dict[int, str] = {}
+        name_to_id: Dict[str, int] = {}
+
+        for product in products:
+            try:
+                tid = int(getattr(product, "type_id", 0) or 0)
+            except Exception:
+                tid = 0
+            tname = getattr(product, "type_name", None) or getattr(product, "category", "") or f"TYPE_{tid}"
+
+            # If this id already mapped, keep first occurrence (log on conflict)
+            if tid in types_map:
+                if types_map[tid] != tname:
+                    print(f"TYPE ID 충돌: {tid} '{types_map[tid]}' vs '{tname}' - 기존 이름 유지")
+                continue
+
+            # If this name already mapped to a different id, keep first occurrence (log)
+            if tname in name_to_id:
+                existing_id = name_to_id[tname]
+                if existing_id != tid:
+                    print(f"TYPE 이름 충돌: '{tname}' 이미 ID {existing_id}에 할당되어 있음 (시도한 ID: {tid}) - 기존 매핑 유지")
+                    continue
+
+            types_map[tid] = tname
+            name_to_id[tname] = tid
+
+        # Also include any known categories from self (preserve existing TYPE list)
+        known_categories = categories if categories is not None else self.category_name_to_id
+        for name, tid in known_categories.items():
+            if tid not in types_map and name not in name_to_id:
+                types_map[tid] = name
+                name_to_id[name] = tid
+
+        return types_map
+
+    @staticmethod
+    def _product_row(product: Product) -> list:
+        """product 시트 한 행의 값"""
+        try:
+            return [
+                product.name,
+                product.price,
+                int(getattr(product, "type_id", 0) or 0),
+                int(getattr(product, "product_id", 0) or 0)
+            ]
+        except Exception:
+            # fallback: write raw values if conversion fails
+            return [
+                getattr(product, "name", ""),
+                getattr(product, "price", ""),
+                getattr(product, "type_id", ""),
+                getattr(product, "product_id", "")
+            ]
+
+    @staticmethod
+    def _has_other_sheets(file_path: str) -> bool:
+        """product/type 외에 보존해야 할 시트가 있는지 확인 (빈 기본 시트 'Sheet'는 제외)"""
+        if not os.path.exists(file_path):
+            return False
+        try:
+            return bool(set(sheet_names(file_path)) - {"product", "type", "Sheet"})
+        except Exception:
+            # 읽을 수 없는 파일은 새로 쓴다
+            return False
+
+    def _write_workbook_full(self, products: List[Product], type_rows: List[list],
+                             file_path: str, tmp_path: str):
+        """기존 통합 문서를 열어 product/type 시트만 바꾼 뒤 tmp_path에 저장"""
+        wb = load_workbook(file_path)
+        try:
             if "product" in wb.sheetnames:
                 wb.remove(wb["product"])
 
@@ -254,125 +417,56 @@ class ExcelService:
             product_ws = wb.create_sheet("product", 0)
             type_ws = wb.create_sheet("type", 0)
 
-            p_headers = ["PRODUCT", "PRICE", "TYPE_ID", "PRODUCT_ID"]
-            t_headers = ["TYPE","TYPE_ID"]
-            product_ws.append(p_headers)
-            type_ws.append(t_headers)
-            
+            product_ws.append(self._PRODUCT_HEADERS)
+            type_ws.append(self._TYPE_HEADERS)
 
-            for col in range(1, len(p_headers) + 1):
+            for col in range(1, len(self._PRODUCT_HEADERS) + 1):
                 cell = product_ws.cell(row=1, column=col)
                 cell.font = cell.font.copy(bold=True)
-            for col in range(1, len(t_headers) + 1):
+            for col in range(1, len(self._TYPE_HEADERS) + 1):
                 cell = type_ws.cell(row=1, column=col)
                 cell.font = cell.font.copy(bold=True)
-            
-            # Build TYPE mapping from products while avoiding duplicates/conflicts
-            types_map: Dict[int, str] = {}
-            name_to_id: Dict[str, int] = {}
 
+            for row in type_rows:
+                type_ws.append(row)
             for product in products:
-                try:
-                    tid = int(getattr(product, "type_id", 0) or 0)
-                except Exception:
-                    tid = 0
-                tname = getattr(product, "type_name", None) or getattr(product, "category", "") or f"TYPE_{tid}"
-
-                # If this id already mapped, keep first occurrence (log on conflict)
-                if tid in types_map:
-                    if types_map[tid] != tname:
-                        print(f"TYPE ID 충돌: {tid} '{types_map[tid]}' vs '{tname}' - 기존 이름 유지")
-                    continue
-
-                # If this name already mapped to a different id, keep first occurrence (log)
-                if tname in name_to_id:
-                    existing_id = name_to_id[tname]
-                    if existing_id != tid:
-                        print(f"TYPE 이름 충돌: '{tname}' 이미 ID {existing_id}에 할당되어 있음 (시도한 ID: {tid}) - 기존 매핑 유지")
-                        continue
-
-                types_map[tid] = tname
-                name_to_id[tname] = tid
-
-            # Also include any known categories from self (preserve existing TYPE list)
-            for name, tid in self.category_name_to_id.items():
-                if tid not in types_map and name not in name_to_id:
-                    types_map[tid] = name
-                    name_to_id[name] = tid
+                product_ws.append(self._product_row(product))
 
-            # Write types sorted by TYPE_ID for predictability
-            for tid, tname in sorted(types_map.items(), key=lambda x: x[0]):
-                type_ws.append([tname, tid])
-
-            # Write product rows
-            for product in products:
-                try:
-                    product_ws.append([
-                        product.name,
-                        product.price,
-                        int(getattr(product, "type_id", 0) or 0),
-                        int(getattr(product, "product_id", 0) or 0)
-                    ])
-                except Exception:
-                    # fallback: write raw values if conversion fails
-                    product_ws.append([
-                        getattr(product, "name", ""),
-                        getattr(product, "price", ""),
-                        getattr(product, "type_id", ""),
-                        getattr(product, "product_id", "")
-                    ])
-            
             # Remove default empty sheet if present
             if "Sheet" in wb.sheetnames and len(wb.sheetnames) > 1:
                 wb.remove(wb["Sheet"])
 
-            wb.save(file_path)
+            wb.save(tmp_path)
+        finally:
             wb.close()
-
-            # Update in-memory category maps to reflect saved TYPE sheet
-            self.category_id_to_name = {int(k): v for k, v in types_map.items()}
-            self.category_name_to_id = {v: int(k) for k, v in types_map.items()}
-
-            print(f"Excel 파일 저장 완료: {file_path} ({len(products)}개 상품, {len(types_map)}개 TYPE)")
-            return True
-            
-        except Exception as e:
-            print(f"Excel 파일 저장 실패: {e}")
-            return False
     
     def add_product(self, product: Product) -> bool:
-        """새 상품 추가 (Create)"""
+        """새 상품 추가 (Create) - 메모리 카탈로그에 반영, 파일 저장은 지연"""
         try:
-            products = self.read_products()
-            products.append(product)
-            return self.save_products(products, self.file_path)
+            self.repository.add(product)
+            return True
         except Exception as e:
             print(f"상품 추가 실패: {e}")
             return False
     
     def update_product(self, old_product: Product, new_product: Product) -> bool:
-        """상품 정보 수정 (Update)"""
+        """상품 정보 수정 (Update) - 대상 상품이 없으면 False"""
         try:
-            products = self.read_products()
-            
-            for i, p in enumerate(products):
-                if p.product_id == old_product.product_id:
-                    products[i] = new_product
-                    break
-            
-            return self.save_products(products, self.file_path)
+            if not self.repository.update(old_product, new_product):
+                print(f"수정할 상품을 찾을 수 없음: {old_product.name}")
+                return False
+            return True
         except Exception as e:
             print(f"상품 수정 실패: {e}")
             return False
     
     def delete_product(self, product: Product) -> bool:
-        """상품 삭제 (Delete)"""
+        """상품 삭제 (Delete) - 대상 상품이 없으면 False"""
         try:
-            products = self.read_products()
-            
-            products = [p for p in products if p.product_id != product.product_id or p.type_id != product.type_id or p.name != product.name]
-            
-            return self.save_products(products, self.file_path)
+            if not self.repository.remove(product):
+                print(f"삭제할 상품을 찾을 수 없음: {product.name}")
+                return False
+            return True
         except Exception as e:
             print(f"상품 삭제 실패: {e}")
             return False
@@ -380,11 +474,15 @@ class ExcelService:
     def get_product_by_name_type_name(self, name: str, type_name: str) -> Optional[Product]:
         # This method might be problematic if type_name is not unique
         # It's better to use ID if possible
-        products = self.read_products()
-        for product in products:
-            if product.name == name and product.type_name == type_name:
-                return product
-        return None
+        return self.repository.find_by_name_type(name, type_name)
+    
+    def get_product(self, type_id: int, product_id: int) -> Optional[Product]:
+        """(TYPE_ID, PRODUCT_ID)로 상품 조회"""
+        return self.repository.get(type_id, product_id)
+    
+    def get_product_by_barcode(self, barcode_num: str) -> Optional[Product]:
+        """바코드 번호로 상품 조회"""
+        return self.repository.find_by_barcode(barcode_num)
     
     def get_type_name_counters(self, products: List[Product]) -> dict:
         type_name_counters = {}
@@ -394,13 +492,25 @@ class ExcelService:
             type_name_counters[product.type_name] += 1
         return type_name_counters
     
-    def generate_barcode_numbers(self, products: List[Product]) -> List[Tuple[str, str, str, str]]:
-        items = []
+    def generate_barcode_numbers(self, products: List[Product]) -> LabelRuns:
+        """상품 목록(같은 상품 반복 가능)을 라벨 목록으로 변환"""
+        product_counts = []
         for product in products:
-
+            if product_counts and product_counts[-1][0] is product:
+                product_counts[-1][1] += 1
+            else:
+                product_counts.append([product, 1])
+        return self.generate_label_runs(product_counts)
+    
+    def generate_label_runs(self, product_counts: List[Tuple[Product, int]]) -> LabelRuns:
+        """(상품, 출력 개수) 목록을 라벨 구간 목록으로 변환 (가격/바코드 형식은 상품당 한 번)"""
+        items = LabelRuns()
+        for product, count in product_counts:
             barcode_format = f"PPON-{str(product.barcode_num)}"
-            # This logic seems buggy, it adds 78 + 1 items
-            items.append((product.name, product.formatted_price, product.type_name, barcode_format))
+            items.append(
+                (product.name, product.formatted_price, product.type_name, barcode_format),
+                count,
+            )
 
         print(f"총 {len(items)}개 라벨 생성됨")
         return items
@@ -412,46 +522,22 @@ class ExcelService:
             return False
         
         try:
-            wb = load_workbook(self.file_path)
-            
-            # 기존 TYPE_ID 찾기
-            old_type_id = None
-            if "type" in wb.sheetnames:
-                type_ws = wb["type"]
-                for row in type_ws.iter_rows(min_row=2):
-                    if row[0].value == type_name:
-                        old_type_id = row[1].value
-                        row[1].value = new_type_id
-                        break
-            
-            if old_type_id is None:
-                print(f"TYPE '{type_name}'을 찾을 수 없습니다.")
-                wb.close()
-                return False
-            
-            # 상품 시트에서 해당 TYPE_ID를 사용하는 모든 상품 업데이트
-            if "product" in wb.sheetnames:
-                product_ws = wb["product"]
-                updated_count = 0
+            with self.repository.lock:
+                # 기존 TYPE_ID 찾기
+                old_type_id = self.category_name_to_id.get(type_name)
+                if old_type_id is None:
+                    print(f"TYPE '{type_name}'을 찾을 수 없습니다.")
+                    return False
                 
-                for row in product_ws.iter_rows(min_row=2):
-                    if row[2].value == old_type_id:  # TYPE_ID 컬럼 (인덱스 2)
-                        row[2].value = new_type_id
-                        updated_count += 1
-                        
-                        # PRODUCT_ID가 있다면 바코드 번호도 업데이트
-                        if len(row) > 3 and row[3].value is not None:
-                            product_id = row[3].value
-                            new_barcode = f"{new_type_id}{str(product_id).zfill(6)}"
-                            # 바코드 번호는 별도 컬럼이 없으므로 Product 객체에서 계산됨
+                self.category_id_to_name.pop(old_type_id, None)
+                self.category_id_to_name[new_type_id] = type_name
+                self.category_name_to_id[type_name] = new_type_id
                 
-                print(f"{updated_count}개 상품의 TYPE_ID가 업데이트되었습니다.")
+                # 해당 TYPE_ID를 사용하는 모든 상품 업데이트 (바코드 번호는 저장소에서 다시 계산)
+                updated_count = self.repository.modify_type(old_type_id, type_id=new_type_id)
+                self.repository.mark_dirty()
             
-            wb.save(self.file_path)
-            wb.close()
-            
-            # 메모리 상의 매핑도 업데이트
-            self._load_categories()
+            print(f"{updated_count}개 상품의 TYPE_ID가 업데이트되었습니다.")
             print(f"TYPE_ID 수정 완료: '{type_name}' {old_type_id} -> {new_type_id}")
             return True
             
@@ -470,21 +556,11 @@ class ExcelService:
                 print(f"TYPE_ID {type_id}는 이미 사용 중입니다.")
                 return False
             
-            wb = load_workbook(self.file_path)
-            
-            if "type" not in wb.sheetnames:
-                type_ws = wb.create_sheet("type")
-                type_ws.append(["TYPE", "TYPE_ID"])
-            else:
-                type_ws = wb["type"]
-            
-            type_ws.append([type_name, type_id])
+            with self.repository.lock:
+                self.category_name_to_id[type_name] = type_id
+                self.category_id_to_name[type_id] = type_name
+                self.repository.mark_dirty()
             
-            wb.save(self.file_path)
-            wb.close()
-            
-            self.category_name_to_id[type_name] = type_id
-            self.category_id_to_name[type_id] = type_name
             print(f"새 TYPE 추가됨: {type_name} (ID: {type_id})")
             return True
             
@@ -493,28 +569,21 @@ class ExcelService:
             return False
 
     def get_next_product_id(self, type_name: str) -> int:
-        """특정 TYPE의 다음 사용 가능한 PRODUCT_ID 반환"""
+        """특정 TYPE의 다음 사용 가능한 PRODUCT_ID 반환 (TYPE별 최대값 색인 사용)"""
         try:
-            products = self.read_products()
-            max_product_id = 0
-            
-            for product in products:
-                if product.type_name == type_name:
-                    try:
-                        product_id = int(getattr(product, "product_id", 0) or 0)
-                        max_product_id = max(max_product_id, product_id)
-                    except (ValueError, TypeError):
-                        continue
-            
-            return max_product_id + 1
+            type_id = self.category_name_to_id.get(type_name)
+            if type_id is None:
+                return 1
+            return self.repository.max_product_id(type_id) + 1
             
         except Exception as e:
             print(f"다음 PRODUCT_ID 조회 실패: {e}")
             return 1
 
     def backup_file(self, backup_path: str = None) -> bool:
-        """Excel 파일 백업"""
+        """Excel 파일 백업 (저장하지 않은 변경 사항을 먼저 파일에 반영)"""
         try:
+            self.commit()
             if backup_path is None:
                 import datetime
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
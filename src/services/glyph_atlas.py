@@ -0,0 +1,248 @@
+import os
+import shutil
+import string
+import subprocess
+import sys
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from src.services.log_service import logger
+
+# Windows 기본 폰트 후보 (파일명만 있는 항목은 Pillow가 시스템 폰트 폴더에서 검색)
+SYSTEM_FONT_PATHS = [
+    "C:/Windows/Fonts/arial.ttf",
+    "C:/Windows/Fonts/calibri.ttf",
+    "arial.ttf",
+    "calibri.ttf",
+]
+
+# macOS 폰트 후보
+MACOS_FONT_PATHS = [
+    "/Library/Fonts/Arial.ttf",
+    "/System/Library/Fonts/Supplemental/Arial.ttf",
+]
+
+# Linux fontconfig 검색 대상 패밀리 및 기본 폰트 디렉터리/파일명
+FONTCONFIG_FAMILIES = ["Arial", "Liberation Sans", "DejaVu Sans"]
+FONTCONFIG_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.local/share/fonts"),
+    os.path.expanduser("~/.fonts"),
+]
+FONTCONFIG_FILE_NAMES = [
+    "Arial.ttf",
+    "arial.ttf",
+    "LiberationSans-Regular.ttf",
+    "DejaVuSans.ttf",
+    "NotoSans-Regular.ttf",
+]
+
+
+def _fontconfig_match(family: str) -> Optional[str]:
+    """fc-match로 패밀리에 해당하는 폰트 파일 경로 조회 (fontconfig 없으면 None)"""
+    fc_match = shutil.which("fc-match")
+    if not fc_match:
+        return None
+    try:
+        result = subprocess.run(
+            [fc_match, "--format=%{file}", f"{family}:style=Regular"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    path = result.stdout.strip()
+    if result.returncode == 0 and path.lower().endswith((".ttf", ".otf")):
+        return path
+    return None
+
+
+def _scan_font_dirs() -> List[str]:
+    """fontconfig 기본 디렉터리에서 알려진 폰트 파일 검색"""
+    found = {}
+    for font_dir in FONTCONFIG_DIRS:
+        if not os.path.isdir(font_dir):
+            continue
+        for root, _, files in os.walk(font_dir):
+            for name in files:
+                if name in FONTCONFIG_FILE_NAMES and name not in found:
+                    found[name] = os.path.join(root, name)
+    # 후보 파일명 순서(선호도)대로 정렬
+    return [found[name] for name in FONTCONFIG_FILE_NAMES if name in found]
+
+
+@lru_cache(maxsize=1)
+def find_system_fonts() -> Tuple[str, ...]:
+    """현재 OS에서 사용할 TrueType 폰트 후보 목록 (우선순위 순, 한 번만 탐색)"""
+    if sys.platform.startswith("win"):
+        candidates = list(SYSTEM_FONT_PATHS)
+    elif sys.platform == "darwin":
+        candidates = MACOS_FONT_PATHS + SYSTEM_FONT_PATHS[2:]
+    else:
+        candidates = [
+            path
+            for path in (_fontconfig_match(family) for family in FONTCONFIG_FAMILIES)
+            if path
+        ]
+        candidates += _scan_font_dirs()
+        candidates += SYSTEM_FONT_PATHS[2:]
+
+    unique = []
+    for path in candidates:
+        if path not in unique:
+            unique.append(path)
+
+    logger.debug("GlyphAtlas", f"폰트 후보: {unique}")
+    return tuple(unique)
+
+
+class GlyphAtlas:
+    """한 폰트/크기의 글리프 비트맵과 진행 폭을 미리 렌더링해 둔 아틀라스
+
+    바코드 문자 집합(A-Z, 0-9, '-')은 생성 시 렌더링하고, 그 외 문자는
+    처음 사용할 때 추가한다. 텍스트는 글리프 마스크를 붙여 넣어 합성한다.
+    """
+
+    CHARSET = string.ascii_uppercase + string.digits + "-"
+
+    def __init__(self, font, font_size: int, font_name: str):
+        self.font = font
+        self.font_size = font_size
+        self.font_name = font_name
+        # 문자 → (마스크 이미지 또는 None, x 오프셋, y 오프셋, 진행 폭)
+        self._glyphs: Dict[str, Tuple[Optional[Image.Image], int, int, float]] = {}
+        self._lock = threading.Lock()
+
+        for char in self.CHARSET:
+            self._glyphs[char] = self._render_glyph(char)
+
+    def _render_glyph(self, char: str) -> Tuple[Optional[Image.Image], int, int, float]:
+        """글리프 하나를 8비트 마스크로 렌더링 (원점은 어센더 기준 왼쪽 위)"""
+        left, top, right, bottom = self.font.getbbox(char)
+        advance = float(self.font.getlength(char))
+        if right <= left or bottom <= top:
+            return None, 0, 0, advance
+
+        mask = Image.new("L", (right - left, bottom - top), 0)
+        ImageDraw.Draw(mask).text((-left, -top), char, fill=255, font=self.font)
+        return mask, left, top, advance
+
+    def _glyph(self, char: str) -> Tuple[Optional[Image.Image], int, int, float]:
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            with self._lock:
+                glyph = self._glyphs.get(char)
+                if glyph is None:
+                    glyph = self._render_glyph(char)
+                    self._glyphs[char] = glyph
+        return glyph
+
+    def measure(self, text: str) -> Tuple[int, int]:
+        """텍스트의 너비(진행 폭 합)와 실제 잉크 높이 반환"""
+        width = 0.0
+        top = None
+        bottom = None
+        for char in text:
+            mask, _, y_offset, advance = self._glyph(char)
+            width += advance
+            if mask is not None:
+                top = y_offset if top is None else min(top, y_offset)
+                glyph_bottom = y_offset + mask.size[1]
+                bottom = glyph_bottom if bottom is None else max(bottom, glyph_bottom)
+        height = (bottom - top) if top is not None else 0
+        return int(round(width)), height
+
+    def draw(self, img: Image.Image, xy: Tuple[float, float], text: str, fill=0):
+        """이미지에 텍스트 합성 (xy는 draw.text 기본 앵커와 같은 왼쪽 위 기준)"""
+        x, y = xy
+        for char in text:
+            mask, x_offset, y_offset, advance = self._glyph(char)
+            if mask is not None:
+                img.paste(
+                    fill, (int(round(x + x_offset)), int(round(y + y_offset))), mask
+                )
+            x += advance
+
+
+class GlyphAtlasCache:
+    """(폰트, 크기)별 글리프 아틀라스를 보관하는 프로세스 전역 캐시"""
+
+    def __init__(self):
+        self._atlases: Dict[Tuple[str, int], GlyphAtlas] = {}
+        # 후보 목록 → 실제 로드에 성공한 폰트 경로 (없으면 None = 기본 폰트)
+        self._resolved: Dict[Tuple[str, ...], Optional[str]] = {}
+        self._lock = threading.Lock()
+
+        # 통계 카운터
+        self.hits = 0
+        self.builds = 0
+
+    def _load_font(self, font_paths: Tuple[str, ...], font_size: int):
+        """후보 경로 중 처음 로드되는 TrueType 폰트 반환 (모두 실패 시 기본 폰트)"""
+        if font_paths in self._resolved:
+            font_path = self._resolved[font_paths]
+            if font_path is not None:
+                return ImageFont.truetype(font_path, font_size), font_path
+            return ImageFont.load_default(), "default"
+
+        for font_path in font_paths:
+            try:
+                font = ImageFont.truetype(font_path, font_size)
+                self._resolved[font_paths] = font_path
+                logger.debug("GlyphAtlas", f"폰트 로드 성공: {font_path}")
+                return font, font_path
+            except Exception as e:
+                logger.debug("GlyphAtlas", f"폰트 로드 실패: {font_path} - {e}")
+
+        self._resolved[font_paths] = None
+        logger.debug("GlyphAtlas", "TrueType 폰트 없음 - 기본 폰트 사용")
+        return ImageFont.load_default(), "default"
+
+    def get(
+        self, font_size: int, font_paths: Optional[List[str]] = None
+    ) -> GlyphAtlas:
+        """지정 크기의 아틀라스 반환 (font_paths 생략 시 시스템 폰트 후보 사용)"""
+        paths = tuple(font_paths) if font_paths is not None else find_system_fonts()
+        with self._lock:
+            # 이미 해석된 후보 목록이면 폰트를 다시 열지 않고 바로 조회
+            if paths in self._resolved:
+                key = (self._resolved[paths] or "default", font_size)
+                atlas = self._atlases.get(key)
+                if atlas is not None:
+                    self.hits += 1
+                    return atlas
+
+            font, font_name = self._load_font(paths, font_size)
+            atlas = GlyphAtlas(font, font_size, font_name)
+            self._atlases[(font_name, font_size)] = atlas
+            self.builds += 1
+            logger.debug(
+                "GlyphAtlas", f"글리프 아틀라스 생성: {font_name}, 크기: {font_size}"
+            )
+            return atlas
+
+    def has_truetype(self, font_paths: Optional[List[str]] = None) -> bool:
+        """후보 경로 중 TrueType 폰트로 로드 가능한 것이 있는지 확인"""
+        paths = tuple(font_paths) if font_paths is not None else find_system_fonts()
+        with self._lock:
+            if paths not in self._resolved:
+                self._load_font(paths, 10)
+            return self._resolved[paths] is not None
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "builds": self.builds,
+                "atlases": len(self._atlases),
+            }
+
+
+# 전역 글리프 아틀라스 캐시 인스턴스
+glyph_atlas_cache = GlyphAtlasCache()
@@ -0,0 +1,151 @@
+import copy
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from src.services.log_service import logger
+
+
+class CompiledTemplate:
+    """한 번 파싱한 라벨 템플릿 (페이지마다 메모리 XML 트리를 복제해 새 문서 생성)"""
+
+    def __init__(self, path: str, mtime_ns: int, size: int):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = size
+
+        # 템플릿 패키지를 한 번만 압축 해제/파싱
+        document = Document(path)
+        self._part = document.part
+        # 각 XML 파트의 루트 요소 (복제 시 같은 요소를 가리키는 참조를 하나로 유지)
+        self._elements = [
+            part._element
+            for part in self._part.package.iter_parts()
+            if getattr(part, "_element", None) is not None
+        ]
+
+        # 첫 번째 테이블 크기 (테이블이 없으면 0)
+        self.rows = 0
+        self.cols = 0
+        # 행 우선 라벨 칸 → 테이블 내 w:tc 문서 순서 번호 (병합 셀은 같은 번호 반복)
+        self._cell_ordinals: List[int] = []
+        if document.tables:
+            table = document.tables[0]
+            self.rows = len(table.rows)
+            self.cols = len(table.columns)
+
+            # 목록을 유지해야 lxml 프록시 객체(id)가 재사용되지 않음
+            tcs = list(table._tbl.iter(qn("w:tc")))
+            ordinals = {id(tc): i for i, tc in enumerate(tcs)}
+            # table.cell(r, c)와 같은 칸 배치 (병합 반영된 셀 목록을 한 번만 계산)
+            grid_cells = table._cells
+            self._cell_ordinals = [ordinals[id(cell._tc)] for cell in grid_cells]
+
+    @property
+    def has_table(self) -> bool:
+        return self.rows > 0 and self.cols > 0
+
+    @property
+    def labels_per_page(self) -> int:
+        """한 페이지당 라벨 수 (행 x 열)"""
+        return self.rows * self.cols
+
+    def new_document(self):
+        """원본을 건드리지 않는 새 페이지 문서 반환 (패키지 전체를 메모리에서 복제)"""
+        # lxml 요소는 deepcopy memo에 자신을 등록하지 않으므로, 파트와 래퍼가 공유하는
+        # 루트 요소를 미리 한 번씩 복제해 두어 두 벌로 갈라지지 않게 함
+        memo = {id(element): copy.deepcopy(element) for element in self._elements}
+        return copy.deepcopy(self._part, memo).document
+
+    def page_cells(self, document) -> List:
+        """복제된 페이지 문서에서 라벨 칸 순서대로 w:tc 요소 목록 반환 (한 번의 순회)"""
+        tbl = document.element.body.find(qn("w:tbl"))
+        if tbl is None:
+            return []
+        return self.table_cells(tbl)
+
+    def table_cells(self, tbl) -> List:
+        """템플릿 테이블 복제본(w:tbl)의 w:tc 요소를 라벨 칸 순서대로 반환"""
+        tcs = list(tbl.iter(qn("w:tc")))
+        return [tcs[i] for i in self._cell_ordinals]
+
+    def clone_page_body(self) -> List:
+        """한 페이지 분량의 본문 요소(sectPr 제외) 복제본 반환 (문서 이어 붙이기용)"""
+        return [
+            copy.deepcopy(element)
+            for element in self._part._element.body
+            if element.tag != qn("w:sectPr")
+        ]
+
+
+class TemplateCache:
+    """경로+수정 시각+크기 기준 컴파일된 템플릿 캐시 (프로세스 전역)"""
+
+    def __init__(self, max_templates: int = 8):
+        self.max_templates = max_templates
+        self._templates: "OrderedDict[str, CompiledTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # 통계 카운터
+        self.hits = 0
+        self.parses = 0
+
+    def get(self, template_file: str) -> CompiledTemplate:
+        """템플릿 반환 (파일이 바뀌었거나 처음이면 다시 파싱)"""
+        path = os.path.abspath(template_file)
+        stat = os.stat(path)
+
+        with self._lock:
+            template = self._templates.get(path)
+            if (
+                template is not None
+                and template.mtime_ns == stat.st_mtime_ns
+                and template.size == stat.st_size
+            ):
+                self._templates.move_to_end(path)
+                self.hits += 1
+                return template
+
+            template = CompiledTemplate(path, stat.st_mtime_ns, stat.st_size)
+            self._templates[path] = template
+            self._templates.move_to_end(path)
+            self.parses += 1
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+
+        logger.debug(
+            "TemplateCache",
+            f"템플릿 파싱: {path} ({template.rows}행 x {template.cols}열)",
+        )
+        return template
+
+    def clear(self):
+        """캐시 비우기 (통계는 유지)"""
+        with self._lock:
+            self._templates.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """캐시 통계 반환"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "parses": self.parses,
+                "templates": len(self._templates),
+            }
+
+    def log_stats(self, module: str = "TemplateCache"):
+        """캐시 통계를 로그 서비스에 기록"""
+        stats = self.get_stats()
+        logger.info(
+            module,
+            f"템플릿 캐시 - 적중: {stats['hits']}, 파싱: {stats['parses']}, "
+            f"보관: {stats['templates']}개",
+        )
+
+
+# 전역 템플릿 캐시 인스턴스
+template_cache = TemplateCache()
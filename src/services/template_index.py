@@ -0,0 +1,216 @@
+import hashlib
+import json
+import os
+import sys
+import threading
+import zipfile
+from dataclasses import asdict, dataclass
+from typing import Dict, Optional
+
+from lxml import etree
+
+from src.services.log_service import logger
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _twips_to_mm(twips: float) -> float:
+    """twip(1/1440 인치)을 mm로 변환"""
+    return twips / 1440.0 * 25.4
+
+
+def _int_attr(element, *names) -> Optional[int]:
+    """여러 속성명 중 처음 찾은 값을 정수로 반환 (없거나 잘못된 값이면 None)"""
+    if element is None:
+        return None
+    for name in names:
+        value = element.get(name)
+        if value:
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+@dataclass
+class TemplateMetadata:
+    """라벨 템플릿 정보 (첫 번째 테이블과 첫 구역 기준, 길이는 mm)"""
+
+    rows: int = 0
+    cols: int = 0
+    cell_width_mm: float = 0.0
+    cell_height_mm: float = 0.0
+    page_width_mm: float = 0.0
+    page_height_mm: float = 0.0
+    margin_top_mm: float = 0.0
+    margin_bottom_mm: float = 0.0
+    margin_left_mm: float = 0.0
+    margin_right_mm: float = 0.0
+
+    @property
+    def labels_per_page(self) -> int:
+        return self.rows * self.cols
+
+    @property
+    def cell_size_mm(self):
+        return (self.cell_width_mm, self.cell_height_mm)
+
+
+def probe_template(path: str) -> TemplateMetadata:
+    """docx 패키지 전체를 열지 않고 word/document.xml만 읽어 템플릿 정보 추출
+
+    계산 방식은 WordService.get_cell_size_mm과 같다 (열 너비는 gridCol 평균,
+    행 높이는 첫 행 trHeight, 없으면 모든 행 trHeight 평균).
+    """
+    with zipfile.ZipFile(path) as package:
+        root = etree.fromstring(package.read("word/document.xml"))
+
+    meta = TemplateMetadata()
+    body = root.find(f"{_W}body")
+    if body is None:
+        return meta
+
+    tbl = body.find(f"{_W}tbl")
+    if tbl is not None:
+        rows = tbl.findall(f"{_W}tr")
+        grid_cols = tbl.findall(f"{_W}tblGrid/{_W}gridCol")
+        meta.rows = len(rows)
+        meta.cols = len(grid_cols)
+
+        col_vals = [
+            v for v in (_int_attr(gc, f"{_W}w", "w", "val") for gc in grid_cols) if v
+        ]
+        if col_vals:
+            meta.cell_width_mm = round(_twips_to_mm(sum(col_vals) / len(col_vals)), 2)
+
+        heights = [
+            _int_attr(tr.find(f"{_W}trPr/{_W}trHeight"), "val", f"{_W}val", "w")
+            for tr in rows
+        ]
+        if heights and heights[0]:
+            meta.cell_height_mm = round(_twips_to_mm(heights[0]), 2)
+        else:
+            valid = [h for h in heights if h]
+            if valid:
+                meta.cell_height_mm = round(_twips_to_mm(sum(valid) / len(valid)), 2)
+
+    sect_pr = body.find(f"{_W}sectPr")
+    if sect_pr is not None:
+        pg_sz = sect_pr.find(f"{_W}pgSz")
+        pg_mar = sect_pr.find(f"{_W}pgMar")
+        for attr, element, name in (
+            ("page_width_mm", pg_sz, "w"),
+            ("page_height_mm", pg_sz, "h"),
+            ("margin_top_mm", pg_mar, "top"),
+            ("margin_bottom_mm", pg_mar, "bottom"),
+            ("margin_left_mm", pg_mar, "left"),
+            ("margin_right_mm", pg_mar, "right"),
+        ):
+            value = _int_attr(element, f"{_W}{name}")
+            if value is not None:
+                setattr(meta, attr, round(_twips_to_mm(value), 2))
+
+    return meta
+
+
+class TemplateIndex:
+    """디스크에 저장되는 템플릿 정보 색인 (파일 해시 + 수정 시각 기준)
+
+    - 수정 시각과 크기가 같으면 파일을 읽지 않고 저장된 값을 사용
+    - 수정 시각만 바뀌고 내용 해시가 같으면 다시 분석하지 않음
+    """
+
+    INDEX_NAME = "template_index.json"
+    VERSION = 1
+
+    def __init__(self, index_path: Optional[str] = None):
+        self.index_path = index_path or self._default_index_path()
+        self._entries: Dict[str, Dict] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _default_index_path(self) -> str:
+        """실행 파일(exe) 또는 스크립트 위치의 cache 폴더"""
+        if getattr(sys, "frozen", False):
+            base_path = os.path.dirname(sys.executable)
+        else:
+            base_path = os.path.abspath(".")
+        return os.path.join(base_path, "cache", self.INDEX_NAME)
+
+    def _load(self):
+        self._loaded = True
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self._entries = data.get("templates", {})
+            logger.debug("TemplateIndex", f"템플릿 색인 로드: {len(self._entries)}개")
+        except Exception as e:
+            logger.warning("TemplateIndex", f"템플릿 색인 로드 실패, 새로 생성: {e}")
+            self._entries = {}
+
+    def _save(self):
+        """임시 파일에 쓴 뒤 교체 (저장 중 종료되어도 기존 색인 유지)"""
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            tmp_path = self.index_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": self.VERSION, "templates": self._entries},
+                    f,
+                    ensure_ascii=False,
+                    indent=1,
+                )
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            logger.warning("TemplateIndex", f"템플릿 색인 저장 실패: {e}")
+
+    @staticmethod
+    def _file_hash(path: str) -> str:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+    def get(self, template_path: str) -> TemplateMetadata:
+        """템플릿 정보 반환 (색인에 없거나 파일이 바뀌었으면 분석 후 저장)"""
+        path = os.path.abspath(template_path)
+        stat = os.stat(path)
+
+        with self._lock:
+            if not self._loaded:
+                self._load()
+
+            entry = self._entries.get(path)
+            if (
+                entry
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                return TemplateMetadata(**entry["meta"])
+
+            file_hash = self._file_hash(path)
+            if entry and entry["hash"] == file_hash:
+                # 내용은 같고 수정 시각만 바뀐 경우
+                meta = TemplateMetadata(**entry["meta"])
+            else:
+                meta = probe_template(path)
+                logger.info(
+                    "TemplateIndex",
+                    f"템플릿 분석: {os.path.basename(path)} "
+                    f"({meta.rows}행 x {meta.cols}열, 셀 {meta.cell_width_mm}x{meta.cell_height_mm}mm)",
+                )
+
+            self._entries[path] = {
+                "hash": file_hash,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "meta": asdict(meta),
+            }
+            self._save()
+            return meta
+
+
+# 전역 템플릿 색인 인스턴스
+template_index = TemplateIndex()
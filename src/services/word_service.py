@@ -1,15 +1,207 @@
+import copy
 import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
 from docx import Document
-from docx.shared import Inches, RGBColor, Pt
+from docx.shared import Inches, RGBColor, Pt, Mm
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.text.run import Run
 from docx.oxml.shared import OxmlElement, qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.oxml.shape import CT_Inline
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.image.image import Image
+from docx.parts.image import ImagePart
 from typing import List, Tuple
 from io import BytesIO
 from src.services.log_service import logger
+from src.services.barcode_generator import BarcodeRasterizer
+from src.services.template_cache import template_cache
+from src.services.template_index import template_index
+from src.services.docx_stream_writer import StreamingDocxWriter
+from src.models.label_runs import LabelRuns, as_label_runs
+
+# DrawingML 벡터 바코드용 도형 네임스페이스 (python-docx nsmap에 없음)
+_NS_WPS = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
+# 도형을 지원하지 않는 프로그램용 대체 그림을 함께 넣는 호환성 네임스페이스
+_NS_MC = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+
+class LabelFillPlan:
+    """라벨 셀 채우기 계획: 셀 문단 원형을 한 번 만들어 두고 라벨마다 복제
+
+    원형은 기존 python-docx 셀 채우기 코드를 임시 페이지의 한 셀에 한 번 실행해 만든다.
+    따라서 복제 결과는 셀마다 python-docx API로 채운 결과와 같은 XML이 된다.
+    """
+
+    def __init__(self, template, font_name: str, text_font_size: float):
+        doc = template.new_document()
+        cell = doc.tables[0].cell(0, 0)
+        tc = cell._tc
+
+        # 바코드 문단(빈 run + 바코드 run) + 상품명/가격 문단
+        cell.text = ""
+        p1 = cell.paragraphs[0]
+        p1.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        p1.add_run()
+        p2 = cell.add_paragraph()
+        p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        self._add_info_runs(p2, font_name, text_font_size, bordered=True)
+        self.barcode_paragraph, self.info_paragraph = [copy.deepcopy(p) for p in tc.p_lst]
+
+        # 바코드 이미지가 없을 때: 상품명/가격 + 바코드 번호 문단
+        cell.text = ""
+        p = cell.paragraphs[0]
+        p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        self._add_info_runs(p, font_name, text_font_size, bordered=False)
+        code_run = p.add_run()
+        code_run.font.size = Inches(text_font_size * 0.8)
+        code_run.font.name = font_name
+        self.text_paragraph = copy.deepcopy(tc.p_lst[0])
+
+        # 빈 셀
+        cell.text = ""
+        self.empty_paragraph = copy.deepcopy(tc.p_lst[0])
+
+    @staticmethod
+    def _add_info_runs(paragraph, font_name: str, text_font_size: float, bordered: bool):
+        """상품명, 공백, 가격 run 서식 원형 추가 (텍스트는 채울 때 설정)"""
+        for text in ("", " ", ""):
+            run = paragraph.add_run(text)
+            run.font.size = Inches(text_font_size)
+            run.font.name = font_name
+        price_run = paragraph.runs[-1]
+        price_run.font.bold = True
+
+        if bordered:
+            # 글자 테두리 설정
+            rPr = price_run._element.get_or_add_rPr()
+            bdr = OxmlElement('w:bdr')
+            bdr.set(qn('w:val'), 'single')
+            bdr.set(qn('w:sz'), '4')
+            bdr.set(qn('w:space'), '0')
+            bdr.set(qn('w:color'), '000000')
+            rPr.append(bdr)
+
+    def fill_label(self, tc, name: str, price: str):
+        """셀을 바코드 문단 + 상품명/가격 문단으로 채우고 바코드용 w:r 요소 반환"""
+        tc.clear_content()
+        p1 = copy.deepcopy(self.barcode_paragraph)
+        p2 = copy.deepcopy(self.info_paragraph)
+        name_r, _, price_r = p2.r_lst
+        name_r.text = name
+        price_r.text = f"{price}₩"
+        tc.append(p1)
+        tc.append(p2)
+        return p1.r_lst[-1]
+
+    def fill_text_only(self, tc, name: str, price: str, code: str):
+        """바코드 이미지 없이 상품명/가격/바코드 번호만 채우기"""
+        tc.clear_content()
+        p = copy.deepcopy(self.text_paragraph)
+        # cell.text = "" 로 생긴 맨 앞의 빈 run 다음에 상품명/공백/가격/번호 run
+        name_r, _, price_r, code_r = p.r_lst[-4:]
+        name_r.text = name
+        price_r.text = f"{price}₩"
+        code_r.text = f"\n{code}"
+        tc.append(p)
+
+    def fill_empty(self, tc):
+        """빈 셀로 만들기"""
+        tc.clear_content()
+        tc.append(copy.deepcopy(self.empty_paragraph))
+
+
+class PictureRegistry:
+    """문서 하나의 바코드 이미지 등록부 (코드별 이미지 파트/관계를 한 번만 만들고 재사용)
+
+    python-docx add_picture()는 배치할 때마다 이미지를 다시 읽고 해시/헤더를 분석하며,
+    이미지 파트 번호와 도형 ID를 찾으려고 문서 전체를 훑는다. 여기서는 코드마다 한 번
+    등록해 rId와 EMU 크기를 담은 w:drawing 원형을 만들어 두고, 배치 시에는 원형을
+    복제해 도형 ID만 바꿔 넣는다.
+    """
+
+    def __init__(self, doc, width, height, image_cache: dict):
+        self.doc = doc
+        self.width = width
+        self.height = height
+        # WordService 공유 캐시: 코드 → (원본 데이터, 분석된 docx Image)
+        self._image_cache = image_cache
+        self._image_parts = doc.part.package.image_parts
+        # 템플릿에 이미 있는 이미지 파트 번호는 건너뜀
+        self._used_numbers = {part.partname.idx for part in self._image_parts}
+        self._next_number = 1
+        self._rels = doc.part.rels
+        self._next_rid_number = 1
+        # 코드 → w:drawing 원형, 이미지 sha1 → rId (같은 이미지는 관계 하나만 사용)
+        self._drawings = {}
+        self._rids = {}
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._drawings
+
+    def _load_image(self, code: str, barcode_data):
+        """원본 데이터의 docx Image 반환 (같은 원본이면 헤더를 다시 분석하지 않음)"""
+        cached = self._image_cache.get(code)
+        if cached is not None and cached[0] is barcode_data:
+            return cached[1]
+        if not isinstance(barcode_data, str):
+            # BytesIO 메모리 버퍼인 경우
+            barcode_data.seek(0)
+        image = Image.from_file(barcode_data)
+        self._image_cache[code] = (barcode_data, image)
+        return image
+
+    def _next_partname(self, ext: str) -> PackURI:
+        while self._next_number in self._used_numbers:
+            self._next_number += 1
+        number = self._next_number
+        self._used_numbers.add(number)
+        return PackURI(f"/word/media/image{number}.{ext}")
+
+    def _next_rid(self) -> str:
+        """비어 있는 가장 작은 rId (relate_to()처럼 기존 관계 전체를 매번 비교하지 않음)"""
+        while f"rId{self._next_rid_number}" in self._rels:
+            self._next_rid_number += 1
+        return f"rId{self._next_rid_number}"
+
+    def register(self, code: str, barcode_data):
+        """바코드 이미지를 문서에 등록하고 w:drawing 원형 보관"""
+        image = self._load_image(code, barcode_data)
+        rId = self._rids.get(image.sha1)
+        if rId is None:
+            image_part = ImagePart.from_image(image, self._next_partname(image.ext))
+            self._image_parts.append(image_part)
+            rId = self._next_rid()
+            self._rels.add_relationship(RT.IMAGE, image_part, rId)
+            self._rids[image.sha1] = rId
+        cx, cy = image.scaled_dimensions(self.width, self.height)
+        drawing = OxmlElement('w:drawing')
+        drawing.append(CT_Inline.new_pic_inline(0, rId, image.filename, cx, cy))
+        self._drawings[code] = drawing
+
+    def drawing(self, code: str, shape_id: int):
+        """등록된 drawing 원형을 복제해 도형 ID를 부여한 w:drawing 요소 반환"""
+        drawing = copy.deepcopy(self._drawings[code])
+        doc_pr = drawing.find('.//' + qn('wp:docPr'))
+        doc_pr.set('id', str(shape_id))
+        doc_pr.set('name', f"Picture {shape_id}")
+        return drawing
+
+    def place(self, r, code: str, shape_id: int):
+        """등록된 drawing 원형을 복제해 도형 ID를 부여하고 실행(w:r)에 추가"""
+        r.append(self.drawing(code, shape_id))
+
 
 class WordService:
     """Word 문서 생성 서비스"""
     
+    # 통합 문서가 이 페이지 수 이상이면 본문을 메모리에 모으지 않고 zip에 바로 기록
+    STREAM_PAGE_THRESHOLD = 100
+    # 템플릿에서 라벨 칸 수를 알 수 없을 때 사용하는 한 페이지당 라벨 수
+    DEFAULT_LABELS_PER_PAGE = 78
+    
     def __init__(self, template_file: str = "3677.docx"):
         self.template_file = template_file
         # 바코드 크기 (MM 단위로 통일)
@@ -18,6 +210,24 @@ class WordService:
         self.text_font_size = 0.08
         self.font_name = "맑은 고딕"
         self.highlight_color = RGBColor(255, 255, 0)
+        # 바코드 출력 방식: "image" (PNG 삽입) 또는 "vector" (DrawingML 도형)
+        self.barcode_mode = "image"
+        # 벡터 모드에서 wps 도형을 지원하지 않는 프로그램용 래스터 대체 그림 포함 여부
+        self.vector_fallback = False
+        self._module_patterns = {}
+        # 벡터 모드 대체 그림: 바코드 코드 → 막대만 그린 PNG 바이트
+        self._fallback_images = {}
+        # (템플릿, 수정 시각, 글꼴, 글자 크기) → LabelFillPlan
+        self._fill_plans = {}
+        self.stream_page_threshold = self.STREAM_PAGE_THRESHOLD
+        # 개별 문서 생성 시 프로세스 풀 사용 여부 및 작업 프로세스 수
+        self.parallel = False
+        self.parallel_workers = None
+        # 여러 상품을 한 시트에 이어서 배치 (개별 파일 모드) 및 상품 사이 빈 칸 수
+        self.pack_products = False
+        self.product_gap = 0
+        # 바코드 코드 → (원본 데이터, 분석된 docx Image) - 문서가 바뀌어도 헤더 분석은 한 번
+        self._docx_images = {}
     
     def set_barcode_size_mm(self, width_mm: float, height_mm: float):
         """바코드 크기를 MM 단위로 설정"""
@@ -25,140 +235,307 @@ class WordService:
         self.barcode_height_mm = height_mm
         logger.info("WordService", f"바코드 크기 설정: {width_mm:.1f}mm x {height_mm:.1f}mm")
     
+    def set_barcode_mode(self, mode: str, fallback: bool = False):
+        """바코드 출력 방식 설정 ("image" 또는 "vector")
+
+        fallback은 벡터 모드에서만 쓰이며, 켜면 코드마다 래스터 대체 그림 파트가 하나씩
+        문서에 들어가 파일이 커지는 대신 wps 도형을 모르는 프로그램에서도 바코드가 보인다.
+        """
+        self.barcode_mode = "vector" if mode == "vector" else "image"
+        self.vector_fallback = self.barcode_mode == "vector" and bool(fallback)
+        logger.info(
+            "WordService",
+            f"바코드 출력 방식: {self.barcode_mode}"
+            + (" (대체 이미지 포함)" if self.vector_fallback else ""),
+        )
+    
+    def set_parallel(self, enabled: bool, workers: int = None):
+        """개별 문서 생성 시 페이지를 여러 프로세스에서 나눠 생성할지 설정"""
+        self.parallel = bool(enabled)
+        self.parallel_workers = workers
+        logger.info("WordService", f"병렬 문서 생성: {'사용' if self.parallel else '사용 안 함'}")
+    
+    def set_packing(self, enabled: bool, gap_cells: int = 0):
+        """상품이 바뀌어도 새 시트를 시작하지 않고 이어서 배치할지와 상품 사이 빈 칸 수 설정"""
+        self.pack_products = enabled
+        self.product_gap = max(0, int(gap_cells or 0))
+    
+    def _worker_config(self) -> dict:
+        """작업 프로세스에서 같은 설정의 WordService를 만들기 위한 값"""
+        return {
+            "template_file": self.template_file,
+            "barcode_width_mm": self.barcode_width_mm,
+            "barcode_height_mm": self.barcode_height_mm,
+            "text_font_size": self.text_font_size,
+            "font_name": self.font_name,
+            "barcode_mode": self.barcode_mode,
+            "vector_fallback": self.vector_fallback,
+        }
+    
+    def _get_module_pattern(self, code: str) -> str:
+        """Code128 모듈 비트 패턴 반환 (코드별 1회만 인코딩)"""
+        if code not in self._module_patterns:
+            patterns = BarcodeRasterizer().encode_modules([code])
+            self._module_patterns[code] = patterns.get(code, "")
+        return self._module_patterns[code]
+    
+    def _build_vector_barcode(self, code: str, shape_id: int):
+        """바코드를 하나의 사용자 지정 도형 경로(custGeom)로 그린 인라인 DrawingML 요소 생성"""
+        pattern = self._get_module_pattern(code)
+        if not pattern:
+            return None
+        
+        # 좌우 여백(quiet zone) 10모듈 포함, 경로 좌표 단위 = 1모듈
+        quiet_modules = 10
+        path_w = len(pattern) + quiet_modules * 2
+        
+        # 연속된 막대를 하나의 사각형으로 합쳐 경로 생성
+        segments = []
+        x = 0
+        while x < len(pattern):
+            if pattern[x] == "1":
+                start = x
+                while x < len(pattern) and pattern[x] == "1":
+                    x += 1
+                left = start + quiet_modules
+                right = x + quiet_modules
+                segments.append(
+                    f'<a:moveTo><a:pt x="{left}" y="0"/></a:moveTo>'
+                    f'<a:lnTo><a:pt x="{right}" y="0"/></a:lnTo>'
+                    f'<a:lnTo><a:pt x="{right}" y="1"/></a:lnTo>'
+                    f'<a:lnTo><a:pt x="{left}" y="1"/></a:lnTo>'
+                    f'<a:close/>'
+                )
+            else:
+                x += 1
+        
+        # 텍스트 줄을 위해 바코드 높이의 70%만 막대로 사용
+        cx = int(Mm(self.barcode_width_mm))
+        cy = int(Mm(self.barcode_height_mm * 0.7))
+        
+        xml = (
+            f'<w:drawing {nsdecls("w", "wp", "a")} xmlns:wps="{_NS_WPS}">'
+            f'<wp:inline distT="0" distB="0" distL="0" distR="0">'
+            f'<wp:extent cx="{cx}" cy="{cy}"/>'
+            f'<wp:docPr id="{shape_id}" name="Barcode {shape_id}"/>'
+            f'<a:graphic><a:graphicData uri="{_NS_WPS}">'
+            f'<wps:wsp><wps:cNvSpPr/><wps:spPr>'
+            f'<a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+            f'<a:custGeom><a:avLst/><a:gdLst/><a:ahLst/><a:cxnLst/>'
+            f'<a:rect l="0" t="0" r="r" b="b"/>'
+            f'<a:pathLst><a:path w="{path_w}" h="1">{"".join(segments)}</a:path></a:pathLst>'
+            f'</a:custGeom>'
+            f'<a:solidFill><a:srgbClr val="000000"/></a:solidFill>'
+            f'<a:ln><a:noFill/></a:ln>'
+            f'</wps:spPr><wps:bodyPr/></wps:wsp>'
+            f'</a:graphicData></a:graphic>'
+            f'</wp:inline></w:drawing>'
+        )
+        return parse_xml(xml)
+    
+    def _fallback_image(self, code: str) -> BytesIO:
+        """벡터 바코드와 같은 크기로 막대만 래스터화한 대체 그림 PNG (코드별 1회만 생성)"""
+        data = self._fallback_images.get(code)
+        if data is None:
+            rasterizer = BarcodeRasterizer({
+                "dpi": 300,
+                "write_text": False,
+                "target_width": self.barcode_width_mm,
+                "target_height": self.barcode_height_mm * 0.7,
+            })
+            data = rasterizer.rasterize([code])[code].getvalue()
+            self._fallback_images[code] = data
+        return BytesIO(data)
+    
+    def _add_vector_barcode(self, run, code: str, shape_id: int,
+                            pictures: PictureRegistry) -> bool:
+        """셀 문단의 run에 벡터 바코드와 바코드 번호 텍스트 추가
+
+        vector_fallback이 켜져 있으면 Word처럼 mc:AlternateContent로 감싸 wps 도형을
+        지원하지 않는 프로그램에는 같은 크기의 래스터 바코드(mc:Fallback)가 보이게 한다.
+        대체 그림은 코드당 이미지 파트 하나만 등록하며 도형 ID는 도형과 같은 값을 쓴다.
+        """
+        drawing = self._build_vector_barcode(code, shape_id)
+        if drawing is None:
+            return False
+        if not self.vector_fallback:
+            run._r.append(drawing)
+            self._add_barcode_text(run, code)
+            return True
+        if code not in pictures:
+            pictures.register(code, self._fallback_image(code))
+        fallback = pictures.drawing(code, shape_id)
+        # 대체 그림 크기를 벡터 도형 크기와 맞춤
+        extent = drawing.find('.//' + qn('wp:extent'))
+        for ext in (fallback.find('.//' + qn('wp:extent')), fallback.find('.//' + qn('a:ext'))):
+            ext.set('cx', extent.get('cx'))
+            ext.set('cy', extent.get('cy'))
+        
+        alternate = parse_xml(
+            f'<mc:AlternateContent xmlns:mc="{_NS_MC}" xmlns:wps="{_NS_WPS}">'
+            f'<mc:Choice Requires="wps"/><mc:Fallback/>'
+            f'</mc:AlternateContent>'
+        )
+        choice, fallback_slot = alternate
+        choice.append(drawing)
+        fallback_slot.append(fallback)
+        run._r.append(alternate)
+        self._add_barcode_text(run, code)
+        return True
+    
+    def _add_barcode_text(self, run, code: str):
+        """벡터 바코드 아래 줄에 바코드 번호 텍스트 추가"""
+        run.add_break()
+        run.add_text(code)
+        run.font.size = Inches(self.text_font_size * 0.8)
+        run.font.name = self.font_name
+    
+    def _get_fill_plan(self, template) -> LabelFillPlan:
+        """템플릿과 현재 글꼴 설정에 맞는 셀 채우기 계획 반환 (한 번만 생성)"""
+        key = (template.path, template.mtime_ns, template.size, self.font_name, self.text_font_size)
+        plan = self._fill_plans.get(key)
+        if plan is None:
+            plan = LabelFillPlan(template, self.font_name, self.text_font_size)
+            self._fill_plans[key] = plan
+        return plan
+    
     def _mm_to_inches(self, mm: float) -> float:
         """MM를 인치로 변환"""
         return mm / 25.4
     
+    def _new_picture_registry(self, doc) -> PictureRegistry:
+        """문서별 바코드 이미지 등록부 생성"""
+        return PictureRegistry(
+            doc,
+            Inches(self._mm_to_inches(self.barcode_width_mm)),
+            Inches(self._mm_to_inches(self.barcode_height_mm)),
+            self._docx_images,
+        )
+    
+    def _register_pictures(self, doc, items: LabelRuns,
+                           barcode_images: dict) -> PictureRegistry:
+        """사용할 바코드 이미지를 문서 파트에 미리 한 번씩 등록한 등록부 반환"""
+        pictures = self._new_picture_registry(doc)
+        vector_mode = self.barcode_mode == "vector"
+        for _, _, _, code in items.distinct():
+            if code in pictures:
+                continue
+            if vector_mode:
+                # 벡터 모드는 대체 그림을 켠 경우에만 mc:Fallback용 래스터 그림 등록
+                if self.vector_fallback and self._get_module_pattern(code):
+                    pictures.register(code, self._fallback_image(code))
+            elif code in barcode_images:
+                pictures.register(code, barcode_images[code])
+        return pictures
+    
+    def _fill_page(self, doc, cells: list, items_for_page: LabelRuns,
+                   barcode_images: dict, plan: LabelFillPlan, next_shape_id: int,
+                   pictures: PictureRegistry) -> int:
+        """라벨 칸 순서의 셀 요소들을 채우고 다음 도형 ID 반환
+
+        라벨 구간은 여기서 칸을 채우며 하나씩 펼친다. 이미지는 pictures(문서별 등록부)에 코드당 한 번만 등록되고, 배치할 때는
+        등록된 drawing을 복제해 도형 ID만 바꿔 사용한다.
+        """
+        vector_mode = self.barcode_mode == "vector"
+        labels = iter(items_for_page)
+        for tc in cells:
+            item = next(labels, None)
+            if item is None:
+                # 빈 셀 처리 (페이지 끝 또는 상품 사이 간격)
+                plan.fill_empty(tc)
+                continue
+            
+            name, price, category, code = item
+            
+            # 메모리에서 바코드 이미지 가져오기 (벡터 모드는 이미지 불필요)
+            if not (vector_mode or code in barcode_images):
+                logger.warning("WordService", f"바코드 이미지를 찾을 수 없음: {code}")
+                # 바코드 이미지가 없어도 텍스트 정보는 추가
+                plan.fill_text_only(tc, name, price, code)
+                continue
+            
+            # 바코드 문단(맨 위, 중앙 정렬) + 상품명/가격 문단
+            run1 = Run(plan.fill_label(tc, name, price), doc)
+            
+            if vector_mode:
+                # 벡터 바코드 (DrawingML 도형, 설정 시 래스터 대체 그림 포함)
+                if self._add_vector_barcode(run1, code, next_shape_id, pictures):
+                    next_shape_id += 1
+                else:
+                    logger.warning("WordService", f"벡터 바코드 생성 실패: {code}")
+                    run1.add_text(code)
+            else:
+                if code not in pictures:
+                    # 처음 배치되는 코드만 이미지 파트 등록
+                    pictures.register(code, barcode_images[code])
+                pictures.place(run1._r, code, next_shape_id)
+                next_shape_id += 1
+        
+        return next_shape_id
+    
+    @staticmethod
+    def _renumber_shapes(elements: list, next_shape_id: int) -> int:
+        """복제한 페이지 요소들의 도형 ID(wp:docPr)를 새로 부여하고 다음 ID 반환
+
+        mc:Fallback 안의 대체 그림은 바로 앞 mc:Choice 도형과 같은 ID를 유지한다.
+        """
+        fallback_tag = f"{{{_NS_MC}}}Fallback"
+        for element in elements:
+            for doc_pr in element.iter(qn('wp:docPr')):
+                is_fallback = any(parent.tag == fallback_tag for parent in doc_pr.iterancestors())
+                shape_id = next_shape_id - 1 if is_fallback else next_shape_id
+                prefix = (doc_pr.get('name') or "").rsplit(' ', 1)[0] or "Picture"
+                doc_pr.set('id', str(shape_id))
+                doc_pr.set('name', f"{prefix} {shape_id}")
+                if not is_fallback:
+                    next_shape_id += 1
+        return next_shape_id
+    
     def create_label_page(self, items_for_page: List[Tuple[str, str, str, str]], 
-                         page_name: str, barcode_images: dict, output_dir: str = "output") -> bool:
-        """한 페이지 분량의 라벨을 생성하고 파일로 저장"""
+                         page_name: str, barcode_images: dict, output_dir: str = "output",
+                         page_memo: dict = None) -> bool:
+        """한 페이지 분량의 라벨을 생성하고 파일로 저장
+
+        items_for_page는 펼친 라벨 목록 또는 LabelRuns이다. page_memo를 넘기면 직전
+        페이지와 라벨 구성이 같을 때 다시 만들지 않고 직전에 저장한 파일을 복사한다.
+        """
+        items_for_page = as_label_runs(items_for_page)
         try:
             # 출력 디렉토리 생성
             if not os.path.exists(output_dir):
                 os.makedirs(output_dir)
             
+            # 파일명에서 특수문자 제거
+            safe_name = "".join(c for c in page_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
+            filename = os.path.join(output_dir, f"{safe_name}_label.docx")
             
-            # 새 문서 생성 (템플릿 복사)
-            page_doc = Document(self.template_file)
-            
-            # 첫 번째 테이블 찾기
-            page_table = None
-            for tbl in page_doc.tables:
-                page_table = tbl
-                break
+            page_key = items_for_page.key()
+            if page_memo is not None and page_memo.get("key") == page_key:
+                previous = page_memo["filename"]
+                if previous != filename and os.path.exists(previous):
+                    shutil.copyfile(previous, filename)
+                    logger.info("WordService", f"페이지 저장 완료 (동일 페이지 복사): {filename} ({items_for_page.label_count}개 라벨)")
+                    return True
             
-            if page_table is None:
+            # 새 문서 생성 (한 번 파싱한 템플릿을 메모리에서 복제)
+            template = template_cache.get(self.template_file)
+            if not template.has_table:
                 logger.error("WordService", "템플릿에서 테이블을 찾을 수 없습니다!")
                 return False
             
-            # 테이블 채우기
-            item_idx = 0
-            for r in range(len(page_table.rows)):
-                for c in range(len(page_table.columns)):
-                    if item_idx < len(items_for_page):
-                        name, price, category, code = items_for_page[item_idx]
-                        
-                        # 메모리에서 바코드 이미지 가져오기
-                        if code in barcode_images:
-                            cell = page_table.cell(r, c)
-                            
-                            # 기존 내용 지우기
-                            cell.text = ""
-                            
-                            # 바코드 이미지 추가 (맨 위, 중앙 정렬)
-                            p1 = cell.paragraphs[0]
-                            p1.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            run1 = p1.add_run()
-                            
-                            # 바코드 이미지 가져오기 (파일 경로 또는 메모리 버퍼)
-                            barcode_data = barcode_images[code]
-                            
-                            if isinstance(barcode_data, str):
-                                # 파일 경로인 경우
-                                run1.add_picture(barcode_data, 
-                                               width=Inches(self._mm_to_inches(self.barcode_width_mm)), 
-                                               height=Inches(self._mm_to_inches(self.barcode_height_mm)))
-                            else:
-                                # BytesIO 메모리 버퍼인 경우
-                                barcode_data.seek(0)  # 버퍼 위치를 처음으로 리셋
-                                run1.add_picture(barcode_data, 
-                                               width=Inches(self._mm_to_inches(self.barcode_width_mm)), 
-                                               height=Inches(self._mm_to_inches(self.barcode_height_mm)))
-                            
-                            # 상품명과 가격을 위한 새 문단 추가
-                            p2 = cell.add_paragraph()
-                            p2.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            
-                            # 상품명 부분
-                            name_run = p2.add_run(name)
-                            name_run.font.size = Inches(self.text_font_size)
-                            name_run.font.name = self.font_name
-                            
-                            # 공백
-                            space_run = p2.add_run(" ")
-                            space_run.font.size = Inches(self.text_font_size)
-                            space_run.font.name = self.font_name
-                            
-                            # 가격 부분 (글자 테두리)
-                            price_run = p2.add_run(f"{price}₩")
-                            price_run.font.size = Inches(self.text_font_size)
-                            price_run.font.name = self.font_name
-                            price_run.font.bold = True
-                            
-                            # 글자 테두리 설정
-                            rPr = price_run._element.get_or_add_rPr()
-                            bdr = OxmlElement('w:bdr')
-                            bdr.set(qn('w:val'), 'single')
-                            bdr.set(qn('w:sz'), '4')
-                            bdr.set(qn('w:space'), '0')
-                            bdr.set(qn('w:color'), '000000')
-                            rPr.append(bdr)
-                            
-                            item_idx += 1
-                        else:
-                            logger.warning("WordService", f"바코드 이미지를 찾을 수 없음: {code}")
-                            # 바코드 이미지가 없어도 텍스트 정보는 추가
-                            cell = page_table.cell(r, c)
-                            cell.text = ""
-                            
-                            # 상품명과 가격만 추가
-                            p = cell.paragraphs[0]
-                            p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                            
-                            # 상품명 부분
-                            name_run = p.add_run(name)
-                            name_run.font.size = Inches(self.text_font_size)
-                            name_run.font.name = self.font_name
-                            
-                            # 공백
-                            space_run = p.add_run(" ")
-                            space_run.font.size = Inches(self.text_font_size)
-                            space_run.font.name = self.font_name
-                            
-                            # 가격 부분
-                            price_run = p.add_run(f"{price}₩")
-                            price_run.font.size = Inches(self.text_font_size)
-                            price_run.font.name = self.font_name
-                            price_run.font.bold = True
-                            
-                            # 바코드 번호도 표시
-                            code_run = p.add_run(f"\n{code}")
-                            code_run.font.size = Inches(self.text_font_size * 0.8)
-                            code_run.font.name = self.font_name
-                            
-                            item_idx += 1
-                    else:
-                        # 빈 셀 처리
-                        cell = page_table.cell(r, c)
-                        cell.text = ""
-            
-            # 파일명에서 특수문자 제거
-            safe_name = "".join(c for c in page_name if c.isalnum() or c in (' ', '-', '_')).rstrip()
-            filename = os.path.join(output_dir, f"{safe_name}_label.docx")
+            page_doc = template.new_document()
+            self._fill_page(
+                page_doc, template.page_cells(page_doc), items_for_page, barcode_images,
+                self._get_fill_plan(template), page_doc.part.next_id,
+                self._new_picture_registry(page_doc)
+            )
             
             # 파일 저장
             page_doc.save(filename)
-            logger.info("WordService", f"페이지 저장 완료: {filename} ({len(items_for_page)}개 라벨)")
+            logger.info("WordService", f"페이지 저장 완료: {filename} ({items_for_page.label_count}개 라벨)")
+            if page_memo is not None:
+                page_memo["key"] = page_key
+                page_memo["filename"] = filename
             return True
             
         except Exception as e:
@@ -169,6 +546,12 @@ class WordService:
         """
         Prints the number of rows and columns of the first table in a .docx file.
         """
+        # 저장된 템플릿 색인 사용 (바뀐 템플릿만 document.xml을 가볍게 분석)
+        try:
+            return template_index.get(template).labels_per_page
+        except Exception as e:
+            logger.warning("WordService", f"템플릿 색인 조회 실패, 문서 직접 분석: {e}")
+        
         try:
             document = Document(template)
             if not document.tables:
@@ -185,74 +568,209 @@ class WordService:
     
     def generate_label_documents(self, items: List[Tuple[str, str, str, str]], 
                                 barcode_images: dict, output_dir: str = "output") -> int:
-        """상품별로 그룹화하여 라벨 문서 생성"""
+        """상품별로 그룹화하여 라벨 문서 생성 (묶음 배치 모드에서는 여러 상품을 한 시트에)"""
         if not items:
             return 0
+        items = as_label_runs(items)
         
-        # 한 페이지당 라벨 수 (78개)
-        labels_per_page = 78
+        # 한 페이지당 라벨 수 (템플릿 라벨 칸 수)
+        labels_per_page = self._labels_per_page()
         
-        # 상품별로 그룹화하여 처리
-        current_product = None
-        current_items = []
-        total_files_created = 0
-        idx = 0
+        pages = self._collect_label_pages(items, labels_per_page)
+        print(f"라벨 시트 {len(pages)}장 생성 예정 (시트당 {labels_per_page}칸)")
+        # 이번 작업의 바코드 이미지로 새로 분석 (이전 작업 이미지 해제)
+        self._docx_images.clear()
         
-        while idx < len(items):
-            name, price, category, code = items[idx]
-            
-            # 새로운 상품이 시작되거나 현재 상품의 라벨이 78개에 도달한 경우
-            if current_product != name or len(current_items) >= labels_per_page:
-                # 이전 상품의 라벨들이 있으면 파일로 저장
-                if current_items:
-                    if self.create_label_page(current_items, current_product, barcode_images, output_dir):
-                        total_files_created += 1
-                    current_items = []
-                
-                current_product = name
-            
-            # 현재 아이템을 리스트에 추가
-            current_items.append((name, price, category, code))
-            idx += 1
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
         
-        # 마지막 상품 처리
-        if current_items:
-            if self.create_label_page(current_items, current_product, barcode_images, output_dir):
+        # 페이지는 서로 독립적이므로 병렬 모드에서는 작업 프로세스에 나눠서 생성
+        results = None
+        if self.parallel and len(pages) > 1:
+            results = self._create_pages_parallel(pages, barcode_images, output_dir)
+        if results is None:
+            # 같은 상품이 연속으로 여러 장이면 첫 장 파일을 복사해 사용
+            page_memo = {}
+            results = [
+                self.create_label_page(page_items, page_name, barcode_images, output_dir, page_memo)
+                for page_items, page_name in pages
+            ]
+        
+        # 결과는 입력 순서 그대로 (페이지별 실패 기록)
+        total_files_created = 0
+        for (page_items, page_name), created in zip(pages, results):
+            if created:
                 total_files_created += 1
+            else:
+                logger.warning("WordService", f"페이지 생성 실패: {page_name} ({page_items.label_count}개 라벨)")
         
         print(f"\n=== 작업 완료 ===")
         print(f"총 {total_files_created}개 파일 생성됨")
         print(f"총 {len(items)}개 라벨 처리됨")
+        template_cache.log_stats("WordService")
         
         return total_files_created
     
+    def _labels_per_page(self) -> int:
+        """현재 템플릿의 한 페이지당 라벨 칸 수 (알 수 없으면 기본값)"""
+        try:
+            labels_per_page = template_index.get(self.template_file).labels_per_page
+        except Exception as e:
+            logger.warning("WordService", f"템플릿 라벨 칸 수 확인 실패, 기본값 사용: {e}")
+            labels_per_page = 0
+        return labels_per_page or self.DEFAULT_LABELS_PER_PAGE
+    
+    def count_label_sheets(self, items: List[Tuple[str, str, str, str]],
+                           single_file: bool = False) -> int:
+        """현재 설정(템플릿, 묶음 배치, 상품 사이 간격)으로 생성될 시트 수 계산"""
+        if not items:
+            return 0
+        items = as_label_runs(items)
+        labels_per_page = self._labels_per_page()
+        if single_file:
+            cells = self._layout_label_cells(items, labels_per_page)
+            return (len(cells) + labels_per_page - 1) // labels_per_page
+        return len(self._collect_label_pages(items, labels_per_page))
+    
+    def _layout_label_cells(self, items: LabelRuns, labels_per_page: int) -> LabelRuns:
+        """상품이 바뀌는 곳에 빈 칸(None)을 넣은 라벨 칸 배치
+
+        간격은 묶음 배치 모드에서만 넣으며 (단일 파일/개별 파일 모드 동일), 시트 첫
+        칸에서는 넣지 않고 시트 끝을 넘는 부분은 버려 다음 상품이 새 시트 첫 칸부터
+        시작하게 한다.
+        """
+        if not (self.pack_products and self.product_gap):
+            return items
+        cells = LabelRuns()
+        current_product = None
+        for item, count in items.runs():
+            if current_product is not None and item[0] != current_product:
+                used = len(cells) % labels_per_page
+                if used:
+                    cells.append(None, min(self.product_gap, labels_per_page - used))
+            cells.append(item, count)
+            current_product = item[0]
+        return cells
+    
+    def _collect_label_pages(self, items: LabelRuns,
+                             labels_per_page: int) -> List[Tuple[LabelRuns, str]]:
+        """상품별로 묶어 (페이지 라벨 구간, 페이지 이름) 목록 구성
+
+        같은 상품의 두 번째 페이지부터는 이름에 번호를 붙여 파일이 서로 덮어쓰지 않게 한다.
+        묶음 배치 모드에서는 상품 경계와 관계없이 시트를 채운다.
+        """
+        pages = []
+        page_counts = {}
+        current_product = None
+        current_items = LabelRuns()
+        
+        def add_page(product_name, page_items):
+            page_index = page_counts.get(product_name, 0)
+            page_counts[product_name] = page_index + 1
+            pages.append((page_items, self._page_name(product_name, page_index)))
+        
+        if self.pack_products:
+            cells = self._layout_label_cells(items, labels_per_page)
+            for i in range(0, len(cells), labels_per_page):
+                page_items = cells.slice(i, i + labels_per_page)
+                add_page(self._packed_page_name(page_items), page_items)
+            return pages
+        
+        for item, count in items.runs():
+            # 새로운 상품이 시작되면 현재 페이지 마감
+            if current_product != item[0]:
+                if current_items:
+                    add_page(current_product, current_items)
+                    current_items = LabelRuns()
+                current_product = item[0]
+            
+            # 한 페이지를 넘는 수량은 페이지 단위로 나눔
+            while count:
+                if len(current_items) >= labels_per_page:
+                    add_page(current_product, current_items)
+                    current_items = LabelRuns()
+                take = min(count, labels_per_page - len(current_items))
+                current_items.append(item, take)
+                count -= take
+        
+        # 마지막 상품 처리
+        if current_items:
+            add_page(current_product, current_items)
+        
+        return pages
+    
+    @staticmethod
+    def _packed_page_name(page_items: LabelRuns) -> str:
+        """여러 상품이 섞인 시트 이름 (첫 상품명 + 나머지 상품 종류 수)"""
+        names = []
+        for item in page_items.distinct():
+            if item[0] not in names:
+                names.append(item[0])
+        if len(names) <= 1:
+            return names[0] if names else "라벨"
+        return f"{names[0]} 외 {len(names) - 1}종"
+    
+    @staticmethod
+    def _page_name(product_name: str, page_index: int) -> str:
+        return product_name if page_index == 0 else f"{product_name}_{page_index + 1}"
+    
+    def _create_pages_parallel(self, pages: List[Tuple[LabelRuns, str]], barcode_images: dict,
+                               output_dir: str):
+        """페이지 묶음을 프로세스 풀로 생성 (입력 순서대로 성공 여부 반환, 풀 실패 시 None)"""
+        workers = max(1, min(int(self.parallel_workers or os.cpu_count() or 1), len(pages)))
+        # 묶음 크기: 프로세스 간 전송 횟수를 줄이되 부하가 고르게 분산되도록
+        batch_size = max(1, -(-len(pages) // (workers * 4)))
+        config = self._worker_config()
+        
+        jobs = []
+        for i in range(0, len(pages), batch_size):
+            batch = pages[i:i + batch_size]
+            # 묶음에서 쓰는 바코드 이미지만 바이트로 전달
+            images = {}
+            for page_items, _ in batch:
+                for _, _, _, code in page_items.distinct():
+                    if code in images or code not in barcode_images:
+                        continue
+                    data = barcode_images[code]
+                    images[code] = data if isinstance(data, str) else data.getvalue()
+            jobs.append((config, batch, images, output_dir))
+        
+        try:
+            logger.info(
+                "WordService",
+                f"병렬 문서 생성 시작: {len(pages)}페이지, 묶음 {len(jobs)}개, 작업 프로세스 {workers}개",
+            )
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                batch_results = list(executor.map(_create_pages_worker, jobs))
+            results = [created for batch in batch_results for created in batch]
+            logger.info("WordService", f"병렬 문서 생성 완료: {sum(results)}/{len(results)}페이지")
+            return results
+        except Exception as e:
+            # pickle 실패, 프로세스 생성 실패(PyInstaller 환경 등) → 직렬 처리로 전환
+            logger.warning("WordService", f"병렬 문서 생성 실패, 직렬 모드로 전환: {e}")
+            return None
+    
     def generate_single_label_document(self, items: List[Tuple[str, str, str, str]], 
                                      barcode_images: dict, output_dir: str = "output") -> int:
         """모든 라벨을 하나의 문서로 생성 (모든 상품의 라벨을 순서대로 배치)"""
         if not items:
             return 0
+        items = as_label_runs(items)
         
         print(f"통합 문서 생성 시작 - 총 {len(items)}개 라벨")
+        self._docx_images.clear()
         
-        # 첫 번째 페이지 생성
-        pages_created = []
-        current_items = []
-        
-        # 템플릿에서 한 페이지당 라벨 수 계산
+        # 템플릿에서 한 페이지당 라벨 수 계산 (캐시된 템플릿 사용, 재파싱 없음)
         try:
-            template_doc = Document(self.template_file)
-            template_table = None
-            for tbl in template_doc.tables:
-                template_table = tbl
-                break
+            template = template_cache.get(self.template_file)
             
-            if template_table is None:
+            if not template.has_table:
                 print("템플릿에서 테이블을 찾을 수 없습니다!")
                 return 0
             
-            rows_per_page = len(template_table.rows)
-            cols_per_page = len(template_table.columns)
-            labels_per_page = rows_per_page * cols_per_page
+            rows_per_page = template.rows
+            cols_per_page = template.cols
+            labels_per_page = template.labels_per_page
             
             print(f"템플릿 정보: {rows_per_page}행 x {cols_per_page}열 = {labels_per_page}개 라벨/페이지")
             
@@ -260,62 +778,150 @@ class WordService:
             print(f"템플릿 분석 실패: {e}")
             return 0
         
-        # 라벨들을 페이지별로 나누어 처리
-        page_num = 1
-        for i in range(0, len(items), labels_per_page):
-            page_items = items[i:i + labels_per_page]
+        # 묶음 배치에서 상품 사이 간격 설정 시 빈 칸(None)이 들어간 배치
+        label_count = len(items)
+        items = self._layout_label_cells(items, labels_per_page)
+        page_count = (len(items) + labels_per_page - 1) // labels_per_page
+        print(f"라벨 시트 {page_count}장 생성 예정")
+        
+        from datetime import datetime
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        combined_filename = os.path.join(output_dir, f"통합_라벨_{timestamp}.docx")
+        
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        
+        if page_count >= self.stream_page_threshold:
+            # 대용량: 페이지 단위로 zip에 바로 기록 (메모리 사용량 일정)
+            return self._write_streaming_document(
+                template, items, barcode_images, combined_filename
+            )
+        
+        # 하나의 문서에 페이지(템플릿 테이블)를 이어 붙이며 메모리에서 직접 구성
+        try:
+            combined_doc = template.new_document()
+            body = combined_doc.element.body
+            sect_pr = body.find(qn('w:sectPr'))
+            plan = self._get_fill_plan(template)
+            next_shape_id = combined_doc.part.next_id
+            pictures = self._new_picture_registry(combined_doc)
             
-            # 각 페이지를 개별 파일로 생성
-            page_name = f"통합_라벨_페이지_{page_num}"
-            if self.create_label_page(page_items, page_name, barcode_images, output_dir):
-                pages_created.append(f"{page_name}_label.docx")
-                print(f"페이지 {page_num} 생성 완료 ({len(page_items)}개 라벨)")
+            # 직전 페이지 (라벨 구성, 채워진 본문 요소) - 같은 페이지 반복 시 복제해 사용
+            last_page = (None, None)
+            reused_pages = 0
             
-            page_num += 1
-        
-        # 생성된 페이지들을 하나의 문서로 합치기
-        if pages_created:
-            try:
-                # 첫 번째 문서를 기본으로 사용
-                first_page_path = os.path.join(output_dir, pages_created[0])
-                combined_doc = Document(first_page_path)
+            page_num = 1
+            for i in range(0, len(items), labels_per_page):
+                page_items = items.slice(i, i + labels_per_page)
+                page_key = page_items.key()
                 
-                # 나머지 페이지들을 추가
-                for page_file in pages_created[1:]:
-                    page_path = os.path.join(output_dir, page_file)
-                    page_doc = Document(page_path)
-                    
-                    # 페이지 나누기 추가
+                if page_num > 1:
                     combined_doc.add_page_break()
-                    
-                    # 페이지의 모든 요소를 복사
-                    for element in page_doc.element.body:
-                        combined_doc.element.body.append(element)
-                
-                # 통합 문서 저장
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                combined_filename = os.path.join(output_dir, f"통합_라벨_{timestamp}.docx")
-                combined_doc.save(combined_filename)
-                
-                # 임시 페이지 파일들 삭제
-                for page_file in pages_created:
-                    try:
-                        os.remove(os.path.join(output_dir, page_file))
-                    except:
-                        pass
                 
-                print(f"통합 라벨 문서 저장 완료: {combined_filename}")
-                print(f"총 {len(items)}개 라벨이 {len(pages_created)}페이지에 생성됨")
+                if page_num > 1 and last_page[0] == page_key:
+                    # 같은 라벨 구성: 채워진 직전 페이지를 복제하고 도형 ID만 새로 부여
+                    page_elements = [copy.deepcopy(e) for e in last_page[1]]
+                    for element in page_elements:
+                        if sect_pr is not None:
+                            sect_pr.addprevious(element)
+                        else:
+                            body.append(element)
+                    next_shape_id = self._renumber_shapes(page_elements, next_shape_id)
+                    reused_pages += 1
+                else:
+                    if page_num == 1:
+                        # 첫 페이지는 복제된 템플릿 본문을 그대로 사용
+                        page_elements = [e for e in body if e.tag != qn('w:sectPr')]
+                        cells = template.page_cells(combined_doc)
+                    else:
+                        # 템플릿 본문(sectPr 제외)을 문서 끝 sectPr 앞에 추가
+                        page_elements = template.clone_page_body()
+                        for element in page_elements:
+                            if sect_pr is not None:
+                                sect_pr.addprevious(element)
+                            else:
+                                body.append(element)
+                        page_tbl = next(e for e in page_elements if e.tag == qn('w:tbl'))
+                        cells = template.table_cells(page_tbl)
+                    
+                    # 같은 바코드 이미지는 문서 전체에서 한 번만 등록됨
+                    next_shape_id = self._fill_page(
+                        combined_doc, cells, page_items, barcode_images, plan, next_shape_id,
+                        pictures
+                    )
+                    last_page = (page_key, page_elements)
                 
-                return 1
+                print(f"페이지 {page_num} 생성 완료 ({page_items.label_count}개 라벨)")
+                page_num += 1
+            
+            if reused_pages:
+                logger.info("WordService", f"동일 페이지 재사용: {reused_pages}/{page_num - 1}페이지")
+            
+            # 통합 문서 저장 (마지막에 한 번만)
+            combined_doc.save(combined_filename)
+            
+            print(f"통합 라벨 문서 저장 완료: {combined_filename}")
+            print(f"총 {label_count}개 라벨이 {page_num - 1}페이지에 생성됨")
+            template_cache.log_stats("WordService")
+            
+            return 1
+            
+        except Exception as e:
+            print(f"통합 문서 생성 실패: {e}")
+            logger.error("WordService", f"통합 문서 생성 실패: {e}")
+            return 0
+
+    def _write_streaming_document(self, template, items: LabelRuns,
+                                  barcode_images: dict, filename: str) -> int:
+        """통합 문서를 페이지 단위로 채워 zip 스트림에 바로 기록 (items의 None은 빈 칸)"""
+        writer = StreamingDocxWriter(template, filename)
+        try:
+            labels_per_page = template.labels_per_page
+            plan = self._get_fill_plan(template)
+            
+            # 이미지는 시작 전에 한 번씩 등록 (zip에는 압축 없이 저장됨)
+            pictures = self._register_pictures(writer.document, items, barcode_images)
+            next_shape_id = writer.document.part.next_id
+            writer.open()
+            
+            # 직전 페이지 (라벨 구성, 채워진 본문 요소) - 기록이 끝난 요소라 그대로 재사용 가능
+            last_page = (None, None)
+            reused_pages = 0
+            
+            for i in range(0, len(items), labels_per_page):
+                page_items = items.slice(i, i + labels_per_page)
+                page_key = page_items.key()
                 
-            except Exception as e:
-                print(f"문서 합치기 실패: {e}")
-                # 실패 시 개별 페이지 파일들은 그대로 유지
-                return len(pages_created)
-        
-        return 0
+                if last_page[0] == page_key:
+                    # 같은 라벨 구성: 도형 ID만 새로 부여해 다시 기록
+                    page_elements = last_page[1]
+                    next_shape_id = self._renumber_shapes(page_elements, next_shape_id)
+                    reused_pages += 1
+                else:
+                    page_elements = template.clone_page_body()
+                    page_tbl = next(e for e in page_elements if e.tag == qn('w:tbl'))
+                    next_shape_id = self._fill_page(
+                        writer.document, template.table_cells(page_tbl), page_items,
+                        barcode_images, plan, next_shape_id, pictures
+                    )
+                    last_page = (page_key, page_elements)
+                writer.write_page(page_elements)
+            
+            if reused_pages:
+                logger.info("WordService", f"동일 페이지 재사용: {reused_pages}/{writer.pages_written}페이지")
+            
+            writer.close()
+            
+            print(f"통합 라벨 문서 저장 완료: {filename}")
+            print(f"총 {items.label_count}개 라벨이 {writer.pages_written}페이지에 생성됨 (스트리밍)")
+            template_cache.log_stats("WordService")
+            return 1
+            
+        except Exception as e:
+            writer.abort()
+            print(f"통합 문서 생성 실패: {e}")
+            logger.error("WordService", f"스트리밍 통합 문서 생성 실패: {e}")
+            return 0
 
     def get_cell_size_mm(self, template: str) -> Tuple[float, float]:
         """
@@ -328,7 +934,13 @@ class WordService:
         - 행 높이는 각 <w:trPr>/<w:trHeight w:val="..."/> 값을 우선으로 시도합니다.
           없을 경우 모든 행의 trHeight 평균값을 시도합니다.
         - OOXML 문서에 따라 단위/속성 위치가 다를 수 있으므로 여러 속성명을 시도합니다.
+        - 평소에는 같은 방식으로 계산해 저장해 둔 템플릿 색인(template_index)을 사용합니다.
         """
+        try:
+            return template_index.get(template).cell_size_mm
+        except Exception as e:
+            logger.warning("WordService", f"템플릿 색인 조회 실패, 문서 직접 분석: {e}")
+        
         try:
             document = Document(template)
             if not document.tables:
@@ -406,4 +1018,22 @@ class WordService:
 
         except Exception as e:
             print(f"get_cell_size_mm error: {e}")
-            return (0.0, 0.0)
\ No newline at end of file
+            return (0.0, 0.0)
+
+
+def _create_pages_worker(job) -> List[bool]:
+    """프로세스 풀 작업 함수: 페이지 묶음 생성 (pickle 가능하도록 모듈 최상위에 정의)"""
+    config, pages, images, output_dir = job
+    service = WordService(config["template_file"])
+    for key, value in config.items():
+        setattr(service, key, value)
+    
+    barcode_images = {
+        code: data if isinstance(data, str) else BytesIO(data)
+        for code, data in images.items()
+    }
+    page_memo = {}
+    return [
+        service.create_label_page(page_items, page_name, barcode_images, output_dir, page_memo)
+        for page_items, page_name in pages
+    ]
@@ -0,0 +1,227 @@
+import posixpath
+import zipfile
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from lxml import etree
+
+from src.services.log_service import logger
+
+_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _column_index(ref: str) -> Optional[int]:
+    """셀 참조(예: 'C5')의 0부터 시작하는 열 번호"""
+    return _column_letters_index(ref.rstrip("0123456789")) if ref else None
+
+
+@lru_cache(maxsize=1024)
+def _column_letters_index(letters: str) -> Optional[int]:
+    if not letters or not letters.isalpha():
+        return None
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - 64)
+    return index - 1
+
+
+def _number(text: str):
+    """숫자 셀 값 변환 (openpyxl과 같은 규칙: 소수점/지수 표기가 있으면 float, 아니면 int)"""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+class XlsxReader:
+    """zipfile + iterparse 기반 xlsx 읽기 전용 리더
+
+    셀 객체를 만들지 않고 시트 XML을 행 단위로 읽어 값 튜플을 차례로 내보내며,
+    읽은 행 요소는 바로 지우므로 메모리 사용량이 행 수와 거의 무관하다.
+    (수식은 저장된 계산 결과 값, 날짜 서식은 변환하지 않고 숫자로 반환,
+    ISO 날짜 셀(t="d")과 해석할 수 없는 값은 원래 문자열로 반환)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        self._active_sheet: Optional[str] = None
+        self._sheets = self._read_sheet_paths()
+        if not self._sheets:
+            self._zip.close()
+            raise ValueError("시트 목록을 읽을 수 없습니다 (지원하지 않는 xlsx 형식)")
+        self._shared_strings: Optional[List[str]] = None
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return list(self._sheets)
+
+    @property
+    def active_sheetname(self) -> str:
+        """통합 문서의 활성 시트 이름 (openpyxl wb.active와 같은 시트)"""
+        if self._active_sheet in self._sheets:
+            return self._active_sheet
+        return self.sheetnames[0]
+
+    def _read_sheet_paths(self) -> Dict[str, str]:
+        """시트 이름 → zip 내부 경로 (통합 문서 순서), 활성 시트 이름도 함께 기록"""
+        rels = etree.fromstring(self._zip.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                target = target[1:]
+            else:
+                target = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = target
+
+        workbook = etree.fromstring(self._zip.read("xl/workbook.xml"))
+        sheets = {}
+        names = []
+        for sheet in workbook.iter(f"{_NS}sheet"):
+            names.append(sheet.get("name"))
+            target = targets.get(sheet.get(f"{_REL_NS}id"))
+            if target:
+                sheets[sheet.get("name")] = target
+
+        # bookViews/workbookView@activeTab: 통합 문서 순서상 활성 시트 번호 (없으면 0)
+        view = workbook.find(f"{_NS}bookViews/{_NS}workbookView")
+        try:
+            active_tab = int(view.get("activeTab", 0)) if view is not None else 0
+        except ValueError:
+            active_tab = 0
+        if 0 <= active_tab < len(names):
+            self._active_sheet = names[active_tab]
+        return sheets
+
+    def _load_shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            strings = []
+            try:
+                with self._zip.open("xl/sharedStrings.xml") as f:
+                    for _, si in etree.iterparse(f, tag=f"{_NS}si"):
+                        # 서식 있는 텍스트(r/t 여러 개)는 이어 붙임 (발음 표기 rPh 제외)
+                        strings.append(
+                            "".join(
+                                t.text or ""
+                                for t in si.iter(f"{_NS}t")
+                                if t.getparent().tag != f"{_NS}rPh"
+                            )
+                        )
+                        si.clear()
+            except KeyError:
+                pass  # 공유 문자열이 없는 통합 문서
+            self._shared_strings = strings
+        return self._shared_strings
+
+    def _cell_value(self, cell):
+        cell_type = cell.get("t", "n")
+        if cell_type == "inlineStr":
+            return "".join(t.text or "" for t in cell.iter(f"{_NS}t"))
+
+        v = cell.find(f"{_NS}v")
+        if v is None or v.text is None:
+            return None
+        text = v.text
+        if cell_type in ("str", "e", "d"):
+            # d: ISO 8601 날짜 문자열 (변환하지 않음)
+            return text
+        if cell_type == "b":
+            return text == "1"
+        try:
+            if cell_type == "s":
+                return self._load_shared_strings()[int(text)]
+            return _number(text)
+        except (ValueError, IndexError):
+            # 해석할 수 없는 값 하나 때문에 시트 전체 읽기를 중단하지 않음
+            return text
+
+    def iter_rows(self, sheet_name: str, min_row: int = 1) -> Iterator[Tuple]:
+        """시트의 행 값 튜플을 순서대로 반환 (빈 행은 건너뜀, 행마다 길이가 다를 수 있음)"""
+        if sheet_name not in self._sheets:
+            raise KeyError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        row_number = 0
+        with self._zip.open(self._sheets[sheet_name]) as f:
+            for _, row in etree.iterparse(f, tag=f"{_NS}row"):
+                row_number = int(row.get("r") or row_number + 1)
+                if row_number >= min_row:
+                    values = []
+                    for cell in row.iter(f"{_NS}c"):
+                        column = _column_index(cell.get("r"))
+                        if column is None:
+                            column = len(values)
+                        if column > len(values):
+                            values.extend([None] * (column - len(values)))
+                        values.append(self._cell_value(cell))
+                    if values:
+                        yield tuple(values)
+                # 처리한 행과 이전 형제 요소 해제
+                row.clear()
+                parent = row.getparent()
+                while row.getprevious() is not None:
+                    del parent[0]
+
+
+def iter_sheet_rows(
+    path: str, sheet_name: Optional[str] = None, min_row: int = 1, width: int = 0
+) -> Iterator[Tuple]:
+    """xlsx 시트 행 값을 스트리밍으로 읽기 (sheet_name이 없으면 활성 시트)
+
+    빠른 iterparse 리더를 먼저 쓰고, 지원하지 않는 형식이면 openpyxl 읽기 전용
+    모드로 읽는다. width를 주면 짧은 행은 None으로 채워 최소 width 길이로 맞춘다.
+    """
+    try:
+        reader = XlsxReader(path)
+    except Exception as e:
+        logger.warning("XlsxReader", f"빠른 읽기 실패, openpyxl 읽기 전용 모드 사용: {e}")
+        yield from _pad_rows(_iter_rows_openpyxl(path, sheet_name, min_row), width)
+        return
+
+    with reader:
+        name = sheet_name if sheet_name is not None else reader.active_sheetname
+        yield from _pad_rows(reader.iter_rows(name, min_row), width)
+
+
+def _pad_rows(rows: Iterator[Tuple], width: int) -> Iterator[Tuple]:
+    for row in rows:
+        if len(row) < width:
+            row = tuple(row) + (None,) * (width - len(row))
+        yield row
+
+
+def _iter_rows_openpyxl(path: str, sheet_name: Optional[str], min_row: int) -> Iterator[Tuple]:
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name] if sheet_name is not None else wb.active
+        for row in ws.iter_rows(min_row=min_row, values_only=True):
+            if any(value is not None for value in row):
+                yield row
+    finally:
+        wb.close()
+
+
+def sheet_names(path: str) -> List[str]:
+    """xlsx 통합 문서의 시트 이름 목록"""
+    try:
+        with XlsxReader(path) as reader:
+            return reader.sheetnames
+    except Exception:
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True)
+        try:
+            return list(wb.sheetnames)
+        finally:
+            wb.close()
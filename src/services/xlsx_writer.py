@@ -0,0 +1,142 @@
+import re
+from typing import Iterable, List, Sequence, Tuple
+from xml.sax.saxutils import escape, quoteattr
+from zipfile import ZIP_DEFLATED, ZipFile
+
+# (시트 이름, 머리글, 데이터 행)
+SheetData = Tuple[str, Sequence[str], Iterable[Sequence]]
+
+_XML_DECL = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PKG_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_CT_PREFIX = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+
+# XML에 쓸 수 없는 제어 문자 (탭, 줄바꿈 제외)
+_ILLEGAL_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+# 기본 글꼴(openpyxl 기본값과 같은 Calibri 11)과 머리글용 굵은 글꼴 스타일
+_STYLES_XML = (
+    f'<styleSheet xmlns="{_MAIN_NS}">'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/><family val="2"/><scheme val="minor"/></font>'
+    '</fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_HEADER_STYLE = 1
+
+
+def _column_letter(index: int) -> str:
+    """0부터 시작하는 열 번호를 열 문자(A, B, ..., AA)로 변환"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_xml(ref: str, value, style: int = 0) -> str:
+    """셀 하나의 XML (None은 빈 셀이므로 기록하지 않음)"""
+    if value is None:
+        return ""
+    style_attr = f' s="{style}"' if style else ""
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"{style_attr}><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)):
+        return f'<c r="{ref}"{style_attr}><v>{value!r}</v></c>'
+    text = escape(_ILLEGAL_CHARS.sub("", str(value)))
+    return (
+        f'<c r="{ref}" t="inlineStr"{style_attr}>'
+        f'<is><t xml:space="preserve">{text}</t></is></c>'
+    )
+
+
+def _write_sheet(package: ZipFile, member: str, header: Sequence[str], rows: Iterable[Sequence]):
+    """시트 XML을 행 단위로 zip 항목에 바로 기록 (행을 메모리에 모으지 않음)"""
+    columns: List[str] = [_column_letter(i) for i in range(len(header))]
+    with package.open(member, "w", force_zip64=True) as stream:
+        stream.write(_XML_DECL)
+        stream.write(f'<worksheet xmlns="{_MAIN_NS}"><sheetData>'.encode("utf-8"))
+        cells = "".join(
+            _cell_xml(f"{column}1", value, _HEADER_STYLE)
+            for column, value in zip(columns, header)
+        )
+        stream.write(f'<row r="1">{cells}</row>'.encode("utf-8"))
+
+        row_number = 1
+        for row in rows:
+            row_number += 1
+            if len(row) > len(columns):
+                columns.extend(_column_letter(i) for i in range(len(columns), len(row)))
+            cells = "".join(
+                _cell_xml(f"{column}{row_number}", value)
+                for column, value in zip(columns, row)
+            )
+            stream.write(f'<row r="{row_number}">{cells}</row>'.encode("utf-8"))
+        stream.write(b"</sheetData></worksheet>")
+
+
+def write_xlsx(path: str, sheets: List[SheetData]):
+    """시트 목록으로 새 xlsx 파일 작성 (머리글은 굵게, 문자열은 인라인 문자열로 기록)
+
+    openpyxl처럼 셀 객체를 만들지 않고 행마다 XML 문자열을 zip에 바로 쓰므로
+    메모리 사용량이 행 수와 관계없이 일정하다.
+    """
+    with ZipFile(path, "w", compression=ZIP_DEFLATED, allowZip64=True) as package:
+        overrides = "".join(
+            f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+            f'ContentType="{_CT_PREFIX}.worksheet+xml"/>'
+            for i in range(1, len(sheets) + 1)
+        )
+        package.writestr(
+            "[Content_Types].xml",
+            _XML_DECL.decode("utf-8")
+            + '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'<Override PartName="/xl/workbook.xml" ContentType="{_CT_PREFIX}.sheet.main+xml"/>'
+            f'<Override PartName="/xl/styles.xml" ContentType="{_CT_PREFIX}.styles+xml"/>'
+            f"{overrides}</Types>",
+        )
+        package.writestr(
+            "_rels/.rels",
+            _XML_DECL.decode("utf-8")
+            + f'<Relationships xmlns="{_PKG_REL_NS}">'
+            f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+            "</Relationships>",
+        )
+
+        sheet_entries = "".join(
+            f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+            for i, (name, _, _) in enumerate(sheets, 1)
+        )
+        package.writestr(
+            "xl/workbook.xml",
+            _XML_DECL.decode("utf-8")
+            + f'<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+            f"<sheets>{sheet_entries}</sheets></workbook>",
+        )
+        sheet_rels = "".join(
+            f'<Relationship Id="rId{i}" Type="{_REL_NS}/worksheet" Target="worksheets/sheet{i}.xml"/>'
+            for i in range(1, len(sheets) + 1)
+        )
+        package.writestr(
+            "xl/_rels/workbook.xml.rels",
+            _XML_DECL.decode("utf-8")
+            + f'<Relationships xmlns="{_PKG_REL_NS}">{sheet_rels}'
+            f'<Relationship Id="rId{len(sheets) + 1}" Type="{_REL_NS}/styles" Target="styles.xml"/>'
+            "</Relationships>",
+        )
+        package.writestr("xl/styles.xml", _XML_DECL.decode("utf-8") + _STYLES_XML)
+
+        for i, (_, header, rows) in enumerate(sheets, 1):
+            _write_sheet(package, f"xl/worksheets/sheet{i}.xml", header, rows)
@@ -63,36 +63,61 @@ class WorkerThread(QThread):
                     logger.info("WorkerThread", f"셀 크기 기반 바코드 크기 설정: {barcode_w_mm:.1f}mm x {barcode_h_mm:.1f}mm")
                     
                     # 바코드 생성기 옵션에도 크기 설정
+                    barcode_options = self.settings.get('barcode_options', {})
                     barcode_generator_options = {
-                        "module_width": 0.35,
+                        "module_width": barcode_options.get('module_width', 0.35),
                         "module_height": barcode_h_mm,
                         "quiet_zone": 3.0,
                         "text_distance": 5.0,
                         "font_size": 10,
-                        "dpi": 300,
+                        "dpi": barcode_options.get('dpi', 300),
                     }
+                    if self.settings.get('fit_barcodes', False):
+                        # 목표 크기와 프린터 DPI로 정확한 픽셀 크기에 맞춰 렌더링 → Word 재조정 없음
+                        barcode_generator_options["target_width"] = barcode_w_mm
+                        barcode_generator_options["target_height"] = barcode_h_mm
 
-            items_to_generate = []
-            for product in self.products:
-                quantity = self.settings['quantities'].get(product.barcode_num, 1)
-                for _ in range(quantity):
-                    items_to_generate.append(product)
+            # (상품, 출력 개수) 구간으로 전달 - 라벨은 Word 셀을 채울 때 펼침
+            product_counts = [
+                (product, self.settings['quantities'].get(product.barcode_num, 1))
+                for product in self.products
+            ]
 
-            logger.info("WorkerThread", f"생성할 아이템 수: {len(items_to_generate)}")
-            items = self.excel_service.generate_barcode_numbers(items_to_generate)
+            logger.info("WorkerThread", f"생성할 아이템 수: {sum(count for _, count in product_counts)}")
+            items = self.excel_service.generate_label_runs(product_counts)
             self.progress_updated.emit(30)
             
-            self.status_updated.emit("바코드 이미지 생성 중...")
-            # 메모리 기반 바코드 생성 사용
-            barcode_generator = BarcodeGenerator(barcode_generator_options)
-            barcode_images = barcode_generator.generate_barcodes_for_products(items)
+            if self.settings.get('vector_barcodes', False):
+                # 벡터 바코드는 Word 도형으로 직접 그리므로 이미지 생성 생략
+                self.word_service.set_barcode_mode(
+                    "vector", self.settings.get('vector_fallback', False)
+                )
+                barcode_images = {}
+            else:
+                self.word_service.set_barcode_mode("image")
+                self.status_updated.emit("바코드 이미지 생성 중...")
+                # 메모리 기반 바코드 생성 사용
+                barcode_generator_options["parallel"] = self.settings.get('parallel', False)
+                barcode_generator = BarcodeGenerator(barcode_generator_options)
+                barcode_images = barcode_generator.generate_barcodes_for_products(items)
             self.progress_updated.emit(60)
             
             self.status_updated.emit("Word 문서 생성 중...")
             self.word_service.template_file = self.settings['template']
+            self.word_service.set_parallel(self.settings.get('parallel', False))
+            self.word_service.set_packing(
+                self.settings.get('pack_products', False),
+                self.settings.get('product_gap', 0),
+            )
+            
+            # 생성 전에 시트 수 안내
+            single_file = self.settings.get('single_file', False)
+            sheet_count = self.word_service.count_label_sheets(items, single_file)
+            logger.info("WorkerThread", f"생성할 라벨 시트 수: {sheet_count}장")
+            self.status_updated.emit(f"라벨 시트 {sheet_count}장 생성 예정")
             
             # 단일 파일 생성 여부 확인
-            if self.settings.get('single_file', False):
+            if single_file:
                 self.status_updated.emit(f"통합 문서 생성 중... ({len(items)}개 라벨)")
                 files_created = self.word_service.generate_single_label_document(items, barcode_images)
             else:
@@ -375,7 +400,7 @@ class MainWindow(QMainWindow):
             if self.excel_service.add_product(product):
                 self.products = self.excel_service.read_products()
                 self.update_products_table()
-                self.log_message(f"상품 추가 및 Excel 저장 완료: {product.name}")
+                self.log_message(f"상품 추가 완료 (Excel 저장 대기 중): {product.name}")
             else:
                 self.log_message(f"상품 추가 실패: {product.name}", "error")
         except Exception as e:
@@ -406,7 +431,7 @@ class MainWindow(QMainWindow):
             if self.excel_service.update_product(old_product, updated_product):
                 self.products = self.excel_service.read_products()
                 self.update_products_table()
-                self.log_message(f"상품 수정 및 Excel 저장 완료: {updated_product.name}")
+                self.log_message(f"상품 수정 완료 (Excel 저장 대기 중): {updated_product.name}")
             else:
                 self.log_message(f"상품 수정 실패: {updated_product.name}", "error")
             
@@ -429,7 +454,7 @@ class MainWindow(QMainWindow):
                     if product in self.selected_products:
                         self.selected_products.remove(product)
                     self.update_products_table()
-                    self.log_message(f"상품 삭제 및 Excel 저장 완료: {product.name}")
+                    self.log_message(f"상품 삭제 완료 (Excel 저장 대기 중): {product.name}")
                 else:
                     self.log_message(f"상품 삭제 실패: {product.name}", "error")
             except Exception as e:
@@ -471,6 +496,10 @@ class MainWindow(QMainWindow):
                 products = temp_excel_service.read_products()
                 
                 if products or categories:
+                    # 기존 파일의 저장 대기 중인 변경 사항 먼저 저장 (취소하면 파일을 바꾸지 않음)
+                    if not self._commit_catalog():
+                        self.log_message("Excel 파일 불러오기를 취소했습니다.", "warning")
+                        return
                     self.excel_service = temp_excel_service
                     # ProductWidget에 새로운 ExcelService 설정
                     self.product_widget.set_excel_service(self.excel_service)
@@ -654,6 +683,10 @@ class MainWindow(QMainWindow):
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             
             if reply == QMessageBox.StandardButton.Yes:
+                if not self._commit_catalog():
+                    logger.info("MainWindow", "Excel 저장 실패로 사용자가 종료를 취소함")
+                    event.ignore()
+                    return
                 logger.info("MainWindow", "사용자가 강제 종료를 선택함")
                 self.worker_thread.terminate()
                 self.worker_thread.wait()
@@ -663,8 +696,39 @@ class MainWindow(QMainWindow):
                 logger.info("MainWindow", "사용자가 종료를 취소함")
                 event.ignore()
         else:
+            if not self._commit_catalog():
+                logger.info("MainWindow", "Excel 저장 실패로 사용자가 종료를 취소함")
+                event.ignore()
+                return
             logger.info("MainWindow", "애플리케이션 정상 종료")
             event.accept()
+    
+    def _commit_catalog(self) -> bool:
+        """저장 대기 중인 상품/종류 변경 사항을 Excel 파일에 바로 저장
+
+        저장에 실패하면 다시 시도/변경 사항 버리기/취소를 묻는다. 저장했거나 사용자가
+        버리기를 선택하면 True, 취소하면 False를 반환한다.
+        """
+        if not self.excel_service:
+            return True
+        while not self.excel_service.commit():
+            logger.error("MainWindow", "Excel 저장 실패")
+            reply = QMessageBox.warning(
+                self, "저장 실패",
+                f"상품 변경 사항을 Excel 파일에 저장하지 못했습니다.\n"
+                f"({self.excel_service.file_path})\n\n"
+                "파일이 다른 프로그램에서 열려 있다면 닫은 뒤 다시 시도하세요.",
+                QMessageBox.StandardButton.Retry
+                | QMessageBox.StandardButton.Discard
+                | QMessageBox.StandardButton.Cancel,
+                QMessageBox.StandardButton.Retry,
+            )
+            if reply == QMessageBox.StandardButton.Discard:
+                logger.warning("MainWindow", "사용자가 저장되지 않은 변경 사항을 버림")
+                return True
+            if reply != QMessageBox.StandardButton.Retry:
+                return False
+        return True
 
     def setup_connections(self):
         """시그널 연결"""
@@ -783,6 +847,12 @@ class MainWindow(QMainWindow):
         dialog.categories_updated.connect(self._on_categories_updated)
         dialog.exec()
 
+    def _reload_products_keep_selection(self):
+        """저장 결과(바코드 번호 재계산 반영)로 상품 목록을 다시 읽고 선택 상태는 위치 기준으로 유지"""
+        selected_rows = [i for i, p in enumerate(self.products) if p in self.selected_products]
+        self.products = self.excel_service.read_products()
+        self.selected_products = [self.products[i] for i in selected_rows if i < len(self.products)]
+
     def _on_categories_updated(self):
         """종류 변경 시 UI 업데이트"""
         self.log_message("종류 목록이 변경되어 데이터를 새로고침합니다.")
@@ -844,6 +914,7 @@ class MainWindow(QMainWindow):
                     product.product_id = new_id
 
                     if self.excel_service and self.excel_service.save_products(self.products, self.data_path):
+                        self._reload_products_keep_selection()
                         self.update_products_table()
                         self.log_message(f"제품ID 교환 완료: {product.name}({current}→{new_id}) <-> {existing.name}({existing_id}→{current})", "success")
                         QMessageBox.information(self, "완료", "제품ID가 교환되어 저장되었습니다.")
@@ -864,6 +935,7 @@ class MainWindow(QMainWindow):
             product.product_id = new_id
             try:
                 if self.excel_service and self.excel_service.save_products(self.products, self.data_path):
+                    self._reload_products_keep_selection()
                     self.update_products_table()
                     self.log_message(f"제품ID 변경 완료: {product.name} ({old_id} → {new_id})", "success")
                     QMessageBox.information(self, "완료", "제품ID가 변경되어 저장되었습니다.")
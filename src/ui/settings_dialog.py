@@ -127,6 +127,66 @@ class SettingsDialog(QDialog):
         self.single_file_info.setVisible(False)
         output_layout.addRow(self.single_file_info)
 
+        # 여러 상품을 한 시트에 이어서 배치
+        self.pack_products_checkbox = QCheckBox("여러 상품을 한 시트에 이어서 배치")
+        self.pack_products_checkbox.setToolTip(
+            "체크하면 상품이 바뀌어도 새 시트를 시작하지 않고 빈 칸부터 이어서 채웁니다.\n"
+            + "소량 상품이 많은 주문에서 시트 수와 파일 수가 줄어듭니다."
+        )
+        self.pack_products_checkbox.setChecked(False)
+        output_layout.addRow("시트 배치:", self.pack_products_checkbox)
+
+        # 상품 사이 빈 칸 수
+        self.product_gap_spin = QSpinBox()
+        self.product_gap_spin.setRange(0, 20)
+        self.product_gap_spin.setValue(0)
+        self.product_gap_spin.setToolTip(
+            "상품이 바뀌는 곳에 비워 둘 라벨 칸 수 (0-20칸)\n"
+            + "상품별로 라벨을 잘라 나누기 쉽게 합니다."
+        )
+        output_layout.addRow("상품 사이 빈 칸:", self.product_gap_spin)
+        # 빈 칸은 묶음 배치에서만 적용되므로 체크했을 때만 편집 가능
+        self.product_gap_spin.setEnabled(False)
+        self.pack_products_checkbox.toggled.connect(self.product_gap_spin.setEnabled)
+
+        # 바코드 출력 방식 (벡터 도형)
+        self.vector_barcode_checkbox = QCheckBox("벡터 바코드로 생성")
+        self.vector_barcode_checkbox.setToolTip(
+            "체크하면 바코드를 이미지 대신 Word 도형(벡터)으로 그립니다.\n"
+            + "파일 크기가 작아지고 프린터 해상도와 관계없이 선명하게 인쇄됩니다."
+        )
+        self.vector_barcode_checkbox.setChecked(False)
+        output_layout.addRow("바코드 형식:", self.vector_barcode_checkbox)
+
+        self.vector_fallback_checkbox = QCheckBox("호환용 대체 이미지 포함")
+        self.vector_fallback_checkbox.setToolTip(
+            "체크하면 Word 도형을 표시하지 못하는 프로그램용으로 바코드 이미지를 함께 넣습니다.\n"
+            + "바코드마다 이미지가 하나씩 추가되어 파일이 커지고 생성이 느려집니다."
+        )
+        self.vector_fallback_checkbox.setChecked(False)
+        output_layout.addRow("", self.vector_fallback_checkbox)
+        # 대체 이미지는 벡터 바코드에서만 의미가 있으므로 체크했을 때만 편집 가능
+        self.vector_fallback_checkbox.setEnabled(False)
+        self.vector_barcode_checkbox.toggled.connect(self.vector_fallback_checkbox.setEnabled)
+
+        # 셀 크기에 맞춘 래스터 렌더링
+        self.fit_barcode_checkbox = QCheckBox("라벨 셀 크기에 맞춰 바코드 이미지 생성")
+        self.fit_barcode_checkbox.setToolTip(
+            "체크하면 바코드 이미지를 셀에 들어갈 크기 그대로 프린터 DPI에 맞춰 그립니다.\n"
+            + "작은 셀에서는 모듈 너비가 설정값보다 줄어들 수 있으며, 이 경우 로그에 경고가 남습니다."
+        )
+        self.fit_barcode_checkbox.setChecked(False)
+        output_layout.addRow("이미지 크기:", self.fit_barcode_checkbox)
+
+        # 병렬 처리 (멀티코어)
+        self.parallel_checkbox = QCheckBox("여러 CPU 코어로 병렬 생성")
+        self.parallel_checkbox.setToolTip(
+            "체크하면 바코드 이미지와 개별 Word 문서를 여러 프로세스에서 나눠 생성합니다.\n"
+            + "상품 수가 많은 작업에서 빨라집니다."
+        )
+        self.parallel_checkbox.setChecked(False)
+        output_layout.addRow("처리 방식:", self.parallel_checkbox)
+
         output_group.setLayout(output_layout)
         layout.addWidget(output_group)
 
@@ -447,4 +507,13 @@ class SettingsDialog(QDialog):
             "barcode_options": barcode_options,
             "max_label_count": self.template_max_label.text(),
             "single_file": self.single_file_checkbox.isChecked(),
+            "vector_barcodes": self.vector_barcode_checkbox.isChecked(),
+            "vector_fallback": (
+                self.vector_barcode_checkbox.isChecked()
+                and self.vector_fallback_checkbox.isChecked()
+            ),
+            "fit_barcodes": self.fit_barcode_checkbox.isChecked(),
+            "parallel": self.parallel_checkbox.isChecked(),
+            "pack_products": self.pack_products_checkbox.isChecked(),
+            "product_gap": self.product_gap_spin.value() if self.pack_products_checkbox.isChecked() else 0,
         }
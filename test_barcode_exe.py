@@ -34,12 +34,16 @@ def test_barcode_generation():
         
         print(f"생성된 바코드 파일 수: {len(generated_files)}")
         
-        for code, filepath in generated_files.items():
-            if os.path.exists(filepath):
-                file_size = os.path.getsize(filepath)
-                print(f"✓ {code}: {filepath} ({file_size} bytes)")
+        for code, img_buffer in generated_files.items():
+            data_size = len(img_buffer.getvalue())
+            if data_size > 0:
+                print(f"✓ {code}: 저장소 ({data_size} bytes)")
             else:
-                print(f"✗ {code}: 파일이 생성되지 않음 - {filepath}")
+                print(f"✗ {code}: 바코드가 생성되지 않음")
+
+        # 재시작 후에도 저장소에서 바로 읽히는지 확인
+        reopened = BarcodeFileGenerator("test_barcodes")
+        print(f"저장소 항목 수 (재시작 후): {len(reopened.store)}")
         
         # 정리
         barcode_generator.cleanup()